@@ -0,0 +1,10 @@
+"""
+Let's Do. | SignIT – Benchmarks.
+
+Misst den Signer ohne echtes Zertifikat und ohne Netzwerk: ein
+nachgebautes signtool (``fake_signtool.py``) und ein lokaler
+Timestamp-Server (``fake_tsa.py``) ersetzen die echten Gegenstücke,
+``run.py`` führt die Szenarien aus.
+
+    python -m benchmarks.run --help
+"""
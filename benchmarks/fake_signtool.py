@@ -0,0 +1,140 @@
+"""
+Let's Do. | SignIT – Nachgebautes signtool.exe für Benchmarks.
+
+Versteht ``sign`` und ``timestamp`` mit den Argumenten, die
+``core.signer`` übergibt, verändert aber keine Dateien. Ausgabe und
+Exit-Code entsprechen signtool ("Successfully signed: ...",
+"SignTool Error: ...", "Number of errors: ..."), sodass Zuordnung und
+Fehlerklassifizierung des Signers unverändert greifen. Mit ``/tr`` wird
+für jede Datei eine Anfrage an den Timestamp-Server gestellt (siehe
+``fake_tsa.py``).
+
+Einstellungen über Umgebungsvariablen:
+    FAKE_SIGNTOOL_LATENCY         Sekunden pro Aufruf (Standard: 0)
+    FAKE_SIGNTOOL_FILE_LATENCY    Sekunden pro Datei (Standard: 0)
+    FAKE_SIGNTOOL_OUTPUT_LINES    zusätzliche Ausgabezeilen pro Datei (Standard: 0)
+    FAKE_SIGNTOOL_FAILURE_RATE    Anteil vorübergehend gesperrter Dateien
+                                  (0.0 – 1.0, Standard: 0)
+    FAKE_SIGNTOOL_SEED            Startwert für den Zufallsgenerator
+                                  (wird mit der Prozess-ID gemischt)
+
+Importiert bewusst nichts aus ``core``: der Start soll so billig sein
+wie möglich, gemessen wird der Signer.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+# Flags mit Wert bzw. ohne Wert; alle übrigen Argumente sind Dateien
+_VALUE_FLAGS = {"/sha1", "/tr", "/td", "/fd", "/f", "/p", "/n", "/t", "/d", "/du"}
+_SWITCHES = {"/sm", "/a", "/as", "/v", "/q", "/debug", "/ph", "/uw"}
+
+TIMESTAMP_ERROR = (
+    "SignTool Error: The specified timestamp server either could not be "
+    "reached or returned an invalid response."
+)
+FILE_IN_USE_ERROR = (
+    "SignTool Error: The process cannot access the file because it is "
+    "being used by another process."
+)
+
+# Lokaler Server: Proxy-Einstellungen der Umgebung ignorieren
+_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+
+def _env_float(name: str, default: float = 0.0) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def parse_args(argv: List[str]) -> Tuple[str, Dict[str, str], List[str]]:
+    """Zerlegt die Kommandozeile in (Befehl, Flags, Dateien)."""
+    if not argv:
+        return "", {}, []
+    command, rest = argv[0].lower(), argv[1:]
+    flags: Dict[str, str] = {}
+    files: List[str] = []
+    i = 0
+    while i < len(rest):
+        arg = rest[i]
+        if arg.lower() in _VALUE_FLAGS and i + 1 < len(rest):
+            flags[arg.lower()] = rest[i + 1]
+            i += 2
+        elif arg.lower() in _SWITCHES:
+            flags[arg.lower()] = ""
+            i += 1
+        else:
+            files.append(arg)
+            i += 1
+    return command, flags, files
+
+
+def request_timestamp(url: str, file_path: str) -> bool:
+    """Fragt einen Zeitstempel an; False bei Fehler oder HTTP-Status != 200."""
+    body = os.path.basename(file_path).encode("utf-8", "replace")
+    request = urllib.request.Request(
+        url,
+        data=body,
+        headers={"Content-Type": "application/timestamp-query"},
+    )
+    try:
+        with _OPENER.open(request, timeout=30) as response:
+            response.read()
+            return response.status == 200
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    command, flags, files = parse_args(sys.argv[1:] if argv is None else argv)
+    if command not in ("sign", "timestamp") or not files:
+        print("SignTool Error: A required parameter is missing.", file=sys.stderr)
+        return 1
+
+    latency = _env_float("FAKE_SIGNTOOL_LATENCY")
+    file_latency = _env_float("FAKE_SIGNTOOL_FILE_LATENCY")
+    output_lines = int(_env_float("FAKE_SIGNTOOL_OUTPUT_LINES"))
+    failure_rate = _env_float("FAKE_SIGNTOOL_FAILURE_RATE")
+    seed = os.environ.get("FAKE_SIGNTOOL_SEED")
+    # Pro Prozess variieren, damit Wiederholungen nicht immer gleich ausgehen
+    rng = random.Random(f"{seed}:{os.getpid()}:{time.monotonic_ns()}")
+
+    if latency:
+        time.sleep(latency)
+    if command == "sign":
+        print("Done Adding Additional Store")
+
+    verb = "signed" if command == "sign" else "timestamped"
+    url = flags.get("/tr")
+    errors = 0
+    for file_path in files:
+        if file_latency:
+            time.sleep(file_latency)
+        for n in range(output_lines):
+            print(f"  {verb.capitalize()} {file_path}: detail {n + 1}")
+
+        if command == "sign" and failure_rate and rng.random() < failure_rate:
+            print(f"{FILE_IN_USE_ERROR} {file_path}", file=sys.stderr)
+            errors += 1
+            continue
+        if url and not request_timestamp(url, file_path):
+            print(f"{TIMESTAMP_ERROR} {file_path}", file=sys.stderr)
+            errors += 1
+            continue
+        print(f"Successfully {verb}: {file_path}")
+
+    print(f"Number of errors: {errors}", file=sys.stderr if errors else sys.stdout)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
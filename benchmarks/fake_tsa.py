@@ -0,0 +1,136 @@
+"""
+Let's Do. | SignIT – Lokaler Timestamp-Server für Benchmarks.
+
+Beantwortet POST-Anfragen nach einer einstellbaren Verzögerung mit
+HTTP 200 oder – mit ``failure_rate`` – mit HTTP 503. Der Inhalt ist
+kein echtes RFC-3161-Token; ``fake_signtool.py`` prüft nur den Status.
+
+Verwendung:
+    with FakeTSA(latency=0.05) as tsa:
+        url = tsa.url
+        ...
+
+    python -m benchmarks.fake_tsa --port 8318 --latency 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        tsa = self.server.tsa
+        ok = tsa._next_ok()
+        if tsa.latency:
+            time.sleep(tsa.latency)
+
+        body = b"fake-timestamp-reply" if ok else b"busy"
+        self.send_response(200 if ok else 503)
+        self.send_header("Content-Type", "application/timestamp-reply")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # keine Ausgabe pro Anfrage
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    tsa: "FakeTSA"
+
+
+class FakeTSA:
+    """HTTP-Timestamp-Server in einem Hintergrund-Thread."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            latency: Verzögerung pro Anfrage in Sekunden
+            failure_rate: Anteil der Anfragen mit HTTP 503 (0.0 – 1.0)
+            seed: Startwert für reproduzierbare Fehler
+            host, port: Adresse (Port 0 = frei wählen)
+        """
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.requests = 0
+        self.failures = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), _Handler)
+        self._server.tsa = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def _next_ok(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            ok = not (self.failure_rate and self._rng.random() < self.failure_rate)
+            if not ok:
+                self.failures += 1
+            return ok
+
+    def serve_forever(self) -> None:
+        """Bedient Anfragen im aufrufenden Thread (bis KeyboardInterrupt)."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def start(self) -> "FakeTSA":
+        """Bedient Anfragen in einem Hintergrund-Thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="signit-fake-tsa", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeTSA":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Lokaler Fake-Timestamp-Server")
+    parser.add_argument("--port", type=int, default=8318)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    tsa = FakeTSA(args.latency, args.failure_rate, port=args.port)
+    print(f"Fake-TSA läuft auf {tsa.url} (Strg+C beendet)")
+    tsa.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
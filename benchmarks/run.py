@@ -0,0 +1,411 @@
+"""
+Let's Do. | SignIT – Benchmark-Szenarien für den Signer.
+
+Signiert 10 bis 10.000 Platzhalterdateien mit ``fake_signtool.py`` gegen
+lokale Fake-Timestamp-Server in verschiedenen Signer-Modi und meldet
+Durchsatz, Latenz pro Datei (p50/p95/p99 von ``SignTimings.total``) und
+den Spitzen-Arbeitsspeicher (RSS). Jedes Szenario läuft in einem eigenen
+Python-Prozess, damit RSS und Thread-Pools sich nicht gegenseitig
+beeinflussen. Läuft ohne Windows, Zertifikat und Netzwerk, z. B. in CI.
+
+Jeder signtool-Aufruf startet einen Python-Interpreter (~0,1–0,2 s);
+die Standardgrößen 10 und 100 laufen daher in wenigen Minuten, 1000 und
+10.000 Dateien sind für gezielte Messungen gedacht.
+
+Verwendung:
+    python -m benchmarks.run
+    python -m benchmarks.run --files 1000,10000 --modes parallel,batch
+    python -m benchmarks.run --json bench.json
+    python -m benchmarks.run --compare bench.json --tolerance 0.25
+
+Exit-Codes:
+    0  alle Szenarien gelaufen (und ggf. keine Regression)
+    1  Regression gegenüber --compare oder Szenario fehlgeschlagen
+    2  ungültige Argumente
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from benchmarks.fake_tsa import FakeTSA
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FAKE_SIGNTOOL = Path(__file__).resolve().parent / "fake_signtool.py"
+
+FAKE_THUMBPRINT = "0" * 40
+DEFAULT_FILES = (10, 100)
+
+# Signer-Einstellungen je Modus
+MODES: Dict[str, Dict[str, object]] = {
+    "sequential": {"max_workers": 1},
+    "parallel": {"max_workers": 8},
+    "batch": {"max_workers": 4, "batch_size": 50},
+    "two-phase": {"max_workers": 8, "two_phase": True, "timestamp_workers": 4},
+    "auto-timestamp": {"max_workers": 8, "auto_timestamp": True},
+}
+
+
+@dataclass
+class Scenario:
+    """Ein Benchmark-Lauf: Modus und Anzahl der Dateien."""
+
+    mode: str
+    files: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.mode}/{self.files}"
+
+
+@dataclass
+class ScenarioResult:
+    """Messwerte eines Szenarios (Zeiten in Sekunden)."""
+
+    name: str
+    mode: str
+    files: int
+    succeeded: int
+    failed: int
+    wall: float
+    files_per_second: float
+    p50: float
+    p95: float
+    p99: float
+    mean_spawn: float
+    mean_queue_wait: float
+    peak_rss_mb: Optional[float]
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Perzentil nach dem Nearest-Rank-Verfahren (``q`` in 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Spitzen-RSS dieses Prozesses in MB (None, wenn nicht ermittelbar)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KiB, macOS: Bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def write_launcher(directory: Path) -> str:
+    """
+    Legt ein ausführbares ``signtool`` an, das fake_signtool.py startet.
+
+    Der Signer ruft signtool direkt per ``subprocess.Popen`` auf; ein
+    Python-Skript ist unter Windows nicht direkt ausführbar.
+    """
+    if os.name == "nt":
+        launcher = directory / "signtool.cmd"
+        launcher.write_text(f'@"{sys.executable}" "{FAKE_SIGNTOOL}" %*\r\n')
+    else:
+        launcher = directory / "signtool"
+        launcher.write_text(
+            f'#!/bin/sh\nexec "{sys.executable}" "{FAKE_SIGNTOOL}" "$@"\n'
+        )
+        launcher.chmod(0o755)
+    return str(launcher)
+
+
+def create_files(directory: Path, count: int, size: int = 1024) -> List[str]:
+    """Legt ``count`` Platzhalterdateien an."""
+    payload = b"MZ" + b"\0" * max(size - 2, 0)
+    paths = []
+    for i in range(count):
+        path = directory / f"file{i:05d}.exe"
+        path.write_bytes(payload)
+        paths.append(str(path))
+    return paths
+
+
+def run_scenario(scenario: Scenario, tsa_urls: List[str]) -> ScenarioResult:
+    """Führt ein Szenario im aktuellen Prozess aus."""
+    from core.retry import RetryPolicy
+    from core.signer import Signer
+    from core.timestamp import TimestampSelector
+
+    settings = dict(MODES[scenario.mode])
+    auto_timestamp = bool(settings.pop("auto_timestamp", False))
+
+    with tempfile.TemporaryDirectory(prefix="signit-bench-") as tmp:
+        directory = Path(tmp)
+        signtool = write_launcher(directory)
+        files = create_files(directory, scenario.files)
+
+        selector = TimestampSelector(tsa_urls) if auto_timestamp else None
+        # Kurze Wartezeiten: gemessen wird der Signer, nicht der Backoff
+        policy = RetryPolicy(default_base_delay=0.05, jitter=0.0)
+        policy.base_delays = {key: 0.05 for key in policy.base_delays}
+        signer = Signer(
+            signtool,
+            timestamp_selector=selector,
+            retry_policy=policy,
+            timestamp_retry_policy=policy,
+            **settings,
+        )
+
+        results = []
+        start = time.monotonic()
+        thread = signer.sign_files(
+            files,
+            FAKE_THUMBPRINT,
+            tsa_urls[0],
+            on_complete=results.extend,
+        )
+        thread.join()
+        wall = time.monotonic() - start
+
+    latencies = [r.timings.total for r in results]
+    succeeded = sum(1 for r in results if r.success)
+    return ScenarioResult(
+        name=scenario.name,
+        mode=scenario.mode,
+        files=scenario.files,
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        wall=wall,
+        files_per_second=len(results) / wall if wall else 0.0,
+        p50=percentile(latencies, 50),
+        p95=percentile(latencies, 95),
+        p99=percentile(latencies, 99),
+        mean_spawn=sum(r.timings.spawn for r in results) / max(len(results), 1),
+        mean_queue_wait=(
+            sum(r.timings.queue_wait for r in results) / max(len(results), 1)
+        ),
+        peak_rss_mb=peak_rss_mb(),
+    )
+
+
+def run_in_subprocess(
+    scenario: Scenario, tsa_urls: List[str], env: Dict[str, str]
+) -> Optional[ScenarioResult]:
+    """Startet ein Szenario in einem eigenen Python-Prozess."""
+    cmd = [
+        sys.executable,
+        "-m",
+        "benchmarks.run",
+        "--child",
+        json.dumps({"scenario": asdict(scenario), "tsa_urls": tsa_urls}),
+    ]
+    proc = subprocess.run(
+        cmd, cwd=REPO_ROOT, env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0 or not proc.stdout.strip():
+        sys.stderr.write(f"{scenario.name}: fehlgeschlagen\n{proc.stderr}\n")
+        return None
+    return ScenarioResult(**json.loads(proc.stdout.strip().splitlines()[-1]))
+
+
+def format_table(results: List[ScenarioResult]) -> str:
+    """Ergebnis-Tabelle für die Konsole."""
+    header = (
+        f"{'Szenario':<22}{'Dateien':>8}{'OK':>7}{'Dauer s':>9}{'Dat./s':>9}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'RSS MB':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        rss = f"{r.peak_rss_mb:.1f}" if r.peak_rss_mb is not None else "–"
+        lines.append(
+            f"{r.name:<22}{r.files:>8}{r.succeeded:>7}{r.wall:>9.2f}"
+            f"{r.files_per_second:>9.1f}{r.p50 * 1000:>9.0f}{r.p95 * 1000:>9.0f}"
+            f"{r.p99 * 1000:>9.0f}{rss:>8}"
+        )
+    return "\n".join(lines)
+
+
+def compare(
+    results: List[ScenarioResult], baseline_path: str, tolerance: float
+) -> List[str]:
+    """
+    Vergleicht mit einer früheren ``--json``-Ausgabe.
+
+    Returns:
+        Beschreibung jeder Regression (Durchsatz kleiner bzw. p95 größer
+        als die Baseline um mehr als ``tolerance``)
+    """
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {entry["name"]: entry for entry in json.load(f)["results"]}
+
+    regressions = []
+    for r in results:
+        base = baseline.get(r.name)
+        if base is None:
+            continue
+        if r.files_per_second < base["files_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{r.name}: Durchsatz {r.files_per_second:.1f}/s "
+                f"(Baseline {base['files_per_second']:.1f}/s)"
+            )
+        if r.p95 > base["p95"] * (1 + tolerance):
+            regressions.append(
+                f"{r.name}: p95 {r.p95 * 1000:.0f} ms "
+                f"(Baseline {base['p95'] * 1000:.0f} ms)"
+            )
+        if r.failed > base["failed"]:
+            regressions.append(
+                f"{r.name}: {r.failed} fehlgeschlagen (Baseline {base['failed']})"
+            )
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Benchmark des Signers mit Fake-signtool und Fake-TSA.",
+    )
+    parser.add_argument(
+        "--files",
+        default=",".join(str(n) for n in DEFAULT_FILES),
+        help="Anzahl Dateien je Szenario, kommagetrennt (Standard: %(default)s)",
+    )
+    parser.add_argument(
+        "--modes",
+        default=",".join(MODES),
+        help="Signer-Modi, kommagetrennt (Standard: %(default)s)",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="signtool: Sekunden pro Aufruf"
+    )
+    parser.add_argument(
+        "--file-latency",
+        type=float,
+        default=0.002,
+        help="signtool: Sekunden pro Datei (Standard: %(default)s)",
+    )
+    parser.add_argument(
+        "--output-lines",
+        type=int,
+        default=0,
+        help="signtool: zusätzliche Ausgabezeilen pro Datei",
+    )
+    parser.add_argument(
+        "--failure-rate",
+        type=float,
+        default=0.0,
+        help="signtool: Anteil vorübergehend gesperrter Dateien (0.0 – 1.0)",
+    )
+    parser.add_argument(
+        "--tsa-latency",
+        type=float,
+        default=0.005,
+        help="Timestamp-Server: Sekunden pro Anfrage (Standard: %(default)s)",
+    )
+    parser.add_argument(
+        "--tsa-failure-rate",
+        type=float,
+        default=0.0,
+        help="Timestamp-Server: Anteil HTTP-503-Antworten (0.0 – 1.0)",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Zufalls-Startwert")
+    parser.add_argument("--json", help="Ergebnisse zusätzlich als JSON schreiben")
+    parser.add_argument("--compare", help="Mit früherer --json-Ausgabe vergleichen")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Erlaubte Verschlechterung für --compare (Standard: %(default)s)",
+    )
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.child:
+        payload = json.loads(args.child)
+        result = run_scenario(Scenario(**payload["scenario"]), payload["tsa_urls"])
+        print(json.dumps(asdict(result)))
+        return 0
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    unknown = [m for m in modes if m not in MODES]
+    if unknown:
+        sys.stderr.write(f"Unbekannte Modi: {', '.join(unknown)}\n")
+        return 2
+    scenarios = [
+        Scenario(mode, int(n)) for n in args.files.split(",") for mode in modes
+    ]
+
+    env = dict(os.environ)
+    env.update(
+        FAKE_SIGNTOOL_LATENCY=str(args.latency),
+        FAKE_SIGNTOOL_FILE_LATENCY=str(args.file_latency),
+        FAKE_SIGNTOOL_OUTPUT_LINES=str(args.output_lines),
+        FAKE_SIGNTOOL_FAILURE_RATE=str(args.failure_rate),
+        FAKE_SIGNTOOL_SEED=str(args.seed),
+        PYTHONPATH=os.pathsep.join(
+            p for p in (str(REPO_ROOT), env.get("PYTHONPATH", "")) if p
+        ),
+    )
+
+    # Drei Server für "auto-timestamp": normal, langsam, unzuverlässig
+    servers = [
+        FakeTSA(args.tsa_latency, args.tsa_failure_rate, seed=args.seed),
+        FakeTSA(args.tsa_latency * 10 + 0.05, args.tsa_failure_rate, seed=args.seed),
+        FakeTSA(args.tsa_latency, max(args.tsa_failure_rate, 0.5), seed=args.seed),
+    ]
+    results: List[ScenarioResult] = []
+    failed_runs = 0
+    try:
+        for server in servers:
+            server.start()
+        urls = [server.url for server in servers]
+        for scenario in scenarios:
+            print(f"… {scenario.name}", file=sys.stderr, flush=True)
+            result = run_in_subprocess(scenario, urls, env)
+            if result is None:
+                failed_runs += 1
+            else:
+                results.append(result)
+    finally:
+        for server in servers:
+            server.stop()
+
+    print(format_table(results))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "settings": {
+                        k: v
+                        for k, v in vars(args).items()
+                        if k not in ("json", "compare", "child")
+                    },
+                    "results": [asdict(r) for r in results],
+                },
+                f,
+                indent=2,
+            )
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 1 if failed_runs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
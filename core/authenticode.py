@@ -0,0 +1,310 @@
+"""
+Let's Do. | SignIT – Authenticode-Erkennung ohne signtool.
+
+Liest PE-Header und das Security-Directory (IMAGE_DIRECTORY_ENTRY_SECURITY)
+mit wenigen kleinen Lesezugriffen, extrahiert den eingebetteten PKCS#7-Blob
+und ermittelt, ob eine Signatur vorhanden ist, den SHA-1-Thumbprint des
+Signers und ob ein Zeitstempel enthalten ist. Reines Python – läuft auch
+unter Linux.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, List, Optional, Tuple
+
+from core import der
+
+IMAGE_DIRECTORY_ENTRY_SECURITY = 4
+WIN_CERT_TYPE_PKCS_SIGNED_DATA = 0x0002
+
+PE32_MAGIC = 0x10B
+PE32_PLUS_MAGIC = 0x20B
+
+# Obergrenze für die Zertifikatstabelle (schützt vor defekten Headern)
+MAX_CERT_TABLE_SIZE = 16 * 1024 * 1024
+
+OID_SIGNED_DATA = "1.2.840.113549.1.7.2"
+OID_COUNTER_SIGNATURE = "1.2.840.113549.1.9.6"
+OID_RFC3161_TIMESTAMP = "1.3.6.1.4.1.311.3.3.1"
+OID_SPC_INDIRECT_DATA = "1.3.6.1.4.1.311.2.1.4"
+
+# hashlib-Namen der Digest-Algorithmen in SpcIndirectDataContent
+DIGEST_ALGORITHMS = {
+    "1.2.840.113549.2.5": "md5",
+    "1.3.14.3.2.26": "sha1",
+    "2.16.840.1.101.3.4.2.1": "sha256",
+    "2.16.840.1.101.3.4.2.2": "sha384",
+    "2.16.840.1.101.3.4.2.3": "sha512",
+}
+
+
+@dataclass
+class PeLayout:
+    """Dateipositionen der für Authenticode relevanten PE-Felder."""
+
+    pe_offset: int
+    is_pe32_plus: bool
+    checksum_offset: int  # Position des CheckSum-Felds (4 Bytes)
+    security_dir_offset: int  # Position des Security-Directory-Eintrags (8 Bytes)
+    size_of_headers: int
+    cert_table_offset: int  # 0 = keine Signatur
+    cert_table_size: int
+    file_size: int
+
+
+@dataclass
+class SignatureInfo:
+    """Ergebnis der Signaturprüfung einer Datei."""
+
+    file_path: str
+    is_pe: bool
+    signed: bool
+    signer_thumbprint: Optional[str] = None
+    timestamped: bool = False
+    digest_algorithm: Optional[str] = None  # hashlib-Name, z. B. 'sha256'
+    signed_digest: Optional[str] = None  # signierter Authenticode-Digest (hex)
+    error: str = ""
+
+
+def read_pe_layout(f: BinaryIO) -> Optional[PeLayout]:
+    """
+    Liest die PE-Struktur aus einer geöffneten Datei.
+
+    Returns:
+        PeLayout oder None, wenn die Datei kein PE-Image ist
+
+    Raises:
+        ValueError: bei einem beschädigten PE-Header
+    """
+    f.seek(0, 2)
+    file_size = f.tell()
+    f.seek(0)
+
+    dos = f.read(64)
+    if len(dos) < 64 or dos[:2] != b"MZ":
+        return None
+    (pe_offset,) = struct.unpack_from("<I", dos, 0x3C)
+    if pe_offset + 24 > file_size:
+        return None
+
+    f.seek(pe_offset)
+    header = f.read(24)
+    if len(header) < 24 or header[:4] != b"PE\0\0":
+        return None
+    (size_of_optional,) = struct.unpack_from("<H", header, 20)
+
+    optional_offset = pe_offset + 24
+    optional = f.read(size_of_optional)
+    if len(optional) < 2:
+        raise ValueError("PE: Optional Header abgeschnitten")
+
+    (magic,) = struct.unpack_from("<H", optional, 0)
+    if magic == PE32_MAGIC:
+        rva_count_pos, dirs_pos = 92, 96
+    elif magic == PE32_PLUS_MAGIC:
+        rva_count_pos, dirs_pos = 108, 112
+    else:
+        raise ValueError(f"PE: unbekannter Optional-Header (0x{magic:x})")
+
+    if len(optional) < dirs_pos:
+        raise ValueError("PE: Optional Header abgeschnitten")
+    (size_of_headers,) = struct.unpack_from("<I", optional, 60)
+    (rva_count,) = struct.unpack_from("<I", optional, rva_count_pos)
+
+    security_pos = dirs_pos + IMAGE_DIRECTORY_ENTRY_SECURITY * 8
+    cert_offset = cert_size = 0
+    if rva_count > IMAGE_DIRECTORY_ENTRY_SECURITY and len(optional) >= security_pos + 8:
+        # Beim Security-Directory ist "VirtualAddress" ein Datei-Offset
+        cert_offset, cert_size = struct.unpack_from("<II", optional, security_pos)
+        if cert_offset + cert_size > file_size or cert_size > MAX_CERT_TABLE_SIZE:
+            raise ValueError("PE: Zertifikatstabelle außerhalb der Datei")
+
+    return PeLayout(
+        pe_offset=pe_offset,
+        is_pe32_plus=(magic == PE32_PLUS_MAGIC),
+        checksum_offset=optional_offset + 64,
+        security_dir_offset=optional_offset + security_pos,
+        size_of_headers=size_of_headers,
+        cert_table_offset=cert_offset if cert_size else 0,
+        cert_table_size=cert_size,
+        file_size=file_size,
+    )
+
+
+def read_pkcs7(f: BinaryIO, layout: PeLayout) -> Optional[bytes]:
+    """Liest den ersten PKCS#7-Blob (WIN_CERTIFICATE) aus der Zertifikatstabelle."""
+    if not layout.cert_table_offset:
+        return None
+
+    f.seek(layout.cert_table_offset)
+    table = f.read(layout.cert_table_size)
+    pos = 0
+    while pos + 8 <= len(table):
+        length, _revision, cert_type = struct.unpack_from("<IHH", table, pos)
+        if length < 8 or pos + length > len(table):
+            break
+        if cert_type == WIN_CERT_TYPE_PKCS_SIGNED_DATA:
+            return table[pos + 8 : pos + length]
+        # Einträge sind auf 8 Bytes ausgerichtet
+        pos += (length + 7) & ~7
+    return None
+
+
+def _issuer_and_serial(data: bytes, cert: der.Element) -> Tuple[bytes, bytes]:
+    """Liefert (Issuer-DER, Seriennummer) eines X.509-Zertifikats."""
+    tbs = der.children(data, cert)[0]
+    fields = der.children(data, tbs)
+    if fields and fields[0].tag == der.context_tag(0):
+        fields = fields[1:]  # explizite Version überspringen
+    serial, _sig_alg, issuer = fields[0], fields[1], fields[2]
+    return der.raw_bytes(data, issuer), der.content_bytes(data, serial)
+
+
+def parse_pkcs7(blob: bytes) -> Tuple[Optional[str], bool]:
+    """
+    Wertet eine Authenticode-SignedData-Struktur aus.
+
+    Returns:
+        (SHA-1-Thumbprint des Signer-Zertifikats oder None, Zeitstempel vorhanden)
+
+    Raises:
+        ValueError: wenn der Blob kein gültiges PKCS#7-SignedData ist
+    """
+    content_info = der.parse(blob)
+    ci_fields = der.children(blob, content_info)
+    if len(ci_fields) < 2 or der.read_oid(blob, ci_fields[0]) != OID_SIGNED_DATA:
+        raise ValueError("PKCS#7: kein SignedData")
+
+    signed_data = der.children(blob, ci_fields[1])[0]
+    certificates: List[der.Element] = []
+    signer_infos: Optional[der.Element] = None
+    for field in der.iter_children(blob, signed_data):
+        if field.tag == der.context_tag(0):
+            certificates = der.children(blob, field)
+        elif field.tag == der.TAG_SET:
+            signer_infos = field  # das letzte SET sind die SignerInfos
+
+    if signer_infos is None:
+        raise ValueError("PKCS#7: keine SignerInfos")
+    infos = der.children(blob, signer_infos)
+    if not infos:
+        raise ValueError("PKCS#7: keine SignerInfos")
+
+    signer_fields = der.children(blob, infos[0])
+    sid = signer_fields[1]
+
+    thumbprint: Optional[str] = None
+    if sid.tag == der.TAG_SEQUENCE:
+        sid_issuer, sid_serial = der.children(blob, sid)[:2]
+        wanted = (der.raw_bytes(blob, sid_issuer), der.content_bytes(blob, sid_serial))
+        for cert in certificates:
+            if cert.tag != der.TAG_SEQUENCE:
+                continue
+            if _issuer_and_serial(blob, cert) == wanted:
+                thumbprint = hashlib.sha1(der.raw_bytes(blob, cert)).hexdigest().upper()
+                break
+
+    timestamped = False
+    for field in signer_fields:
+        if field.tag != der.context_tag(1):
+            continue
+        for attribute in der.iter_children(blob, field):
+            oid = der.read_oid(blob, der.children(blob, attribute)[0])
+            if oid in (OID_COUNTER_SIGNATURE, OID_RFC3161_TIMESTAMP):
+                timestamped = True
+
+    return thumbprint, timestamped
+
+
+def parse_signed_digest(blob: bytes) -> Tuple[str, str]:
+    """
+    Liest den signierten Authenticode-Digest aus SpcIndirectDataContent.
+
+    Returns:
+        (hashlib-Algorithmus, Digest als Hex-String)
+
+    Raises:
+        ValueError: wenn der Blob keinen (bekannten) Digest enthält
+    """
+    content_info = der.parse(blob)
+    ci_fields = der.children(blob, content_info)
+    if len(ci_fields) < 2 or der.read_oid(blob, ci_fields[0]) != OID_SIGNED_DATA:
+        raise ValueError("PKCS#7: kein SignedData")
+
+    signed_data = der.children(blob, ci_fields[1])[0]
+    # version, digestAlgorithms, contentInfo, ...
+    encap = der.children(blob, signed_data)[2]
+    encap_fields = der.children(blob, encap)
+    if der.read_oid(blob, encap_fields[0]) != OID_SPC_INDIRECT_DATA:
+        raise ValueError("PKCS#7: kein SpcIndirectDataContent")
+
+    indirect = der.children(blob, encap_fields[1])[0]
+    digest_info = der.children(blob, indirect)[1]
+    algorithm, digest = der.children(blob, digest_info)[:2]
+    oid = der.read_oid(blob, der.children(blob, algorithm)[0])
+    name = DIGEST_ALGORITHMS.get(oid)
+    if name is None:
+        raise ValueError(f"PKCS#7: unbekannter Digest-Algorithmus {oid}")
+    return name, der.content_bytes(blob, digest).hex()
+
+
+def read_signature_info(file_path: str) -> SignatureInfo:
+    """
+    Prüft eine Datei auf eine eingebettete Authenticode-Signatur.
+
+    Nur PE-Dateien (EXE, DLL, SYS, OCX, …) werden ausgewertet; MSI- und
+    CAB-Dateien speichern Signaturen anders und gelten hier als "kein PE".
+    """
+    try:
+        with open(file_path, "rb") as f:
+            layout = read_pe_layout(f)
+            if layout is None:
+                return SignatureInfo(file_path=file_path, is_pe=False, signed=False)
+            blob = read_pkcs7(f, layout)
+    except (OSError, ValueError, struct.error) as e:
+        return SignatureInfo(file_path=file_path, is_pe=False, signed=False, error=str(e))
+
+    if blob is None:
+        return SignatureInfo(file_path=file_path, is_pe=True, signed=False)
+
+    try:
+        thumbprint, timestamped = parse_pkcs7(blob)
+    except (ValueError, IndexError) as e:
+        return SignatureInfo(
+            file_path=file_path,
+            is_pe=True,
+            signed=True,
+            error=f"Signatur nicht lesbar: {e}",
+        )
+
+    # Ohne lesbaren Digest bleibt die Signatur erkannt, nur nicht prüfbar
+    algorithm: Optional[str] = None
+    signed_digest: Optional[str] = None
+    try:
+        algorithm, signed_digest = parse_signed_digest(blob)
+    except (ValueError, IndexError):
+        pass
+
+    return SignatureInfo(
+        file_path=file_path,
+        is_pe=True,
+        signed=True,
+        signer_thumbprint=thumbprint,
+        timestamped=timestamped,
+        digest_algorithm=algorithm,
+        signed_digest=signed_digest,
+    )
+
+
+def scan_files(file_paths: List[str], max_workers: int = 8) -> List[SignatureInfo]:
+    """Prüft viele Dateien parallel; Ergebnis in der Reihenfolge von ``file_paths``."""
+    if not file_paths:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=max(1, max_workers), thread_name_prefix="signit-authenticode"
+    ) as pool:
+        return list(pool.map(read_signature_info, file_paths))
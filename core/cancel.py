@@ -0,0 +1,90 @@
+"""
+Let's Do. | SignIT – Abbruch laufender Signiervorgänge.
+
+Ein CancelToken wird an ``Signer.sign_files`` übergeben. Nach
+``cancel()`` werden keine weiteren Dateien mehr an signtool gegeben, und
+alle registrierten, noch laufenden signtool-Prozesse werden beendet:
+zuerst ``terminate()``, nach einer Schonfrist ``kill()``.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+from typing import Optional, Set
+
+DEFAULT_GRACE_PERIOD = 3.0  # Sekunden zwischen terminate() und kill()
+
+
+class CancelToken:
+    """
+    Thread-sicheres Abbruchsignal mit Prozessverwaltung.
+
+    Verwendung:
+        token = CancelToken()
+        signer.sign_files(..., cancel=token)
+        token.cancel()            # z. B. aus dem UI-Thread
+
+    Prozesse, die nach dem Abbruch registriert werden, werden sofort
+    beendet.
+    """
+
+    def __init__(self, grace_period: float = DEFAULT_GRACE_PERIOD):
+        self.grace_period = grace_period
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._processes: Set[subprocess.Popen] = set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wartet bis zum Abbruch oder Timeout; True = abgebrochen."""
+        return self._event.wait(timeout)
+
+    def cancel(self) -> None:
+        """Bricht ab und beendet alle laufenden Prozesse (nicht blockierend)."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            processes = list(self._processes)
+        self._terminate(processes)
+
+    def register(self, process: subprocess.Popen) -> None:
+        """Meldet einen gestarteten Prozess an."""
+        with self._lock:
+            if not self._event.is_set():
+                self._processes.add(process)
+                return
+        self._terminate([process])
+
+    def unregister(self, process: subprocess.Popen) -> None:
+        """Meldet einen beendeten Prozess ab."""
+        with self._lock:
+            self._processes.discard(process)
+
+    def _terminate(self, processes) -> None:
+        running = [p for p in processes if p.poll() is None]
+        if not running:
+            return
+        for process in running:
+            try:
+                process.terminate()
+            except OSError:
+                pass  # bereits beendet
+
+        def _kill_remaining() -> None:
+            for process in running:
+                try:
+                    process.wait(timeout=self.grace_period)
+                except subprocess.TimeoutExpired:
+                    try:
+                        process.kill()
+                    except OSError:
+                        pass
+
+        threading.Thread(
+            target=_kill_remaining, name="signit-cancel", daemon=True
+        ).start()
@@ -0,0 +1,270 @@
+"""
+Let's Do. | SignIT – Persistenter Cache der Zertifikatsliste.
+
+Speichert die zuletzt geladenen Zertifikate je Speicherort zusammen mit
+einem günstigen Änderungs-Fingerprint (Anzahl + Hash der Thumbprints).
+Die Oberfläche zeigt die gecachte Liste sofort an; beim Revalidieren wird
+nur der Fingerprint ermittelt und die teure Aufzählung samt
+Private-Key-Prüfung nur bei einer Änderung wiederholt.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.certstore import (
+    CertificateProvider,
+    CertInfo,
+    get_default_provider,
+    merge_certificates,
+)
+from core.utils import get_app_data_dir
+
+CACHE_FILENAME = "cert_cache.json"
+CACHE_VERSION = 1
+
+
+@dataclass
+class CacheEntry:
+    """Gecachte Zertifikatsliste eines Speicherorts."""
+
+    provider: str
+    fingerprint: str
+    certificates: List[CertInfo]
+    updated_at: str
+
+
+def _cert_to_dict(cert: CertInfo) -> Dict[str, object]:
+    return {
+        "subject": cert.subject,
+        "issuer": cert.issuer,
+        "thumbprint": cert.thumbprint,
+        "not_after": cert.not_after.isoformat(),
+        "has_private_key": cert.has_private_key,
+    }
+
+
+def _cert_from_dict(data: Dict[str, object]) -> CertInfo:
+    return CertInfo(
+        subject=str(data["subject"]),
+        issuer=str(data["issuer"]),
+        thumbprint=str(data["thumbprint"]),
+        not_after=datetime.fromisoformat(str(data["not_after"])),
+        has_private_key=bool(data["has_private_key"]),
+    )
+
+
+class CertCache:
+    """
+    Thread-sicherer Cache der Zertifikatslisten je Speicherort.
+
+    Verwendung:
+        cache = CertCache()
+        certs = cache.get("CurrentUser")          # sofort, evtl. None
+        certs, changed = cache.refresh("CurrentUser")  # im Hintergrund
+
+    ``get_many``/``refresh_many`` liefern mehrere Speicherorte als eine
+    nach Thumbprint zusammengeführte Liste.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        provider: Optional[CertificateProvider] = None,
+    ):
+        self.path = Path(path) if path else get_app_data_dir() / CACHE_FILENAME
+        self._provider = provider
+        self._entries: Dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # parallele refresh-Aufrufe
+        self.load()
+
+    @property
+    def provider(self) -> CertificateProvider:
+        return self._provider or get_default_provider()
+
+    def load(self) -> None:
+        """Lädt den Cache von der Platte; ein defekter Cache wird verworfen."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                return
+            entries = {
+                location: CacheEntry(
+                    provider=value["provider"],
+                    fingerprint=value["fingerprint"],
+                    certificates=[_cert_from_dict(c) for c in value["certificates"]],
+                    updated_at=value["updated_at"],
+                )
+                for location, value in data["entries"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        with self._lock:
+            self._entries = entries
+
+    def save(self) -> None:
+        """Schreibt den Cache atomar (temporäre Datei + os.replace)."""
+        with self._lock:
+            data = {
+                "version": CACHE_VERSION,
+                "entries": {
+                    location: {
+                        "provider": e.provider,
+                        "fingerprint": e.fingerprint,
+                        "certificates": [_cert_to_dict(c) for c in e.certificates],
+                        "updated_at": e.updated_at,
+                    }
+                    for location, e in self._entries.items()
+                },
+            }
+
+        with self._save_lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+
+    def get(self, store_location: str) -> Optional[List[CertInfo]]:
+        """
+        Gecachte Zertifikate eines Speicherorts (ohne Zugriff auf den Speicher).
+
+        Inzwischen abgelaufene Zertifikate werden herausgefiltert.
+
+        Returns:
+            Liste oder None, wenn für den aktuellen Provider nichts gecacht ist
+        """
+        with self._lock:
+            entry = self._entries.get(store_location)
+        if entry is None or entry.provider != self.provider.name:
+            return None
+        return [c for c in entry.certificates if c.is_valid]
+
+    def _revalidate(
+        self, store_locations: Sequence[str], force: bool
+    ) -> Tuple[Dict[str, List[CertInfo]], bool, Dict[str, str]]:
+        """
+        Ermittelt alle Fingerprints in einem Aufruf des Providers und lädt
+        nur die geänderten (bzw. bei ``force`` alle) Speicherorte gemeinsam neu.
+        """
+        provider = self.provider
+        fingerprints, errors = provider.fingerprint_many(store_locations)
+        with self._lock:
+            entries = {loc: self._entries.get(loc) for loc in fingerprints}
+
+        current: Dict[str, List[CertInfo]] = {}
+        stale: List[str] = []
+        for location, fingerprint in fingerprints.items():
+            entry = entries[location]
+            if (
+                not force
+                and entry is not None
+                and entry.provider == provider.name
+                and entry.fingerprint == fingerprint
+            ):
+                current[location] = [c for c in entry.certificates if c.is_valid]
+            else:
+                stale.append(location)
+
+        changed = False
+        if stale:
+            loaded, list_errors = provider.list_many(stale)
+            errors.update(list_errors)
+            updated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+            with self._lock:
+                for location, certs in loaded.items():
+                    entry = entries[location]
+                    changed = changed or (
+                        entry is None
+                        or entry.provider != provider.name
+                        or [c.thumbprint for c in entry.certificates]
+                        != [c.thumbprint for c in certs]
+                    )
+                    self._entries[location] = CacheEntry(
+                        provider=provider.name,
+                        fingerprint=fingerprints[location],
+                        certificates=certs,
+                        updated_at=updated_at,
+                    )
+            current.update(loaded)
+            if loaded:
+                try:
+                    self.save()
+                except OSError:
+                    pass  # Cache ist optional
+
+        ordered = {loc: current[loc] for loc in store_locations if loc in current}
+        return ordered, changed, errors
+
+    def refresh(
+        self, store_location: str, force: bool = False
+    ) -> Tuple[List[CertInfo], bool]:
+        """
+        Revalidiert den Cache eines Speicherorts.
+
+        Ermittelt den Fingerprint; nur wenn er sich geändert hat (oder
+        ``force``), wird die Liste vollständig neu geladen und gespeichert.
+
+        Returns:
+            (aktuelle Zertifikate, True wenn sich die Liste geändert hat)
+
+        Raises:
+            OSError: wenn der Speicherort nicht gelesen werden konnte
+        """
+        current, changed, errors = self._revalidate([store_location], force)
+        if store_location in errors:
+            raise OSError(errors[store_location])
+        return current[store_location], changed
+
+    def get_many(self, store_locations: Sequence[str]) -> Optional[List[CertInfo]]:
+        """
+        Gecachte, zusammengeführte Liste mehrerer Speicherorte.
+
+        Returns:
+            Liste oder None, wenn ein Speicherort nicht gecacht ist
+        """
+        per_store: Dict[str, List[CertInfo]] = {}
+        for location in store_locations:
+            certs = self.get(location)
+            if certs is None:
+                return None
+            per_store[location] = certs
+        return merge_certificates(per_store)
+
+    def refresh_many(
+        self, store_locations: Sequence[str], force: bool = False
+    ) -> Tuple[List[CertInfo], bool, Dict[str, str]]:
+        """
+        Revalidiert mehrere Speicherorte.
+
+        Fingerprints und geänderte Listen werden jeweils mit einem Aufruf
+        des Providers für alle Speicherorte ermittelt (``fingerprint_many``/
+        ``list_many``) – bei PowerShell ein Skript statt eines pro Speicher.
+
+        Returns:
+            (zusammengeführte Zertifikate, True bei Änderungen,
+            {Speicherort: Fehlermeldung})
+
+        Raises:
+            OSError: wenn kein Speicherort gelesen werden konnte
+        """
+        current, changed, errors = self._revalidate(store_locations, force)
+        if not current and errors:
+            raise OSError("; ".join(f"{loc}: {msg}" for loc, msg in errors.items()))
+        return merge_certificates(current), changed, errors
+
+    def invalidate(self, store_location: Optional[str] = None) -> None:
+        """Verwirft den Cache eines Speicherorts (oder aller)."""
+        with self._lock:
+            if store_location is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(store_location, None)
@@ -1,19 +1,36 @@
 """
-Let's Do. | SignIT – Windows-Zertifikatsspeicher-Zugriff.
-
-Liest Code-Signing-Zertifikate aus dem Windows Certificate Store
-über ctypes/Win32-API oder PowerShell-Fallback.
+Let's Do. | SignIT – Zertifikatsspeicher-Zugriff.
+
+Liest Code-Signing-Zertifikate über austauschbare Provider: den Windows
+Certificate Store (ctypes/Win32-API mit PowerShell-Fallback), ein
+Verzeichnis mit PEM-/PFX-Dateien oder eine Liste im Speicher. Die
+Win32-DLLs werden erst gebunden, wenn der native Provider verwendet wird,
+sodass das Modul auch unter Linux importiert werden kann. Provider lesen
+mehrere Speicherorte über ``list_many``/``fingerprint_many`` – PowerShell
+dabei mit einem einzigen Skript (core.powershell).
 """
 
 from __future__ import annotations
 
-import ctypes
-import ctypes.wintypes as wt
-import subprocess
-import json
-from dataclasses import dataclass
+import hashlib
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import List, Optional
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from core import powershell
+from core.x509 import parse_certificate, read_pem_blocks
+
+# Umgebungsvariable: Zertifikate aus einem Verzeichnis statt aus Windows laden
+CERT_DIR_ENV = "SIGNIT_CERT_DIR"
+
+# Alle unterstützten Speicherorte
+STORE_LOCATIONS = ("CurrentUser", "LocalMachine")
+
+T = TypeVar("T")
 
 
 # ---------------------------------------------------------------------------
@@ -21,13 +38,19 @@ from typing import List, Optional
 # ---------------------------------------------------------------------------
 @dataclass
 class CertInfo:
-    """Repräsentiert ein Zertifikat aus dem Windows-Speicher."""
+    """Repräsentiert ein Zertifikat aus einem Zertifikatsspeicher."""
 
     subject: str
     issuer: str
     thumbprint: str
     not_after: datetime
     has_private_key: bool
+    stores: Tuple[str, ...] = ()  # Herkunft, z. B. ("CurrentUser", "LocalMachine")
+
+    @property
+    def machine_store_only(self) -> bool:
+        """Nur im LocalMachine-Speicher vorhanden (signtool benötigt dann /sm)."""
+        return bool(self.stores) and "CurrentUser" not in self.stores
 
     @property
     def not_after_str(self) -> str:
@@ -40,221 +63,390 @@ class CertInfo:
         return self.not_after > datetime.now(timezone.utc)
 
 
-# ---------------------------------------------------------------------------
-# Win32-API-Konstanten & -Strukturen
-# ---------------------------------------------------------------------------
-CERT_STORE_PROV_SYSTEM = 10
-CERT_SYSTEM_STORE_CURRENT_USER = 0x00010000
-CERT_SYSTEM_STORE_LOCAL_MACHINE = 0x00020000
-X509_ASN_ENCODING = 0x00000001
-PKCS_7_ASN_ENCODING = 0x00010000
-ENCODING = X509_ASN_ENCODING | PKCS_7_ASN_ENCODING
-CERT_FIND_ANY = 0
-
-# CertNameString-Typen
-CERT_NAME_SIMPLE_DISPLAY_TYPE = 4
-CERT_NAME_ISSUER_FLAG = 0x1
-
-
-class CRYPT_DATA_BLOB(ctypes.Structure):
-    _fields_ = [
-        ("cbData", wt.DWORD),
-        ("pbData", ctypes.POINTER(ctypes.c_byte)),
-    ]
-
-
-class CRYPT_BIT_BLOB(ctypes.Structure):
-    _fields_ = [
-        ("cbData", wt.DWORD),
-        ("pbData", ctypes.POINTER(ctypes.c_byte)),
-        ("cUnusedBits", wt.DWORD),
-    ]
-
-
-class CRYPT_ALGORITHM_IDENTIFIER(ctypes.Structure):
-    _fields_ = [
-        ("pszObjId", ctypes.c_char_p),
-        ("Parameters", CRYPT_DATA_BLOB),
-    ]
-
-
-class CERT_PUBLIC_KEY_INFO(ctypes.Structure):
-    _fields_ = [
-        ("Algorithm", CRYPT_ALGORITHM_IDENTIFIER),
-        ("PublicKey", CRYPT_BIT_BLOB),
-    ]
-
-
-class FILETIME(ctypes.Structure):
-    _fields_ = [
-        ("dwLowDateTime", wt.DWORD),
-        ("dwHighDateTime", wt.DWORD),
-    ]
-
-
-class CERT_INFO(ctypes.Structure):
-    _fields_ = [
-        ("dwVersion", wt.DWORD),
-        ("SerialNumber", CRYPT_DATA_BLOB),
-        ("SignatureAlgorithm", CRYPT_ALGORITHM_IDENTIFIER),
-        ("Issuer", CRYPT_DATA_BLOB),
-        ("NotBefore", FILETIME),
-        ("NotAfter", FILETIME),
-        ("Subject", CRYPT_DATA_BLOB),
-        ("SubjectPublicKeyInfo", CERT_PUBLIC_KEY_INFO),
-        ("IssuerUniqueId", CRYPT_BIT_BLOB),
-        ("SubjectUniqueId", CRYPT_BIT_BLOB),
-        ("cExtension", wt.DWORD),
-        ("rgExtension", ctypes.c_void_p),
-    ]
-
-
-class CERT_CONTEXT(ctypes.Structure):
-    _fields_ = [
-        ("dwCertEncodingType", wt.DWORD),
-        ("pbCertEncoded", ctypes.POINTER(ctypes.c_byte)),
-        ("cbCertEncoded", wt.DWORD),
-        ("pCertInfo", ctypes.POINTER(CERT_INFO)),
-        ("hCertStore", ctypes.c_void_p),
-    ]
+def compute_fingerprint(thumbprints: Iterable[str]) -> str:
+    """
+    Änderungs-Fingerprint eines Speichers: Anzahl plus Hash der Thumbprints.
+
+    Unabhängig von der Reihenfolge der Aufzählung.
+    """
+    items = sorted(t.upper() for t in thumbprints)
+    digest = hashlib.sha256("\n".join(items).encode("utf-8"))
+    return f"{len(items)}:{digest.hexdigest()}"
 
 
 # ---------------------------------------------------------------------------
-# Win32-API-Funktionen laden
+# Provider
 # ---------------------------------------------------------------------------
-_crypt32 = ctypes.windll.crypt32  # type: ignore[attr-defined]
-
-CertOpenStore = _crypt32.CertOpenStore
-CertOpenStore.argtypes = [
-    ctypes.c_char_p,  # lpszStoreProvider
-    wt.DWORD,  # dwEncodingType
-    ctypes.c_void_p,  # hCryptProv
-    wt.DWORD,  # dwFlags
-    ctypes.c_wchar_p,  # pvPara
-]
-CertOpenStore.restype = ctypes.c_void_p
-
-CertFindCertificateInStore = _crypt32.CertFindCertificateInStore
-CertFindCertificateInStore.argtypes = [
-    ctypes.c_void_p,  # hCertStore
-    wt.DWORD,  # dwCertEncodingType
-    wt.DWORD,  # dwFindFlags
-    wt.DWORD,  # dwFindType
-    ctypes.c_void_p,  # pvFindPara
-    ctypes.POINTER(CERT_CONTEXT),  # pPrevCertContext
-]
-CertFindCertificateInStore.restype = ctypes.POINTER(CERT_CONTEXT)
-
-CertGetNameStringW = _crypt32.CertGetNameStringW
-CertGetNameStringW.argtypes = [
-    ctypes.POINTER(CERT_CONTEXT),  # pCertContext
-    wt.DWORD,  # dwType
-    wt.DWORD,  # dwFlags
-    ctypes.c_void_p,  # pvTypePara
-    ctypes.c_wchar_p,  # pszNameString
-    wt.DWORD,  # cchNameString
-]
-CertGetNameStringW.restype = wt.DWORD
-
-CertCloseStore = _crypt32.CertCloseStore
-CertCloseStore.argtypes = [ctypes.c_void_p, wt.DWORD]
-CertCloseStore.restype = wt.BOOL
-
-CertFreeCertificateContext = _crypt32.CertFreeCertificateContext
-CertFreeCertificateContext.argtypes = [ctypes.POINTER(CERT_CONTEXT)]
-CertFreeCertificateContext.restype = wt.BOOL
-
-_advapi32 = ctypes.windll.advapi32  # type: ignore[attr-defined]
-CryptReleaseContext = _advapi32.CryptReleaseContext
-CryptReleaseContext.argtypes = [ctypes.c_void_p, wt.DWORD]
-CryptReleaseContext.restype = wt.BOOL
-
-try:
-    _ncrypt = ctypes.windll.ncrypt  # type: ignore[attr-defined]
-    NCryptFreeObject = _ncrypt.NCryptFreeObject
-    NCryptFreeObject.argtypes = [ctypes.c_void_p]
-    NCryptFreeObject.restype = wt.DWORD
-except Exception:
-    NCryptFreeObject = None
-
-# CryptAcquireCertificatePrivateKey – prüft ob Private Key vorhanden
-CryptAcquireCertificatePrivateKey = _crypt32.CryptAcquireCertificatePrivateKey
-CryptAcquireCertificatePrivateKey.argtypes = [
-    ctypes.POINTER(CERT_CONTEXT),  # pCert
-    wt.DWORD,  # dwFlags
-    ctypes.c_void_p,  # pvParameters
-    ctypes.POINTER(ctypes.c_void_p),  # phCryptProvOrNCryptKey
-    ctypes.POINTER(wt.DWORD),  # pdwKeySpec
-    ctypes.POINTER(wt.BOOL),  # pfCallerFreeProvOrNCryptKey
-]
-CryptAcquireCertificatePrivateKey.restype = wt.BOOL
-
-CRYPT_ACQUIRE_SILENT_FLAG = 0x00000040
-CRYPT_ACQUIRE_CACHE_FLAG = 0x00000001
-CERT_NCRYPT_KEY_SPEC = 0xFFFFFFFF
+class CertificateProvider(ABC):
+    """Basisklasse für Zertifikatsquellen (``list_certificates`` ist Pflicht)."""
 
+    name = "base"
 
-# ---------------------------------------------------------------------------
-# Hilfsfunktionen
-# ---------------------------------------------------------------------------
-def _filetime_to_datetime(ft: FILETIME) -> datetime:
-    """Konvertiert Win32-FILETIME in Python-datetime (UTC)."""
-    # FILETIME = 100-Nanosekunden-Intervalle seit 01.01.1601
-    timestamp = (ft.dwHighDateTime << 32) + ft.dwLowDateTime
-    # Differenz zwischen 1601 und 1970 in 100ns-Einheiten
-    EPOCH_DIFF = 116444736000000000
-    if timestamp <= EPOCH_DIFF:
-        return datetime(1970, 1, 1, tzinfo=timezone.utc)
-    unix_ts = (timestamp - EPOCH_DIFF) / 10_000_000
-    return datetime.fromtimestamp(unix_ts, tz=timezone.utc)
-
-
-def _get_cert_name(ctx: ctypes.POINTER(CERT_CONTEXT), issuer: bool = False) -> str:
-    """Liest Subject- oder Issuer-Namen aus einem Zertifikatskontext."""
-    buf = ctypes.create_unicode_buffer(256)
-    flags = CERT_NAME_ISSUER_FLAG if issuer else 0
-    CertGetNameStringW(ctx, CERT_NAME_SIMPLE_DISPLAY_TYPE, flags, None, buf, 256)
-    return buf.value
-
-
-def _get_thumbprint(ctx: ctypes.POINTER(CERT_CONTEXT)) -> str:
-    """Berechnet den SHA-1-Thumbprint des Zertifikats."""
-    import hashlib
-
-    cert_data = ctypes.string_at(
-        ctx.contents.pbCertEncoded,
-        ctx.contents.cbCertEncoded,
-    )
-    return hashlib.sha1(cert_data).hexdigest().upper()
-
-
-def _has_private_key(ctx: ctypes.POINTER(CERT_CONTEXT)) -> bool:
-    """Prüft, ob das Zertifikat einen privaten Schlüssel besitzt."""
-    hProv = ctypes.c_void_p()
-    dwKeySpec = wt.DWORD()
-    fCallerFree = wt.BOOL()
-    result = CryptAcquireCertificatePrivateKey(
-        ctx,
-        CRYPT_ACQUIRE_SILENT_FLAG | CRYPT_ACQUIRE_CACHE_FLAG,
-        None,
-        ctypes.byref(hProv),
-        ctypes.byref(dwKeySpec),
-        ctypes.byref(fCallerFree),
+    def fingerprint(self, store_location: str = "CurrentUser") -> str:
+        """
+        Günstiger Fingerprint des Speicherinhalts (siehe ``compute_fingerprint``).
+
+        Ändert er sich nicht, ist ``list_certificates`` nicht erneut nötig.
+        Provider ohne günstigeren Weg lesen die vollständige Liste.
+        """
+        return compute_fingerprint(
+            c.thumbprint for c in self.list_certificates(store_location)
+        )
+
+    @abstractmethod
+    def list_certificates(self, store_location: str = "CurrentUser") -> List[CertInfo]:
+        """
+        Liefert die verwendbaren Code-Signing-Zertifikate eines Speicherorts.
+
+        Args:
+            store_location: 'CurrentUser' oder 'LocalMachine'
+
+        Returns:
+            Liste von CertInfo-Objekten
+        """
+
+    def list_many(
+        self, store_locations: Sequence[str]
+    ) -> Tuple[Dict[str, List[CertInfo]], Dict[str, str]]:
+        """
+        Liest mehrere Speicherorte (Standard: je ein Thread).
+
+        Returns:
+            ({Speicherort: Zertifikate}, {Speicherort: Fehlermeldung})
+        """
+        return run_per_store(self.list_certificates, store_locations)
+
+    def fingerprint_many(
+        self, store_locations: Sequence[str]
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Fingerprints mehrerer Speicherorte (Standard: je ein Thread).
+
+        Returns:
+            ({Speicherort: Fingerprint}, {Speicherort: Fehlermeldung})
+        """
+        return run_per_store(self.fingerprint, store_locations)
+
+    def close(self) -> None:
+        """Gibt gehaltene Ressourcen frei (z. B. einen PowerShell-Host)."""
+
+
+class NativeProvider(CertificateProvider):
+    """Windows-Zertifikatsspeicher über die Win32-API (crypt32)."""
+
+    name = "win32"
+
+    def list_certificates(self, store_location: str = "CurrentUser") -> List[CertInfo]:
+        # crypt32 erst hier binden – der Import schlägt außerhalb von Windows fehl
+        from core import wincrypt
+
+        return wincrypt.read_store(store_location)
+
+    def fingerprint(self, store_location: str = "CurrentUser") -> str:
+        # Alle Zertifikate des Speichers, ohne Private-Key-Prüfung
+        from core import wincrypt
+
+        return compute_fingerprint(wincrypt.store_thumbprints(store_location))
+
+
+class PowerShellProvider(CertificateProvider):
+    """
+    Windows-Zertifikatsspeicher über PowerShell (Fallback).
+
+    Alle angefragten Speicherorte werden mit einem Skript gelesen. Mit
+    ``persistent=True`` läuft es in einem PowerShell-Host, der über mehrere
+    Aktualisierungen wiederverwendet wird (siehe core.powershell).
+    """
+
+    name = "powershell"
+
+    def __init__(
+        self,
+        executable: str = powershell.DEFAULT_EXECUTABLE,
+        persistent: bool = False,
+        timeout: float = powershell.DEFAULT_TIMEOUT,
+        code_signing_only: bool = True,
+    ):
+        runner_class = (
+            powershell.PowerShellHost if persistent else powershell.PowerShellRunner
+        )
+        self.runner = runner_class(executable, timeout)
+        self.code_signing_only = code_signing_only
+
+    def list_many(
+        self, store_locations: Sequence[str]
+    ) -> Tuple[Dict[str, List[CertInfo]], Dict[str, str]]:
+        if not store_locations:
+            return {}, {}
+        try:
+            items, errors = powershell.query_certificates(
+                self.runner, store_locations, self.code_signing_only
+            )
+        except OSError as e:
+            return {}, {location: str(e) for location in store_locations}
+
+        results: Dict[str, List[CertInfo]] = {}
+        for location, entries in items.items():
+            try:
+                results[location] = [_cert_from_powershell(item) for item in entries]
+            except (KeyError, TypeError, ValueError) as e:
+                errors[location] = f"ungültige PowerShell-Antwort ({e})"
+        return results, errors
+
+    def fingerprint_many(
+        self, store_locations: Sequence[str]
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        if not store_locations:
+            return {}, {}
+        try:
+            thumbprints, errors = powershell.query_thumbprints(
+                self.runner, store_locations
+            )
+        except OSError as e:
+            return {}, {location: str(e) for location in store_locations}
+        return (
+            {loc: compute_fingerprint(map(str, t)) for loc, t in thumbprints.items()},
+            errors,
+        )
+
+    def list_certificates(self, store_location: str = "CurrentUser") -> List[CertInfo]:
+        results, errors = self.list_many([store_location])
+        if store_location in errors:
+            raise OSError(errors[store_location])
+        return results[store_location]
+
+    def fingerprint(self, store_location: str = "CurrentUser") -> str:
+        results, errors = self.fingerprint_many([store_location])
+        if store_location in errors:
+            raise OSError(errors[store_location])
+        return results[store_location]
+
+    def close(self) -> None:
+        self.runner.close()
+
+
+def _cert_from_powershell(item: Dict[str, object]) -> CertInfo:
+    # NotAfter kommt als UTC im Format 'yyyy-MM-ddTHH:mm:ss'
+    not_after = datetime.fromisoformat(str(item["NotAfter"]))
+    if not_after.tzinfo is None:
+        not_after = not_after.replace(tzinfo=timezone.utc)
+    return CertInfo(
+        subject=str(item.get("Subject") or ""),
+        issuer=str(item.get("Issuer") or ""),
+        thumbprint=str(item["Thumbprint"]).upper(),
+        not_after=not_after,
+        has_private_key=True,
     )
-    if not result:
-        return False
 
-    # FIX #2: Akquirierte Key-Handles freigeben, um Handle-Leaks zu vermeiden.
-    if bool(fCallerFree) and hProv.value:
+
+class SystemProvider(CertificateProvider):
+    """
+    Win32-API, bei Fehler PowerShell – der Standard unter Windows.
+
+    Speicherorte, die nativ nicht lesbar sind, werden gemeinsam in einem
+    PowerShell-Aufruf nachgeladen; der Host bleibt dafür bestehen.
+    """
+
+    name = "system"
+
+    def __init__(self):
+        self._native = NativeProvider()
+        self._powershell = PowerShellProvider(persistent=True)
+
+    def list_many(
+        self, store_locations: Sequence[str]
+    ) -> Tuple[Dict[str, List[CertInfo]], Dict[str, str]]:
+        results, errors = self._native.list_many(store_locations)
+        if errors:
+            fallback, errors = self._powershell.list_many(list(errors))
+            results.update(fallback)
+        return {loc: results[loc] for loc in store_locations if loc in results}, errors
+
+    def fingerprint_many(
+        self, store_locations: Sequence[str]
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        results, errors = self._native.fingerprint_many(store_locations)
+        if errors:
+            fallback, errors = self._powershell.fingerprint_many(list(errors))
+            results.update(fallback)
+        return {loc: results[loc] for loc in store_locations if loc in results}, errors
+
+    def list_certificates(self, store_location: str = "CurrentUser") -> List[CertInfo]:
+        try:
+            return self._native.list_certificates(store_location)
+        except Exception:
+            return self._powershell.list_certificates(store_location)
+
+    def fingerprint(self, store_location: str = "CurrentUser") -> str:
         try:
-            if dwKeySpec.value == CERT_NCRYPT_KEY_SPEC and NCryptFreeObject:
-                NCryptFreeObject(hProv)
-            else:
-                CryptReleaseContext(hProv, 0)
+            return self._native.fingerprint(store_location)
         except Exception:
-            pass
+            return self._powershell.fingerprint(store_location)
 
-    return True
+    def close(self) -> None:
+        self._powershell.close()
+
+
+class DirectoryProvider(CertificateProvider):
+    """
+    Zertifikate aus einem Verzeichnis (z. B. für Test- und Benchmark-Umgebungen).
+
+    Gibt es ein Unterverzeichnis mit dem Namen des Speicherorts
+    (``<root>/CurrentUser``), wird dieses gelesen, sonst ``root`` selbst.
+
+    - PEM/DER (``.pem``, ``.crt``, ``.cer``, ``.der``): Ein privater Schlüssel
+      gilt als vorhanden, wenn die Datei einen ``PRIVATE KEY``-Block enthält
+      oder daneben eine ``<name>.key`` liegt. Der Schlüssel wird nicht gegen
+      das Zertifikat geprüft.
+    - PFX (``.pfx``, ``.p12``): benötigt das optionale Paket ``cryptography``.
+
+    Wie beim Windows-Speicher werden nur gültige Code-Signing-Zertifikate
+    mit privatem Schlüssel geliefert. Nicht lesbare Dateien werden übersprungen und in
+    ``errors[store_location]`` vermerkt.
+    """
+
+    name = "directory"
+
+    CERT_EXTENSIONS = (".pem", ".crt", ".cer", ".der")
+    PFX_EXTENSIONS = (".pfx", ".p12")
+
+    def __init__(self, root: str, password: Optional[bytes] = None):
+        self.root = Path(root)
+        self.password = password
+        self.errors: Dict[str, List[str]] = {}
+
+    def _store_dir(self, store_location: str) -> Path:
+        candidate = self.root / store_location
+        return candidate if candidate.is_dir() else self.root
+
+    def _load_pfx(self, data: bytes) -> List[Tuple[bytes, bool]]:
+        try:
+            from cryptography.hazmat.primitives.serialization import (
+                Encoding,
+                pkcs12,
+            )
+        except ImportError as e:
+            raise OSError("PFX-Dateien benötigen das Paket 'cryptography'") from e
+
+        key, cert, _chain = pkcs12.load_key_and_certificates(data, self.password)
+        if cert is None:
+            return []
+        return [(cert.public_bytes(Encoding.DER), key is not None)]
+
+    def _load_file(self, path: Path) -> List[Tuple[bytes, bool]]:
+        """Liefert (DER-Zertifikat, privater Schlüssel vorhanden) je Zertifikat."""
+        data = path.read_bytes()
+        suffix = path.suffix.lower()
+        if suffix in self.PFX_EXTENSIONS:
+            return self._load_pfx(data)
+
+        key_file = path.with_suffix(".key").is_file()
+        blocks = read_pem_blocks(data)
+        if not blocks:
+            return [(data, key_file)]  # DER-kodiert
+
+        has_key = key_file or any(
+            label.endswith("PRIVATE KEY") for label, _ in blocks
+        )
+        certs = [body for label, body in blocks if label == "CERTIFICATE"]
+        # Der Schlüssel gehört zum ersten Zertifikat, weitere sind die Kette
+        return [(body, has_key and i == 0) for i, body in enumerate(certs)]
+
+    def _scan(self, store_location: str) -> List[os.DirEntry]:
+        extensions = self.CERT_EXTENSIONS + self.PFX_EXTENSIONS + (".key",)
+        with os.scandir(self._store_dir(store_location)) as entries:
+            return sorted(
+                (
+                    e
+                    for e in entries
+                    if e.is_file() and Path(e.name).suffix.lower() in extensions
+                ),
+                key=lambda e: e.name,
+            )
+
+    def fingerprint(self, store_location: str = "CurrentUser") -> str:
+        # Name, Größe und mtime je Datei – ohne Dateien zu lesen
+        return compute_fingerprint(
+            f"{e.name}|{e.stat().st_size}|{e.stat().st_mtime_ns}"
+            for e in self._scan(store_location)
+        )
+
+    def list_certificates(self, store_location: str = "CurrentUser") -> List[CertInfo]:
+        errors: List[str] = []
+        self.errors[store_location] = errors
+        now = datetime.now(timezone.utc)
+
+        certs: Dict[str, CertInfo] = {}
+        paths = [
+            Path(e.path)
+            for e in self._scan(store_location)
+            if Path(e.name).suffix.lower() != ".key"
+        ]
+
+        for path in paths:
+            try:
+                loaded = self._load_file(path)
+                for encoded, has_key in loaded:
+                    cert = parse_certificate(encoded)
+                    if not has_key or cert.not_after <= now:
+                        continue
+                    if not cert.is_code_signing:
+                        continue
+                    certs.setdefault(
+                        cert.thumbprint,
+                        CertInfo(
+                            subject=cert.subject,
+                            issuer=cert.issuer,
+                            thumbprint=cert.thumbprint,
+                            not_after=cert.not_after,
+                            has_private_key=True,
+                        ),
+                    )
+            except (OSError, ValueError) as e:
+                errors.append(f"{path.name}: {e}")
+
+        return list(certs.values())
+
+
+class MemoryProvider(CertificateProvider):
+    """Fest vorgegebene Zertifikate je Speicherort (Tests, Benchmarks)."""
+
+    name = "memory"
+
+    def __init__(self, certificates: Optional[Dict[str, List[CertInfo]]] = None):
+        self._certificates: Dict[str, List[CertInfo]] = {
+            location: list(certs) for location, certs in (certificates or {}).items()
+        }
+
+    def add(self, cert: CertInfo, store_location: str = "CurrentUser") -> None:
+        """Fügt ein Zertifikat zu einem Speicherort hinzu."""
+        self._certificates.setdefault(store_location, []).append(cert)
+
+    def list_certificates(self, store_location: str = "CurrentUser") -> List[CertInfo]:
+        return list(self._certificates.get(store_location, []))
+
+
+_default_provider: Optional[CertificateProvider] = None
+
+
+def get_default_provider() -> CertificateProvider:
+    """
+    Liefert den Standard-Provider.
+
+    Ist ``SIGNIT_CERT_DIR`` gesetzt, wird dieses Verzeichnis verwendet,
+    sonst der Windows-Zertifikatsspeicher.
+    """
+    global _default_provider
+    if _default_provider is None:
+        cert_dir = os.environ.get(CERT_DIR_ENV)
+        _default_provider = DirectoryProvider(cert_dir) if cert_dir else SystemProvider()
+    return _default_provider
+
+
+def set_default_provider(provider: Optional[CertificateProvider]) -> None:
+    """Setzt den Standard-Provider (None = beim nächsten Zugriff neu wählen)."""
+    global _default_provider
+    _default_provider = provider
 
 
 # ---------------------------------------------------------------------------
@@ -270,128 +462,105 @@ def get_certificates_native(store_location: str = "CurrentUser") -> List[CertInf
     Returns:
         Liste von CertInfo-Objekten (nur gültige Zertifikate mit Private Key)
     """
-    flags = (
-        CERT_SYSTEM_STORE_CURRENT_USER
-        if store_location == "CurrentUser"
-        else CERT_SYSTEM_STORE_LOCAL_MACHINE
-    )
+    return NativeProvider().list_certificates(store_location)
 
-    store = CertOpenStore(
-        ctypes.c_char_p(CERT_STORE_PROV_SYSTEM),
-        0,
-        None,
-        flags,
-        "My",
-    )
-    if not store:
-        raise OSError(
-            f"Zertifikatsspeicher konnte nicht geöffnet werden "
-            f"(Store: {store_location}\\My)"
-        )
 
-    certs: List[CertInfo] = []
-    ctx = None
-    now = datetime.now(timezone.utc)
+def get_certificates_powershell(store_location: str = "CurrentUser") -> List[CertInfo]:
+    """
+    Fallback: Liest Zertifikate über PowerShell (eigener Prozess pro Aufruf).
 
-    try:
-        while True:
-            ctx = CertFindCertificateInStore(
-                store, ENCODING, 0, CERT_FIND_ANY, None, ctx
-            )
-            if not ctx:
-                break
-
-            not_after = _filetime_to_datetime(ctx.contents.pCertInfo.contents.NotAfter)
-
-            # Nur gültige Zertifikate mit privatem Schlüssel
-            if not_after <= now:
-                continue
-            if not _has_private_key(ctx):
-                continue
-
-            cert = CertInfo(
-                subject=_get_cert_name(ctx, issuer=False),
-                issuer=_get_cert_name(ctx, issuer=True),
-                thumbprint=_get_thumbprint(ctx),
-                not_after=not_after,
-                has_private_key=True,
-            )
-            certs.append(cert)
-    finally:
-        CertCloseStore(store, 0)
+    Für mehrere Speicherorte oder wiederholte Abfragen
+    ``PowerShellProvider(persistent=True).list_many(...)`` verwenden.
 
-    return certs
+    Args:
+        store_location: 'CurrentUser' oder 'LocalMachine'
 
+    Returns:
+        Liste von CertInfo-Objekten
+    """
+    return PowerShellProvider().list_certificates(store_location)
 
-def get_certificates_powershell(store_location: str = "CurrentUser") -> List[CertInfo]:
+
+def get_certificates(
+    store_location: str = "CurrentUser",
+    provider: Optional[CertificateProvider] = None,
+) -> List[CertInfo]:
     """
-    Fallback: Liest Zertifikate über PowerShell.
+    Liest Zertifikate über ``provider`` bzw. den Standard-Provider.
+
+    Unter Windows wird zuerst die native Win32-API versucht, bei Fehler
+    PowerShell (siehe ``SystemProvider``).
 
     Args:
         store_location: 'CurrentUser' oder 'LocalMachine'
+        provider: Zertifikatsquelle (Standard: ``get_default_provider()``)
 
     Returns:
-        Liste von CertInfo-Objekten
-    """
-    ps_script = f"""
-    $certs = Get-ChildItem -Path "Cert:\\{store_location}\\My" |
-        Where-Object {{ $_.HasPrivateKey -eq $true -and $_.NotAfter -gt (Get-Date) }} |
-        Select-Object Subject, Issuer, Thumbprint,
-            @{{Name='NotAfter'; Expression={{$_.NotAfter.ToString('o')}}}}
-    $certs | ConvertTo-Json -Compress
+        Liste von CertInfo-Objekten (``stores`` = Speicherort)
     """
+    certs = (provider or get_default_provider()).list_certificates(store_location)
+    return merge_certificates({store_location: certs})
 
-    result = subprocess.run(
-        ["powershell", "-NoProfile", "-Command", ps_script],
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
 
-    if result.returncode != 0:
-        raise OSError(
-            f"PowerShell-Fehler beim Lesen der Zertifikate: {result.stderr.strip()}"
-        )
+def merge_certificates(per_store: Dict[str, List[CertInfo]]) -> List[CertInfo]:
+    """
+    Führt die Listen mehrerer Speicherorte zusammen.
 
-    output = result.stdout.strip()
-    if not output or output == "null":
-        return []
-
-    data = json.loads(output)
-    # PowerShell gibt bei einem einzelnen Ergebnis kein Array zurück
-    if isinstance(data, dict):
-        data = [data]
-
-    certs: List[CertInfo] = []
-    for item in data:
-        not_after = datetime.fromisoformat(item["NotAfter"])
-        if not_after.tzinfo is None:
-            not_after = not_after.replace(tzinfo=timezone.utc)
-        certs.append(
-            CertInfo(
-                subject=item.get("Subject", ""),
-                issuer=item.get("Issuer", ""),
-                thumbprint=item.get("Thumbprint", ""),
-                not_after=not_after,
-                has_private_key=True,
-            )
-        )
+    Zertifikate mit gleichem Thumbprint erscheinen einmal; ``stores``
+    enthält alle Speicherorte, in denen sie gefunden wurden (in der
+    Reihenfolge von ``per_store``).
+    """
+    merged: Dict[str, CertInfo] = {}
+    for location, certs in per_store.items():
+        for cert in certs:
+            existing = merged.get(cert.thumbprint)
+            if existing is None:
+                merged[cert.thumbprint] = replace(cert, stores=(location,))
+            elif location not in existing.stores:
+                existing.stores = existing.stores + (location,)
+    return list(merged.values())
+
+
+def run_per_store(
+    load: Callable[[str], T], store_locations: Sequence[str]
+) -> Tuple[Dict[str, T], Dict[str, str]]:
+    """
+    Führt ``load`` für jeden Speicherort in einem eigenen Thread aus.
 
-    return certs
+    Returns:
+        ({Speicherort: Ergebnis}, {Speicherort: Fehlermeldung}) – die
+        Ergebnisse in der Reihenfolge von ``store_locations``
+    """
+    if not store_locations:
+        return {}, {}
+    with ThreadPoolExecutor(
+        max_workers=len(store_locations), thread_name_prefix="signit-certstore"
+    ) as pool:
+        futures = {loc: pool.submit(load, loc) for loc in store_locations}
+
+    results: Dict[str, T] = {}
+    errors: Dict[str, str] = {}
+    for location, future in futures.items():
+        try:
+            results[location] = future.result()
+        except Exception as e:
+            errors[location] = str(e)
+    return results, errors
 
 
-def get_certificates(store_location: str = "CurrentUser") -> List[CertInfo]:
+def get_certificates_from_stores(
+    store_locations: Sequence[str] = STORE_LOCATIONS,
+    provider: Optional[CertificateProvider] = None,
+) -> Tuple[List[CertInfo], Dict[str, str]]:
     """
-    Liest Zertifikate – versucht zuerst die native Win32-API,
-    fällt bei Fehler auf PowerShell zurück.
+    Liest mehrere Speicherorte gleichzeitig und führt sie zusammen.
 
-    Args:
-        store_location: 'CurrentUser' oder 'LocalMachine'
+    Ein fehlgeschlagener Speicherort (z. B. fehlende Rechte) verhindert
+    nicht die Anzeige der übrigen.
 
     Returns:
-        Liste von CertInfo-Objekten
+        (zusammengeführte Zertifikate, {Speicherort: Fehlermeldung})
     """
-    try:
-        return get_certificates_native(store_location)
-    except Exception:
-        return get_certificates_powershell(store_location)
+    provider = provider or get_default_provider()
+    per_store, errors = provider.list_many(store_locations)
+    return merge_certificates(per_store), errors
@@ -0,0 +1,493 @@
+"""
+Let's Do. | SignIT – Kommandozeile (ohne GUI).
+
+Steuert den Signer direkt, z. B. auf Build-Agents. Importiert weder
+tkinter noch customtkinter. Jede Datei ergibt eine JSON-Zeile auf stdout,
+die Live-Ausgabe von signtool geht (mit --verbose) nach stderr.
+
+Verwendung:
+    python main.py --cli -t AABB... "dist/**/*.exe" @weitere_dateien.txt
+    python main.py --cli -t AABB... build/ --exclude obj --exclude "*.vshost.exe"
+
+In der mit ``--windowed`` gebauten EXE gibt es keine Konsole; ``main()``
+verwendet dann umgeleitete Handles (``> ergebnis.jsonl``) oder hängt sich
+an die Konsole des Aufrufers (siehe ``attach_console``).
+
+Exit-Codes:
+    0  alle Dateien signiert (oder übersprungen)
+    1  mindestens eine Datei fehlgeschlagen
+    2  ungültige Argumente
+    3  Umgebungsfehler (signtool nicht gefunden, keine Dateien)
+    4  abgebrochen (Strg+C); laufende signtool-Prozesse werden beendet,
+       ein zweites Strg+C wartet darauf nicht mehr
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, TextIO
+
+from core.folderscan import DEFAULT_INCLUDE, scan_folder
+from core.cancel import CancelToken
+from core.journal import SigningJournal
+from core.preflight import run_preflight
+from core.retry import ERROR_CANCELLED, RetryPolicy
+from core.signer import Signer, SignResult, SignTimings
+from core.signindex import SignIndex
+from core.throughput import ThroughputSnapshot, format_duration
+from core.timestamp import TimestampSelector
+from core.utils import TIMESTAMP_SERVERS, find_signtool, validate_signtool
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_ENVIRONMENT = 3
+EXIT_CANCELLED = 4
+
+AUTO_TIMESTAMP = "auto"
+
+# Win32 (kernel32)
+_STD_OUTPUT_HANDLE = -11
+_STD_ERROR_HANDLE = -12
+_ATTACH_PARENT_PROCESS = -1
+
+
+def expand_inputs(
+    inputs: List[str],
+    include: Sequence[str] = DEFAULT_INCLUDE,
+    exclude: Sequence[str] = (),
+) -> List[str]:
+    """
+    Expandiert Glob-Muster, Ordner und ``@listfile``-Angaben zu einer Dateiliste.
+
+    Ordner werden rekursiv durchsucht (core.folderscan); dabei gelten
+    ``include`` und ``exclude``.
+
+    Eine Listendatei enthält einen Pfad oder ein Muster pro Zeile; leere
+    Zeilen und Zeilen mit ``#`` werden ignoriert. Muster ohne Treffer
+    bleiben ausgeschlossen, einfache Pfade werden unverändert übernommen
+    (die Vorabprüfung meldet fehlende Dateien). Duplikate werden entfernt,
+    die Reihenfolge bleibt erhalten.
+
+    Raises:
+        OSError: wenn eine Listendatei nicht lesbar ist
+    """
+    files: List[str] = []
+    seen = set()
+
+    def _add(path: str) -> None:
+        key = os.path.normcase(os.path.abspath(path))
+        if key not in seen:
+            seen.add(key)
+            files.append(path)
+
+    def _expand(entry: str) -> None:
+        if glob.has_magic(entry):
+            for match in sorted(glob.glob(entry, recursive=True)):
+                if os.path.isfile(match):
+                    _add(match)
+        elif os.path.isdir(entry):
+            for chunk in scan_folder(entry, include, exclude):
+                for path in chunk:
+                    _add(path)
+        else:
+            _add(entry)
+
+    for item in inputs:
+        if item.startswith("@"):
+            with open(item[1:], "r", encoding="utf-8-sig") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        _expand(line)
+        else:
+            _expand(item)
+    return files
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Erstellt den Argument-Parser der Kommandozeile."""
+    parser = argparse.ArgumentParser(
+        prog="signit --cli",
+        description="Signiert Dateien mit signtool.exe ohne GUI. "
+        "Ausgabe: eine JSON-Zeile pro Datei auf stdout.",
+    )
+    parser.add_argument(
+        "files",
+        nargs="+",
+        help="Dateien, Ordner, Glob-Muster (z. B. 'dist/**/*.exe') oder @listfile",
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        metavar="MUSTER",
+        help="Nur passende Dateien aus Ordnern übernehmen, z. B. '*.dll' "
+        "(mehrfach möglich; Standard: alle signierbaren Formate)",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="MUSTER",
+        help="Dateien/Ordner beim Durchsuchen von Ordnern auslassen, "
+        "z. B. 'obj' oder 'tests/*' (mehrfach möglich)",
+    )
+    parser.add_argument(
+        "-t",
+        "--thumbprint",
+        default=os.environ.get("SIGNIT_THUMBPRINT"),
+        help="SHA-1-Thumbprint des Zertifikats (Standard: $SIGNIT_THUMBPRINT)",
+    )
+    parser.add_argument(
+        "--machine-store",
+        action="store_true",
+        help="Zertifikat im LocalMachine-Speicher suchen (signtool /sm)",
+    )
+    parser.add_argument(
+        "--timestamp-url",
+        default=TIMESTAMP_SERVERS[0][1],
+        help="Timestamp-Server-URL oder 'auto' für den schnellsten Server "
+        "(Standard: %(default)s)",
+    )
+    parser.add_argument(
+        "--signtool",
+        help="Pfad zu signtool.exe (Standard: automatische Suche)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=4,
+        help="Anzahl paralleler signtool-Prozesse (Standard: %(default)s)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Dateien pro signtool-Aufruf (Standard: %(default)s)",
+    )
+    parser.add_argument(
+        "--two-phase",
+        action="store_true",
+        help="Erst lokal signieren, danach Zeitstempel als eigene Stufe",
+    )
+    parser.add_argument(
+        "--no-retry",
+        action="store_true",
+        help="Vorübergehende Fehler nicht wiederholen",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Unveränderte, bereits mit diesem Zertifikat signierte Dateien überspringen",
+    )
+    parser.add_argument(
+        "--index",
+        help="Pfad des Signatur-Index für --skip-unchanged "
+        "(Standard: im Anwendungsdatenordner)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Journal führen und einen unterbrochenen Lauf mit denselben "
+        "Dateien und demselben Zertifikat fortsetzen",
+    )
+    parser.add_argument(
+        "--no-preflight",
+        action="store_true",
+        help="Vorabprüfung der Dateien überspringen",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Live-Ausgabe von signtool auf stderr",
+    )
+    return parser
+
+
+class _JsonLinesWriter:
+    """Schreibt JSON-Zeilen threadsicher und sofort (ohne Pufferung)."""
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict[str, object]) -> None:
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+
+def _result_record(result: SignResult) -> Dict[str, object]:
+    return {
+        "event": "result",
+        "file": result.file_path,
+        "success": result.success,
+        "skipped": result.skipped,
+        "return_code": result.return_code,
+        "error_class": result.error_class,
+        "error": result.error,
+        "attempts": result.attempts,
+        "timings": result.timings.to_dict(),
+    }
+
+
+def run(
+    argv: Optional[List[str]] = None,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> int:
+    """
+    Führt die Kommandozeile aus.
+
+    Args:
+        argv: Argumente ohne Programmnamen (Standard: ``sys.argv[1:]``)
+        stdout: Ziel der JSON-Zeilen (Standard: ``sys.stdout``)
+        stderr: Ziel für Meldungen und Log (Standard: ``sys.stderr``)
+
+    Returns:
+        Exit-Code (siehe Modul-Docstring)
+    """
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return EXIT_USAGE if e.code else EXIT_OK
+
+    def _err(msg: str) -> None:
+        stderr.write(f"signit: {msg}\n")
+        stderr.flush()
+
+    if not args.thumbprint:
+        _err("kein Thumbprint angegeben (-t oder $SIGNIT_THUMBPRINT)")
+        return EXIT_USAGE
+    if args.workers < 1 or args.batch_size < 1:
+        _err("--workers und --batch-size müssen mindestens 1 sein")
+        return EXIT_USAGE
+    thumbprint = args.thumbprint.replace(" ", "").upper()
+
+    signtool_path = args.signtool or find_signtool()
+    if not signtool_path or not validate_signtool(signtool_path):
+        _err(f"signtool.exe nicht gefunden: {signtool_path or '(automatische Suche)'}")
+        return EXIT_ENVIRONMENT
+
+    try:
+        files = expand_inputs(
+            args.files, args.include or DEFAULT_INCLUDE, args.exclude
+        )
+    except OSError as e:
+        _err(f"Listendatei nicht lesbar: {e}")
+        return EXIT_ENVIRONMENT
+    if not files:
+        _err("keine Dateien gefunden")
+        return EXIT_ENVIRONMENT
+
+    out = _JsonLinesWriter(stdout)
+    start = time.monotonic()
+    results: List[SignResult] = []
+
+    # Dateien mit Fehlern in der Vorabprüfung gar nicht erst an signtool geben
+    if not args.no_preflight:
+        report = run_preflight(files)
+        for issue in report.issues:
+            out.write(
+                {
+                    "event": "preflight",
+                    "file": issue.file_path,
+                    "code": issue.code,
+                    "severity": issue.severity,
+                    "message": issue.message,
+                }
+            )
+        failed = report.failed_files
+        for fp in files:
+            if fp in failed:
+                messages = [i.message for i in report.errors if i.file_path == fp]
+                result = SignResult(
+                    file_path=fp,
+                    success=False,
+                    return_code=-1,
+                    output="",
+                    error="; ".join(messages),
+                    error_class="preflight",
+                )
+                results.append(result)
+                out.write(_result_record(result))
+        files = [fp for fp in files if fp not in failed]
+
+    selector: Optional[TimestampSelector] = None
+    timestamp_url = args.timestamp_url
+    if timestamp_url.lower() == AUTO_TIMESTAMP:
+        selector = TimestampSelector([url for _, url in TIMESTAMP_SERVERS])
+        # Nur Platzhalter – choose() würde eine Test-Anfrage belegen
+        timestamp_url = selector.urls[0]
+
+    sign_index: Optional[SignIndex] = None
+    if args.skip_unchanged:
+        sign_index = SignIndex(args.index) if args.index else SignIndex()
+
+    signer = Signer(
+        signtool_path,
+        max_workers=args.workers,
+        batch_size=args.batch_size,
+        two_phase=args.two_phase,
+        timestamp_selector=selector,
+        retry_policy=None if args.no_retry else RetryPolicy(),
+        sign_index=sign_index,
+        machine_store=args.machine_store,
+        journal=SigningJournal() if args.resume else None,
+    )
+
+    def _on_log(msg: str) -> None:
+        stderr.write(msg.strip("\n") + "\n")
+
+    def _on_throughput(snapshot: ThroughputSnapshot) -> None:
+        if snapshot.files_per_minute is not None:
+            _on_log(
+                f"[{snapshot.done}/{snapshot.total}] "
+                f"{snapshot.files_per_minute:.1f} Dateien/min, "
+                f"Restzeit ca. {format_duration(snapshot.eta)}"
+            )
+
+    if files:
+        signed: List[SignResult] = []
+        done = threading.Event()
+        cancel = CancelToken()
+
+        def _on_complete(batch_results: List[SignResult]) -> None:
+            signed.extend(batch_results)
+            done.set()
+
+        def _wait() -> None:
+            # Kurze Timeouts, damit Strg+C auch unter Windows ankommt; kein
+            # Thread.join(), das nach KeyboardInterrupt vorzeitig zurückkehrt
+            while not done.wait(0.2) and thread.is_alive():
+                pass
+
+        thread = signer.sign_files(
+            files=files,
+            thumbprint=thumbprint,
+            timestamp_url=timestamp_url,
+            on_log=_on_log if args.verbose else None,
+            on_result=lambda r: out.write(_result_record(r)),
+            on_complete=_on_complete,
+            on_throughput=_on_throughput if args.verbose else None,
+            cancel=cancel,
+        )
+        try:
+            _wait()
+        except KeyboardInterrupt:
+            _err("Abbruch – laufende signtool-Prozesse werden beendet")
+            cancel.cancel()
+            try:
+                _wait()
+            except KeyboardInterrupt:
+                # Zweites Strg+C: nicht länger auf die Worker warten
+                _err("Abbruch erzwungen – Zusammenfassung entfällt")
+                return EXIT_CANCELLED
+        results.extend(signed)
+
+    cancelled_count = sum(1 for r in results if r.error_class == ERROR_CANCELLED)
+    failed_count = sum(1 for r in results if not r.success) - cancelled_count
+    duration = time.monotonic() - start
+    signed_count = sum(1 for r in results if r.success and not r.skipped)
+    mean = SignTimings.mean(
+        r.timings
+        for r in results
+        if not r.skipped and r.error_class not in ("preflight", ERROR_CANCELLED)
+    )
+    out.write(
+        {
+            "event": "summary",
+            "total": len(results),
+            "succeeded": signed_count,
+            "skipped": sum(1 for r in results if r.skipped),
+            "failed": failed_count,
+            "cancelled": cancelled_count,
+            "duration": round(duration, 3),
+            "files_per_minute": (
+                round(signed_count / duration * 60, 1) if duration else None
+            ),
+            "mean_timings": mean.to_dict() if mean else None,
+        }
+    )
+    if cancelled_count:
+        return EXIT_CANCELLED
+    return EXIT_FAILED if failed_count else EXIT_OK
+
+
+def _open_std_handle(std_handle: int) -> Optional[TextIO]:
+    """Umgeleitetes Standard-Handle (Datei, Pipe) als Textstrom, sonst None."""
+    import ctypes
+    import msvcrt
+
+    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    kernel32.GetStdHandle.restype = ctypes.c_ssize_t
+    handle = kernel32.GetStdHandle(std_handle)
+    if handle in (0, -1):
+        return None
+    try:
+        fd = msvcrt.open_osfhandle(handle, os.O_WRONLY)  # type: ignore[attr-defined]
+        return os.fdopen(fd, "w", encoding="utf-8", errors="replace", buffering=1)
+    except OSError:
+        return None
+
+
+def _open_console() -> Optional[TextIO]:
+    """Konsole des aufrufenden Prozesses (cmd, PowerShell) zum Schreiben."""
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    # Schlägt fehl, wenn bereits verbunden – CONOUT$ funktioniert dann trotzdem
+    kernel32.AttachConsole(_ATTACH_PARENT_PROCESS)
+    try:
+        return open(
+            "CONOUT$",
+            "w",
+            encoding=f"cp{kernel32.GetConsoleOutputCP()}",
+            errors="replace",
+            buffering=1,
+        )
+    except (OSError, LookupError):
+        return None
+
+
+def attach_console() -> None:
+    """
+    Stellt ``sys.stdout``/``sys.stderr`` bereit, falls sie fehlen.
+
+    In der mit ``console=False`` gebauten EXE sind beide None. Umgeleitete
+    Handles werden übernommen, sonst wird in die Konsole des Aufrufers
+    geschrieben; ohne Konsole (z. B. Start per Doppelklick) wird die
+    Ausgabe verworfen, statt beim ersten ``write`` abzustürzen.
+    """
+    for name, std_handle in (
+        ("stdout", _STD_OUTPUT_HANDLE),
+        ("stderr", _STD_ERROR_HANDLE),
+    ):
+        if getattr(sys, name) is not None:
+            continue
+        stream: Optional[TextIO] = None
+        if os.name == "nt":
+            stream = _open_std_handle(std_handle) or _open_console()
+        setattr(sys, name, stream or open(os.devnull, "w", encoding="utf-8"))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Konsolen-Einstiegspunkt: beendet den Prozess mit dem Exit-Code."""
+    attach_console()
+    sys.exit(run(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Let's Do. | SignIT – Minimaler DER/BER-Leser.
+
+Zerlegt ASN.1-Strukturen (Tag, Länge, Inhalt) direkt über einem
+bytes-Puffer, ohne Kopien und ohne externe Abhängigkeiten. Grundlage für
+das Auslesen von Authenticode-Signaturen und X.509-Zertifikaten.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, List, NamedTuple, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Universelle Tags (inkl. Constructed-Bit, wie sie im Datenstrom stehen)
+TAG_BOOLEAN = 0x01
+TAG_INTEGER = 0x02
+TAG_BIT_STRING = 0x03
+TAG_OCTET_STRING = 0x04
+TAG_NULL = 0x05
+TAG_OID = 0x06
+TAG_UTF8_STRING = 0x0C
+TAG_PRINTABLE_STRING = 0x13
+TAG_T61_STRING = 0x14
+TAG_IA5_STRING = 0x16
+TAG_UTC_TIME = 0x17
+TAG_GENERALIZED_TIME = 0x18
+TAG_BMP_STRING = 0x1E
+TAG_SEQUENCE = 0x30
+TAG_SET = 0x31
+
+
+def context_tag(number: int, constructed: bool = True) -> int:
+    """Tag eines kontextspezifischen Elements ([0], [1], ...)."""
+    return 0x80 | (0x20 if constructed else 0) | number
+
+
+class Element(NamedTuple):
+    """Ein TLV-Element: Positionen beziehen sich auf den Gesamtpuffer."""
+
+    tag: int
+    start: int  # Beginn des Tags
+    content: int  # Beginn des Inhalts
+    end: int  # Ende des Inhalts (exklusive End-of-Contents bei BER)
+    stop: int  # Ende des gesamten Elements
+
+    @property
+    def constructed(self) -> bool:
+        return bool(self.tag & 0x20)
+
+
+def parse(data: Buffer, offset: int = 0) -> Element:
+    """
+    Liest das Element an ``offset``.
+
+    Unterstützt definite Längen sowie BER-Elemente mit indefiniter Länge
+    (manche Signaturwerkzeuge erzeugen diese in PKCS#7-Strukturen).
+
+    Raises:
+        ValueError: bei abgeschnittenen oder ungültigen Daten
+    """
+    size = len(data)
+    if offset + 2 > size:
+        raise ValueError("DER: Element abgeschnitten")
+
+    tag = data[offset]
+    pos = offset + 1
+    if tag & 0x1F == 0x1F:
+        # Mehrbyte-Tagnummer: überspringen, Tag bleibt das erste Byte
+        while pos < size and data[pos] & 0x80:
+            pos += 1
+        pos += 1
+
+    if pos >= size:
+        raise ValueError("DER: Länge fehlt")
+    first = data[pos]
+    pos += 1
+
+    if first < 0x80:
+        length = first
+    elif first == 0x80:
+        if not tag & 0x20:
+            raise ValueError("DER: indefinite Länge bei primitivem Element")
+        # Kinder bis zum End-of-Contents (00 00) lesen
+        child = pos
+        while True:
+            if child + 2 > size:
+                raise ValueError("DER: End-of-Contents fehlt")
+            if data[child] == 0 and data[child + 1] == 0:
+                return Element(tag, offset, pos, child, child + 2)
+            child = parse(data, child).stop
+    else:
+        num = first & 0x7F
+        if num > 8 or pos + num > size:
+            raise ValueError("DER: ungültige Längenangabe")
+        length = int.from_bytes(bytes(data[pos : pos + num]), "big")
+        pos += num
+
+    end = pos + length
+    if end > size:
+        raise ValueError("DER: Inhalt abgeschnitten")
+    return Element(tag, offset, pos, end, end)
+
+
+def iter_children(data: Buffer, element: Element) -> Iterator[Element]:
+    """Iteriert über die direkten Kinder eines zusammengesetzten Elements."""
+    pos = element.content
+    while pos < element.end:
+        child = parse(data, pos)
+        yield child
+        pos = child.stop
+
+
+def children(data: Buffer, element: Element) -> List[Element]:
+    """Direkte Kinder eines zusammengesetzten Elements als Liste."""
+    return list(iter_children(data, element))
+
+
+def content_bytes(data: Buffer, element: Element) -> bytes:
+    """Inhalt eines Elements als bytes."""
+    return bytes(data[element.content : element.end])
+
+
+def raw_bytes(data: Buffer, element: Element) -> bytes:
+    """Das vollständige Element inkl. Tag und Länge als bytes."""
+    return bytes(data[element.start : element.stop])
+
+
+def decode_oid(raw: bytes) -> str:
+    """Dekodiert den Inhalt eines OBJECT IDENTIFIER in Punktnotation."""
+    if not raw:
+        return ""
+    parts: List[int] = []
+    value = 0
+    for byte in raw:
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            parts.append(value)
+            value = 0
+    first = parts[0]
+    if first < 40:
+        head = [0, first]
+    elif first < 80:
+        head = [1, first - 40]
+    else:
+        head = [2, first - 80]
+    return ".".join(str(p) for p in head + parts[1:])
+
+
+def read_oid(data: Buffer, element: Element) -> str:
+    """Liest ein OID-Element (prüft den Tag)."""
+    if element.tag != TAG_OID:
+        raise ValueError("DER: OID erwartet")
+    return decode_oid(content_bytes(data, element))
@@ -0,0 +1,164 @@
+"""
+Let's Do. | SignIT – Datei-Metadaten im Hintergrund.
+
+Ermittelt Größe, Änderungszeit und Lesbarkeit der ausgewählten Dateien in
+einem Thread-Pool und hält sie in einem Cache nach Pfad. Die Dateiliste
+zeigt Zeilen sofort mit Platzhalter an und füllt sie, sobald die Werte
+vorliegen – auf Netzlaufwerken blockiert kein ``stat`` mehr den
+UI-Thread. Ein Eintrag wird erst nach ``invalidate`` erneut geprüft
+(z. B. nach dem Signieren oder wenn das Fenster wieder den Fokus bekommt),
+dann aber nur beim nächsten Zugriff, also für die sichtbaren Zeilen;
+``on_update`` meldet nur tatsächliche Änderungen (neue Datei, geänderte
+mtime/Größe/Lesbarkeit).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from core.fileset import file_key
+
+DEFAULT_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class FileMeta:
+    """Metadaten einer Datei zum Zeitpunkt ``checked_at``."""
+
+    size: Optional[int]
+    mtime_ns: Optional[int]
+    readable: bool
+    error: str = ""  # z. B. "Datei nicht gefunden"
+    checked_at: float = 0.0  # time.monotonic()
+
+    def same_state(self, other: "FileMeta") -> bool:
+        """Gleicher Dateizustand (ohne Prüfzeitpunkt)."""
+        return (self.size, self.mtime_ns, self.readable, self.error) == (
+            other.size,
+            other.mtime_ns,
+            other.readable,
+            other.error,
+        )
+
+
+def stat_file(path: str) -> FileMeta:
+    """Liest die Metadaten einer Datei (blockierend)."""
+    now = time.monotonic()
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return FileMeta(None, None, False, "Datei nicht gefunden", now)
+    except OSError as e:
+        return FileMeta(None, None, False, e.strerror or str(e), now)
+    return FileMeta(st.st_size, st.st_mtime_ns, os.access(path, os.R_OK), "", now)
+
+
+class FileMetaService:
+    """
+    Thread-Pool mit Cache für Datei-Metadaten.
+
+    Verwendung:
+        meta = FileMetaService(on_update=lambda path, m: ...)
+        meta.prefetch(paths)        # im Hintergrund
+        m = meta.get(path)          # sofort: FileMeta oder None
+        meta.invalidate()           # Dateien können sich geändert haben
+
+    ``on_update`` wird in einem Worker-Thread aufgerufen.
+    """
+
+    def __init__(
+        self,
+        on_update: Optional[Callable[[str, FileMeta], None]] = None,
+        max_workers: int = DEFAULT_WORKERS,
+    ):
+        self.on_update = on_update
+        self.max_workers = max_workers
+        self._cache: Dict[str, FileMeta] = {}
+        self._stale: Set[str] = set()  # beim nächsten Zugriff neu prüfen
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def get(self, path: str) -> Optional[FileMeta]:
+        """
+        Gecachte Metadaten (ohne Dateizugriff).
+
+        Fehlt der Eintrag oder wurde er mit ``invalidate`` als veraltet
+        markiert, wird er im Hintergrund (neu) ermittelt; bis dahin bleibt
+        der alte Wert sichtbar.
+        """
+        key = file_key(path)
+        with self._lock:
+            meta = self._cache.get(key)
+            refresh = meta is None or key in self._stale
+        if refresh:
+            self.prefetch([path])
+        return meta
+
+    def invalidate(self, paths: Optional[Iterable[str]] = None) -> None:
+        """
+        Markiert Einträge als veraltet (ohne Dateizugriff).
+
+        Args:
+            paths: betroffene Pfade (Standard: alle gecachten)
+        """
+        with self._lock:
+            if paths is None:
+                self._stale.update(self._cache)
+            else:
+                self._stale.update(file_key(p) for p in paths)
+
+    def prefetch(self, paths: Iterable[str]) -> None:
+        """Ermittelt die Metadaten der Pfade im Hintergrund."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="signit-filemeta"
+                )
+            for path in paths:
+                key = file_key(path)
+                if key in self._pending:
+                    continue
+                self._pending.add(key)
+                # Erst jetzt: ein invalidate während der Abfrage bleibt gültig
+                self._stale.discard(key)
+                self._pool.submit(self._refresh, path, key)
+
+    def _refresh(self, path: str, key: str) -> None:
+        meta = stat_file(path)
+        with self._lock:
+            if key not in self._pending:
+                return  # inzwischen entfernt (forget)
+            self._pending.discard(key)
+            previous = self._cache.get(key)
+            self._cache[key] = meta
+        if self.on_update and (previous is None or not previous.same_state(meta)):
+            self.on_update(path, meta)
+
+    def forget(self, paths: Iterable[str]) -> None:
+        """Entfernt Pfade aus dem Cache (z. B. aus der Liste gelöscht)."""
+        with self._lock:
+            for path in paths:
+                key = file_key(path)
+                self._cache.pop(key, None)
+                self._stale.discard(key)
+                self._pending.discard(key)
+
+    def clear(self) -> None:
+        """Leert den Cache; laufende Abfragen werden verworfen."""
+        with self._lock:
+            self._cache.clear()
+            self._stale.clear()
+            self._pending.clear()
+
+    def shutdown(self) -> None:
+        """Beendet den Thread-Pool, ohne auf offene Abfragen zu warten."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,132 @@
+"""
+Let's Do. | SignIT – Geordnete Dateimenge für die Dateiliste.
+
+Hält die ausgewählten Dateien in Einfügereihenfolge mit einem Hash-Index
+für O(1)-Duplikatprüfung. Änderungen liefern ein FileSetDiff mit den
+hinzugefügten bzw. entfernten Pfaden, sodass Oberfläche und Beobachter
+nicht die gesamte Liste kopieren oder neu aufbauen müssen.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def file_key(path: str) -> str:
+    """Vergleichsschlüssel eines Pfads (normpath + normcase)."""
+    return os.path.normcase(os.path.normpath(path))
+
+
+@dataclass(frozen=True)
+class FileSetDiff:
+    """Änderung einer FileSet-Instanz."""
+
+    added: Tuple[str, ...] = ()
+    removed: Tuple[str, ...] = ()
+    cleared: bool = False  # alle Dateien entfernt
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+class FileSet(Sequence):
+    """
+    Geordnete Menge von Dateipfaden mit Index nach ``file_key``.
+
+    - ``in``, Hinzufügen und Entfernen: O(1) (Entfernen hinterlässt
+      Lücken, die beim nächsten Indexzugriff in einem Durchlauf
+      zusammengeschoben werden)
+    - Indexzugriff ``files[i]`` für virtualisierte Listen
+    - Nicht threadsicher; nur im UI-Thread verwenden
+
+    Pfade werden mit ``os.path.normpath`` gespeichert.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()):
+        self._items: List[Optional[str]] = []
+        self._index: Dict[str, int] = {}
+        self._holes = 0
+        self.add_many(paths)
+
+    # ------------------------------------------------------------------
+    # Lesen
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, str) and file_key(path) in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return (p for p in self._items if p is not None)
+
+    def __getitem__(self, index):
+        self._compact()
+        return self._items[index]
+
+    def index(self, path: str, *args) -> int:
+        """Position eines Pfads (ValueError, wenn nicht enthalten)."""
+        self._compact()
+        position = self._index.get(file_key(path))
+        if position is None:
+            raise ValueError(f"{path} ist nicht in der Dateiliste")
+        return position
+
+    def to_list(self) -> List[str]:
+        """Kopie der Pfade in Einfügereihenfolge."""
+        return list(self)
+
+    def _compact(self) -> None:
+        if not self._holes:
+            return
+        self._items = [p for p in self._items if p is not None]
+        self._index = {file_key(p): i for i, p in enumerate(self._items)}
+        self._holes = 0
+
+    # ------------------------------------------------------------------
+    # Ändern
+    # ------------------------------------------------------------------
+    def add_many(self, paths: Iterable[str]) -> FileSetDiff:
+        """Fügt Pfade am Ende hinzu; bereits enthaltene werden ignoriert."""
+        added: List[str] = []
+        for path in paths:
+            path = os.path.normpath(path)
+            key = file_key(path)
+            if key in self._index:
+                continue
+            self._index[key] = len(self._items)
+            self._items.append(path)
+            added.append(path)
+        return FileSetDiff(added=tuple(added))
+
+    def add(self, path: str) -> FileSetDiff:
+        return self.add_many([path])
+
+    def remove_many(self, paths: Iterable[str]) -> FileSetDiff:
+        """Entfernt Pfade; nicht enthaltene werden ignoriert."""
+        removed: List[str] = []
+        for path in paths:
+            position = self._index.pop(file_key(path), None)
+            if position is None:
+                continue
+            removed.append(self._items[position])
+            self._items[position] = None
+            self._holes += 1
+        if self._holes and not self._index:
+            self._items.clear()
+            self._holes = 0
+        return FileSetDiff(removed=tuple(removed))
+
+    def remove(self, path: str) -> FileSetDiff:
+        return self.remove_many([path])
+
+    def clear(self) -> FileSetDiff:
+        """Entfernt alle Pfade."""
+        removed = tuple(self)
+        self._items.clear()
+        self._index.clear()
+        self._holes = 0
+        return FileSetDiff(removed=removed, cleared=bool(removed))
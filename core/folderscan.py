@@ -0,0 +1,215 @@
+"""
+Let's Do. | SignIT – Ordner rekursiv nach signierbaren Dateien durchsuchen.
+
+Iterativer Durchlauf per ``os.scandir`` (ohne Symlinks auf Ordner zu
+folgen). Include-/Exclude-Muster werden je in einen einzigen regulären
+Ausdruck übersetzt; ausgeschlossene Ordner werden gar nicht erst
+betreten. Treffer werden in Blöcken geliefert, damit die Dateiliste schon
+während des Durchlaufs wächst, und der Durchlauf lässt sich abbrechen.
+
+Muster ohne ``/`` gelten für den Datei- bzw. Ordnernamen (``*.dll``,
+``obj``), Muster mit ``/`` für den Pfad relativ zum Startordner
+(``tests/*``). Groß-/Kleinschreibung wird ignoriert.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional, Pattern, Sequence
+
+from core.preflight import FORMAT_MAGIC
+
+# Alle Formate mit bekannter Signatur-Struktur (siehe core.preflight)
+DEFAULT_INCLUDE = tuple(f"*{ext}" for ext in FORMAT_MAGIC)
+DEFAULT_EXCLUDE: tuple = ()
+DEFAULT_CHUNK_SIZE = 500
+_PATTERN_SEPARATORS = re.compile(r"[;,]")
+
+
+def _compile(patterns: Sequence[str]) -> Optional[Pattern[str]]:
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(p)})" for p in patterns), re.IGNORECASE
+    )
+
+
+def split_patterns(text: str) -> List[str]:
+    """Zerlegt eine Eingabe wie ``"*.dll; *.exe"`` in einzelne Muster."""
+    return [p.strip() for p in _PATTERN_SEPARATORS.split(text) if p.strip()]
+
+
+class PatternMatcher:
+    """Glob-Muster, übersetzt in je einen regulären Ausdruck für Name und Pfad."""
+
+    def __init__(self, patterns: Sequence[str]):
+        patterns = [p.replace("\\", "/").strip() for p in patterns if p.strip()]
+        self._name = _compile([p for p in patterns if "/" not in p])
+        self._path = _compile([p for p in patterns if "/" in p])
+
+    def __bool__(self) -> bool:
+        return self._name is not None or self._path is not None
+
+    def matches(self, name: str, relpath: str) -> bool:
+        """
+        Args:
+            name: Datei- oder Ordnername
+            relpath: Pfad relativ zum Startordner, mit ``/`` getrennt
+        """
+        return bool(
+            (self._name is not None and self._name.match(name))
+            or (self._path is not None and self._path.match(relpath))
+        )
+
+
+@dataclass
+class ScanStats:
+    """Zähler eines Ordnerdurchlaufs."""
+
+    directories: int = 0
+    entries: int = 0
+    matched: int = 0
+    cancelled: bool = False
+    errors: List[str] = field(default_factory=list)
+
+
+def scan_folder(
+    root: str,
+    include: Sequence[str] = DEFAULT_INCLUDE,
+    exclude: Sequence[str] = DEFAULT_EXCLUDE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cancel: Optional[threading.Event] = None,
+    stats: Optional[ScanStats] = None,
+) -> Iterator[List[str]]:
+    """
+    Durchsucht ``root`` rekursiv und liefert Treffer in Blöcken.
+
+    Args:
+        root: Startordner
+        include: Muster, von denen eine Datei mindestens eines erfüllen muss
+                 (leer = alle Dateien)
+        exclude: Muster für auszuschließende Dateien und Ordner
+        chunk_size: Pfade pro Block
+        cancel: bricht den Durchlauf ab, sobald gesetzt
+        stats: wird während des Durchlaufs aktualisiert
+
+    Yields:
+        Listen von Dateipfaden (innerhalb eines Ordners alphabetisch)
+    """
+    include_matcher = PatternMatcher(include)
+    exclude_matcher = PatternMatcher(exclude)
+    stats = stats if stats is not None else ScanStats()
+    root = os.path.normpath(root)
+
+    chunk: List[str] = []
+    stack = [(root, "")]
+    while stack:
+        if cancel is not None and cancel.is_set():
+            stats.cancelled = True
+            return
+        directory, rel_dir = stack.pop()
+        stats.directories += 1
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name.lower())
+        except OSError as e:
+            stats.errors.append(f"{directory}: {e.strerror or e}")
+            continue
+
+        subdirs = []
+        for entry in entries:
+            stats.entries += 1
+            relpath = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+            if exclude_matcher and exclude_matcher.matches(entry.name, relpath):
+                continue
+            if is_dir:
+                subdirs.append((entry.path, relpath))
+            elif is_file and (
+                not include_matcher or include_matcher.matches(entry.name, relpath)
+            ):
+                chunk.append(entry.path)
+                stats.matched += 1
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+        # Umgekehrt auf den Stapel, damit Unterordner alphabetisch folgen
+        stack.extend(reversed(subdirs))
+
+    if chunk:
+        yield chunk
+
+
+class FolderScan:
+    """
+    Ordnerdurchlauf in einem eigenen Thread.
+
+    Verwendung:
+        scan = FolderScan(root, on_chunk=..., on_complete=...)
+        scan.start()
+        scan.cancel()   # optional
+
+    ``on_chunk(paths)`` und ``on_complete(stats)`` laufen im Scan-Thread.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        include: Sequence[str] = DEFAULT_INCLUDE,
+        exclude: Sequence[str] = DEFAULT_EXCLUDE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_chunk: Optional[Callable[[List[str]], None]] = None,
+        on_complete: Optional[Callable[[ScanStats], None]] = None,
+    ):
+        self.root = root
+        self.include = include
+        self.exclude = exclude
+        self.chunk_size = chunk_size
+        self.on_chunk = on_chunk
+        self.on_complete = on_complete
+        self.stats = ScanStats()
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> threading.Thread:
+        """Startet den Durchlauf im Hintergrund."""
+        self._thread = threading.Thread(
+            target=self._run, name="signit-folderscan", daemon=True
+        )
+        self._thread.start()
+        return self._thread
+
+    def cancel(self) -> None:
+        """Bricht den Durchlauf ab (bereits gelieferte Blöcke bleiben gültig)."""
+        self._cancel.set()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        try:
+            for chunk in scan_folder(
+                self.root,
+                self.include,
+                self.exclude,
+                self.chunk_size,
+                cancel=self._cancel,
+                stats=self.stats,
+            ):
+                if self._cancel.is_set():
+                    self.stats.cancelled = True
+                    break
+                if self.on_chunk:
+                    self.on_chunk(chunk)
+        finally:
+            if self.on_complete:
+                self.on_complete(self.stats)
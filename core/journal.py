@@ -0,0 +1,294 @@
+"""
+Let's Do. | SignIT – Absturzsicheres Signier-Journal.
+
+Jeder Signiervorgang schreibt pro fertiger Datei eine JSON-Zeile in ein
+Journal (nur anhängen). ``fsync`` erfolgt gebündelt – nach
+``sync_every`` Zeilen oder spätestens nach ``sync_interval`` Sekunden –,
+sodass auch ein Absturz des Rechners höchstens die letzten Ergebnisse
+kostet. Ein vollständig abgeschlossener Vorgang löscht sein Journal.
+
+Startet ein Vorgang erneut mit derselben Dateimenge und demselben
+Zertifikat, liefert das Journal die bereits signierten Dateien; sie
+werden nur übernommen, wenn Größe und Änderungszeit noch dem Stand nach
+der Signatur entsprechen.
+
+Aufbau einer Journal-Datei (``journals/<id>.jsonl``):
+    {"event": "start", "version": 1, "thumbprint": ..., "files": 3000, ...}
+    {"event": "result", "file": ..., "success": true, "size": ..., ...}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+from core.fileset import file_key
+from core.utils import get_app_data_dir
+
+JOURNAL_DIRNAME = "journals"
+JOURNAL_VERSION = 1
+
+DEFAULT_SYNC_EVERY = 32  # Zeilen
+DEFAULT_SYNC_INTERVAL = 1.0  # Sekunden
+
+
+def batch_id(files: Iterable[str], thumbprint: str) -> str:
+    """Kennung eines Vorgangs: Zertifikat + Dateimenge (ohne Reihenfolge)."""
+    digest = hashlib.sha256(thumbprint.replace(" ", "").upper().encode("ascii"))
+    for key in sorted({file_key(os.path.abspath(fp)) for fp in files}):
+        digest.update(b"\0" + key.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()[:24]
+
+
+def _file_state(file_path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+@dataclass
+class JournalState:
+    """Inhalt eines vorhandenen Journals."""
+
+    path: Path
+    started_at: str
+    total: int
+    done: Dict[str, str]  # file_key -> Pfad der unverändert signierten Dateien
+    failed: int  # zuletzt fehlgeschlagene Dateien
+
+    def is_done(self, file_path: str) -> bool:
+        return file_key(os.path.abspath(file_path)) in self.done
+
+
+def read_journal(path: Path, thumbprint: str) -> Optional[JournalState]:
+    """
+    Liest ein Journal; None, wenn es fehlt, unlesbar ist oder nicht zum
+    Zertifikat passt. Eine abgeschnittene letzte Zeile wird ignoriert.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+    if not lines:
+        return None
+    try:
+        header = json.loads(lines[0])
+    except ValueError:
+        return None
+    if (
+        header.get("event") != "start"
+        or header.get("version") != JOURNAL_VERSION
+        or header.get("thumbprint") != thumbprint.replace(" ", "").upper()
+    ):
+        return None
+
+    latest: Dict[str, dict] = {}
+    for line in lines[1:]:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue  # abgeschnitten (Absturz während des Schreibens)
+        if record.get("event") == "result" and "file" in record:
+            latest[file_key(os.path.abspath(record["file"]))] = record
+
+    done: Dict[str, str] = {}
+    failed = 0
+    for key, record in latest.items():
+        if not record.get("success"):
+            failed += 1
+        elif _file_state(record["file"]) == (
+            record.get("size"),
+            record.get("mtime_ns"),
+        ):
+            done[key] = record["file"]
+    return JournalState(
+        path=path,
+        started_at=str(header.get("started_at", "")),
+        total=int(header.get("files", 0)),
+        done=done,
+        failed=failed,
+    )
+
+
+class JournalSession:
+    """
+    Offenes Journal eines laufenden Vorgangs (thread-sicher).
+
+    ``record`` schreibt sofort in den Dateipuffer; ``fsync`` erfolgt
+    gebündelt, zusätzlich prüft ein Hintergrund-Thread alle
+    ``sync_interval`` Sekunden, ob noch Zeilen ausstehen.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        stream: TextIO,
+        resumed: Optional[JournalState],
+        sync_every: int = DEFAULT_SYNC_EVERY,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+    ):
+        self.path = path
+        self.resumed = resumed
+        self.sync_every = max(1, sync_every)
+        self.sync_interval = sync_interval
+        self._stream = stream
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="signit-journal", daemon=True
+        )
+        self._flusher.start()
+
+    def is_done(self, file_path: str) -> bool:
+        """Wurde die Datei laut Journal bereits (unverändert) signiert?"""
+        return self.resumed is not None and self.resumed.is_done(file_path)
+
+    def record(self, result) -> None:
+        """Hängt das Ergebnis einer Datei (``SignResult``) an."""
+        record = {
+            "event": "result",
+            "file": os.path.abspath(result.file_path),
+            "success": result.success,
+            "error_class": result.error_class,
+            "at": datetime.now(timezone.utc).isoformat(),
+        }
+        if result.success:
+            state = _file_state(result.file_path)
+            if state is not None:
+                record["size"], record["mtime_ns"] = state
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+
+        with self._lock:
+            if self._closed.is_set():
+                return
+            self._stream.write(line)
+            self._unsynced += 1
+            if (
+                self._unsynced >= self.sync_every
+                or time.monotonic() - self._last_sync >= self.sync_interval
+            ):
+                self._sync()
+
+    def _sync(self) -> None:
+        # Aufrufer hält self._lock
+        self._stream.flush()
+        os.fsync(self._stream.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _flush_loop(self) -> None:
+        while not self._closed.wait(self.sync_interval):
+            with self._lock:
+                if self._unsynced and not self._closed.is_set():
+                    self._sync()
+
+    def close(self, complete: bool) -> None:
+        """
+        Schließt das Journal.
+
+        Args:
+            complete: Vorgang vollständig durchgelaufen – das Journal wird
+                      gelöscht; sonst bleibt es zum Fortsetzen erhalten.
+        """
+        with self._lock:
+            if self._closed.is_set():
+                return
+            self._closed.set()
+            try:
+                if self._unsynced:
+                    self._sync()
+            finally:
+                self._stream.close()
+        if complete:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+
+class SigningJournal:
+    """
+    Verwaltet die Journale im Anwendungsdatenordner.
+
+    Verwendung:
+        journal = SigningJournal()
+        state = journal.inspect(files, thumbprint)   # unterbrochener Vorgang?
+        session = journal.open(files, thumbprint)    # setzt ihn fort
+        for result in ...:
+            session.record(result)
+        session.close(complete=True)
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        sync_every: int = DEFAULT_SYNC_EVERY,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+    ):
+        self.directory = (
+            Path(directory) if directory else get_app_data_dir() / JOURNAL_DIRNAME
+        )
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+
+    def path_for(self, files: List[str], thumbprint: str) -> Path:
+        return self.directory / f"{batch_id(files, thumbprint)}.jsonl"
+
+    def inspect(self, files: List[str], thumbprint: str) -> Optional[JournalState]:
+        """Zustand eines unterbrochenen Vorgangs mit diesen Dateien (oder None)."""
+        return read_journal(self.path_for(files, thumbprint), thumbprint)
+
+    def discard(self, files: List[str], thumbprint: str) -> None:
+        """Verwirft das Journal dieser Dateimenge (Neustart statt Fortsetzen)."""
+        try:
+            os.remove(self.path_for(files, thumbprint))
+        except OSError:
+            pass
+
+    def open(self, files: List[str], thumbprint: str) -> JournalSession:
+        """
+        Öffnet das Journal eines Vorgangs; ein vorhandenes, passendes
+        Journal wird fortgesetzt, sonst neu angelegt.
+
+        Raises:
+            OSError: wenn das Journal nicht geschrieben werden kann
+        """
+        path = self.path_for(files, thumbprint)
+        resumed = read_journal(path, thumbprint)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        if resumed is not None:
+            # Abgeschnittene letzte Zeile abschließen
+            with open(path, "rb") as f:
+                f.seek(-1, os.SEEK_END)  # nicht leer, siehe read_journal
+                truncated = f.read(1) != b"\n"
+            stream = open(path, "a", encoding="utf-8")
+            if truncated:
+                stream.write("\n")
+        else:
+            stream = open(path, "w", encoding="utf-8")
+            header = {
+                "event": "start",
+                "version": JOURNAL_VERSION,
+                "thumbprint": thumbprint.replace(" ", "").upper(),
+                "files": len(files),
+                "started_at": datetime.now(timezone.utc).isoformat(),
+            }
+            stream.write(json.dumps(header) + "\n")
+            stream.flush()
+            os.fsync(stream.fileno())
+        return JournalSession(
+            path, stream, resumed, self.sync_every, self.sync_interval
+        )
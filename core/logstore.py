@@ -0,0 +1,262 @@
+"""
+Let's Do. | SignIT – Begrenzter Log-Speicher mit Datei-Mitschrift.
+
+Hält die Log-Zeilen außerhalb von Tk in einem Ringpuffer fester Größe
+(ältere Zeilen fallen heraus) und schreibt jede Zeile zusätzlich in eine
+rotierende Logdatei im Anwendungsdatenordner. Das Log-Panel stellt nur
+ein Fenster der neuesten Zeilen dar; der Export kopiert die Logdatei,
+statt den Inhalt des Textfelds auszulesen.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from core.utils import get_app_data_dir
+
+DEFAULT_CAPACITY = 50_000  # Zeilen im Speicher
+LOG_DIRNAME = "logs"
+LOG_FILENAME = "signit.log"
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+
+
+@dataclass
+class LogLine:
+    """Eine Zeile des Protokolls."""
+
+    seq: int  # fortlaufende Nummer seit Programmstart
+    time: str  # "HH:MM:SS"
+    message: str
+    tag: str = ""
+
+    def format(self) -> str:
+        """Zeile wie im Log-Panel, ohne Zeilenumbruch."""
+        return f"[{self.time}] {self.message}"
+
+
+class LogRing:
+    """
+    Ringpuffer fester Kapazität auf Basis einer vorab angelegten Liste.
+
+    Anhängen ist O(1); ist der Puffer voll, wird die älteste Zeile
+    überschrieben. Nicht threadsicher (siehe LogStore).
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity muss mindestens 1 sein")
+        self.capacity = capacity
+        self._items: List[Optional[LogLine]] = [None] * capacity
+        self._start = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, line: LogLine) -> None:
+        end = (self._start + self._count) % self.capacity
+        self._items[end] = line
+        if self._count < self.capacity:
+            self._count += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+    def tail(self, count: int) -> List[LogLine]:
+        """Die neuesten ``count`` Zeilen, älteste zuerst."""
+        count = min(count, self._count)
+        first = self._start + self._count - count
+        return [self._items[(first + i) % self.capacity] for i in range(count)]
+
+    def __iter__(self) -> Iterator[LogLine]:
+        return iter(self.tail(self._count))
+
+    def clear(self) -> None:
+        self._items = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+
+
+class RotatingLogFile:
+    """
+    Logdatei, die bei ``max_bytes`` rotiert (``signit.log.1`` … ``.N``).
+
+    Beim Öffnen wird eine vorhandene Datei der letzten Sitzung zur
+    Sicherung verschoben, sodass die aktuelle Datei nur diese Sitzung
+    enthält.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            self._rotate()
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._session_files = 1  # Dateien dieser Sitzung (aktuelle + rotierte)
+
+    @classmethod
+    def open_default(cls) -> Optional["RotatingLogFile"]:
+        """Logdatei im Anwendungsdatenordner oder None, wenn nicht möglich."""
+        try:
+            return cls(str(get_app_data_dir() / LOG_DIRNAME / LOG_FILENAME))
+        except OSError:
+            return None
+
+    def _backup(self, index: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.{index}")
+
+    def _rotate(self) -> None:
+        for index in range(self.backup_count, 0, -1):
+            source = self._backup(index - 1) if index > 1 else self.path
+            if source.exists():
+                os.replace(source, self._backup(index))
+
+    def write_lines(self, lines: Sequence[str]) -> None:
+        """Schreibt Zeilen und rotiert bei Bedarf."""
+        self._file.write("".join(line + "\n" for line in lines))
+        self._file.flush()
+        if self._file.tell() >= self.max_bytes and self.backup_count > 0:
+            self._file.close()
+            self._rotate()
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._session_files = min(self._session_files + 1, self.backup_count + 1)
+
+    def session_files(self) -> List[Path]:
+        """Alle Dateien dieser Sitzung, älteste zuerst."""
+        backups = [self._backup(i) for i in range(self._session_files - 1, 0, -1)]
+        return [p for p in backups if p.exists()] + [self.path]
+
+    def export(self, destination: str) -> None:
+        """Kopiert die Mitschrift dieser Sitzung nach ``destination``."""
+        self._file.flush()
+        with open(destination, "wb") as out:
+            for path in self.session_files():
+                with open(path, "rb") as f:
+                    shutil.copyfileobj(f, out)
+
+    def truncate(self) -> None:
+        """Verwirft die Mitschrift dieser Sitzung."""
+        for path in self.session_files()[:-1]:
+            path.unlink(missing_ok=True)
+        self._file.seek(0)
+        self._file.truncate()
+        self._session_files = 1
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class LogStore:
+    """
+    Threadsicherer Log-Speicher: Ringpuffer plus optionale Logdatei.
+
+    Verwendung:
+        store = LogStore(log_file=RotatingLogFile.open_default())
+        lines = store.extend([("Signiere: a.exe", "info")])
+        store.tail(2000)            # Fenster für die Anzeige
+        store.export("export.txt")  # kopiert die Logdatei
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        log_file: Optional[RotatingLogFile] = None,
+    ):
+        self._ring = LogRing(capacity)
+        self._log_file = log_file
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ring)
+
+    @property
+    def total(self) -> int:
+        """Anzahl aller bisher angehängten Zeilen (auch herausgefallener)."""
+        return self._seq
+
+    def extend(self, entries: Sequence[Tuple[str, str]]) -> List[LogLine]:
+        """
+        Hängt mehrere (Nachricht, Tag)-Zeilen an.
+
+        Returns:
+            die neuen LogLine-Objekte
+        """
+        now = datetime.now().strftime("%H:%M:%S")
+        with self._lock:
+            lines = []
+            for message, tag in entries:
+                self._seq += 1
+                line = LogLine(self._seq, now, message, tag)
+                self._ring.append(line)
+                lines.append(line)
+            if self._log_file is not None and lines:
+                try:
+                    self._log_file.write_lines([line.format() for line in lines])
+                except OSError:
+                    self._log_file = None  # Mitschrift aufgeben, Log läuft weiter
+        return lines
+
+    def append(self, message: str, tag: str = "") -> LogLine:
+        """Hängt eine Zeile an."""
+        return self.extend([(message, tag)])[0]
+
+    def tail(self, count: int) -> List[LogLine]:
+        """Die neuesten ``count`` Zeilen, älteste zuerst."""
+        with self._lock:
+            return self._ring.tail(count)
+
+    def text(self) -> str:
+        """Inhalt des Ringpuffers als Text (ohne abschließenden Umbruch)."""
+        with self._lock:
+            return "\n".join(line.format() for line in self._ring)
+
+    def export(self, destination: str) -> None:
+        """
+        Schreibt das Protokoll nach ``destination``.
+
+        Mit Logdatei wird diese kopiert (auch Zeilen, die aus dem Ringpuffer
+        herausgefallen sind, begrenzt durch die Rotation auf die neuesten
+        ``max_bytes × (backup_count + 1)``), sonst der Ringpuffer.
+
+        Raises:
+            OSError: wenn das Ziel nicht geschrieben werden kann
+        """
+        with self._lock:
+            if self._log_file is not None:
+                self._log_file.export(destination)
+                return
+            content = "\n".join(line.format() for line in self._ring)
+        with open(destination, "w", encoding="utf-8") as f:
+            f.write(content + "\n" if content else "")
+
+    def clear(self) -> None:
+        """Leert Ringpuffer und Mitschrift."""
+        with self._lock:
+            self._ring.clear()
+            if self._log_file is not None:
+                try:
+                    self._log_file.truncate()
+                except OSError:
+                    self._log_file = None
+
+    def close(self) -> None:
+        """Schließt die Logdatei."""
+        with self._lock:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
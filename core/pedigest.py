@@ -0,0 +1,142 @@
+"""
+Let's Do. | SignIT – Authenticode-Digest für PE-Dateien.
+
+Berechnet den Authenticode-Hash einer PE-Datei: über die gesamte Datei
+ohne das CheckSum-Feld, ohne den Security-Directory-Eintrag und ohne die
+Zertifikatstabelle. Die Datei wird per mmap eingeblendet und über
+memoryview-Ausschnitte gehasht – ohne Kopie in den Speicher. Da hashlib
+bei großen Puffern den GIL freigibt, skaliert digest_files() über Threads.
+
+signature_intact() vergleicht den Digest mit dem in der Signatur
+hinterlegten Wert; der SignIndex erkennt so Dateien, die bereits gültig
+signiert sind, und solche, die nach dem Signieren verändert wurden.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from core.authenticode import PeLayout, SignatureInfo, read_pe_layout
+
+
+@dataclass
+class DigestResult:
+    """Authenticode-Digest einer Datei (oder Fehlermeldung)."""
+
+    file_path: str
+    algorithm: str
+    digest: Optional[str] = None
+    error: str = ""
+
+
+def digest_ranges(layout: PeLayout) -> List[Tuple[int, int]]:
+    """
+    Liefert die gehashten Byte-Bereiche [start, end) einer PE-Datei.
+
+    Ausgenommen sind CheckSum (4 Bytes), der Security-Directory-Eintrag
+    (8 Bytes) und die Zertifikatstabelle.
+    """
+    checksum = layout.checksum_offset
+    security = layout.security_dir_offset
+    if layout.cert_table_offset:
+        data_end = layout.cert_table_offset
+        trailer = layout.cert_table_offset + layout.cert_table_size
+    else:
+        data_end = trailer = layout.file_size
+
+    ranges = [
+        (0, checksum),
+        (checksum + 4, security),
+        (security + 8, data_end),
+    ]
+    if trailer < layout.file_size:
+        # Daten hinter der Zertifikatstabelle (nicht spezifikationskonform)
+        ranges.append((trailer, layout.file_size))
+    return ranges
+
+
+def authenticode_digest(file_path: str, algorithm: str = "sha256") -> str:
+    """
+    Berechnet den Authenticode-Digest einer PE-Datei.
+
+    Bei unsignierten Dateien wird – wie beim Signieren durch signtool –
+    auf eine 8-Byte-Grenze mit Nullbytes aufgefüllt, sodass der Wert dem
+    Digest in der späteren Signatur entspricht.
+
+    Args:
+        file_path: Pfad zur PE-Datei
+        algorithm: hashlib-Algorithmus (z. B. 'sha256', 'sha1')
+
+    Returns:
+        Digest als Hex-String
+
+    Raises:
+        ValueError: wenn die Datei kein (gültiges) PE-Image ist
+        OSError: bei Lesefehlern
+    """
+    digest = hashlib.new(algorithm)
+    with open(file_path, "rb") as f:
+        layout = read_pe_layout(f)
+        if layout is None:
+            raise ValueError("Kein PE-Image")
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for start, end in digest_ranges(layout):
+                    if end > start:
+                        digest.update(view[start:end])
+            finally:
+                view.release()
+
+    if not layout.cert_table_offset:
+        digest.update(b"\0" * (-layout.file_size % 8))
+    return digest.hexdigest()
+
+
+def signature_intact(info: SignatureInfo) -> Optional[bool]:
+    """
+    Prüft, ob die eingebettete Signatur den aktuellen Dateiinhalt abdeckt.
+
+    Returns:
+        True/False, oder None wenn keine prüfbare Signatur vorliegt
+    """
+    if not info.signed_digest or not info.digest_algorithm:
+        return None
+    try:
+        actual = authenticode_digest(info.file_path, info.digest_algorithm)
+    except (OSError, ValueError):
+        return None
+    return actual == info.signed_digest
+
+
+def _digest_one(file_path: str, algorithm: str) -> DigestResult:
+    try:
+        return DigestResult(
+            file_path=file_path,
+            algorithm=algorithm,
+            digest=authenticode_digest(file_path, algorithm),
+        )
+    except (OSError, ValueError) as e:
+        return DigestResult(file_path=file_path, algorithm=algorithm, error=str(e))
+
+
+def digest_files(
+    file_paths: List[str], algorithm: str = "sha256", max_workers: int = 4
+) -> List[DigestResult]:
+    """
+    Berechnet Authenticode-Digests vieler Dateien parallel.
+
+    Returns:
+        DigestResult je Datei, in der Reihenfolge von ``file_paths``
+    """
+    if not file_paths:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=max(1, max_workers), thread_name_prefix="signit-digest"
+    ) as pool:
+        return list(pool.map(lambda fp: _digest_one(fp, algorithm), file_paths))
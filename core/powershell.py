@@ -0,0 +1,334 @@
+"""
+Let's Do. | SignIT – PowerShell-Zugriff auf den Zertifikatsspeicher.
+
+Fallback, wenn die Win32-API nicht verfügbar ist. Ein einziges Skript
+liefert mehrere Speicherorte (optional nur Code-Signing-Zertifikate) als
+ein JSON-Dokument. Skripte laufen entweder in einem eigenen Prozess pro
+Abfrage (``PowerShellRunner``) oder in einem langlebigen PowerShell-Host,
+der über mehrere Aktualisierungen wiederverwendet wird
+(``PowerShellHost``). Das Programm ist austauschbar, sodass sich beide
+mit einem Stub unter Linux testen lassen.
+
+Protokoll: PowerShell liest mit ``-Command -`` Befehle zeilenweise von
+stdin. Jedes Skript wird Base64-kodiert in einer Zeile übergeben, danach
+wird eine Endmarke ausgegeben, bis zu der die Antwort reicht. Vorab wird
+die Ausgabe auf UTF-8 umgestellt; ohne das schreibt Windows PowerShell
+umgeleitetes stdout in der OEM-Codepage (Umlaute in Zertifikatsnamen).
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import queue
+import subprocess
+import threading
+import uuid
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_EXECUTABLE = "powershell"
+DEFAULT_TIMEOUT = 30.0
+
+OID_CODE_SIGNING = "1.3.6.1.5.5.7.3.3"
+
+_END_MARKER = "__SIGNIT_END__"
+
+# UTF-8 ohne BOM, sonst beginnt die erste Antwortzeile mit U+FEFF
+_UTF8_OUTPUT = "[Console]::OutputEncoding = New-Object Text.UTF8Encoding $false\n"
+
+# Liefert {Speicherort: {"certificates": [...]} | {"error": "..."}}
+_QUERY_SCRIPT = """
+$ErrorActionPreference = 'Stop'
+$result = @{}
+foreach ($loc in @(%(locations)s)) {
+    try {
+        $now = Get-Date
+        $certs = @(Get-ChildItem -Path "Cert:\\$loc\\My" | Where-Object {
+            $_.HasPrivateKey -and $_.NotAfter -gt $now
+        })
+        if (%(code_signing_only)s) {
+            $certs = @($certs | Where-Object {
+                $_.EnhancedKeyUsageList.Count -eq 0 -or
+                @($_.EnhancedKeyUsageList.ObjectId) -contains '%(code_signing)s'
+            })
+        }
+        $result[$loc] = @{ certificates = @($certs | ForEach-Object {
+            @{
+                Subject = $_.GetNameInfo('SimpleName', $false)
+                Issuer = $_.GetNameInfo('SimpleName', $true)
+                Thumbprint = $_.Thumbprint
+                NotAfter = $_.NotAfter.ToUniversalTime().ToString('s')
+            }
+        }) }
+    } catch {
+        $result[$loc] = @{ error = $_.Exception.Message }
+    }
+}
+$result | ConvertTo-Json -Compress -Depth 5
+"""
+
+# Liefert {Speicherort: {"thumbprints": [...]} | {"error": "..."}}
+_THUMBPRINT_SCRIPT = """
+$ErrorActionPreference = 'Stop'
+$result = @{}
+foreach ($loc in @(%(locations)s)) {
+    try {
+        $result[$loc] = @{
+            thumbprints = @(Get-ChildItem -Path "Cert:\\$loc\\My" |
+                ForEach-Object { $_.Thumbprint })
+        }
+    } catch {
+        $result[$loc] = @{ error = $_.Exception.Message }
+    }
+}
+$result | ConvertTo-Json -Compress -Depth 5
+"""
+
+
+def _ps_string_list(values: Sequence[str]) -> str:
+    return ", ".join("'" + v.replace("'", "''") + "'" for v in values)
+
+
+def build_query_script(
+    store_locations: Sequence[str], code_signing_only: bool = True
+) -> str:
+    """Skript, das alle ``store_locations`` in einem Aufruf liest."""
+    return _QUERY_SCRIPT % {
+        "locations": _ps_string_list(store_locations),
+        "code_signing_only": "$true" if code_signing_only else "$false",
+        "code_signing": OID_CODE_SIGNING,
+    }
+
+
+def build_thumbprint_script(store_locations: Sequence[str]) -> str:
+    """Skript, das nur die Thumbprints aller Zertifikate liefert."""
+    return _THUMBPRINT_SCRIPT % {"locations": _ps_string_list(store_locations)}
+
+
+def _command_lines(script: str, marker: str) -> str:
+    """Kodiert ein Skript für das zeilenweise ``-Command -``-Protokoll."""
+    encoded = base64.b64encode(script.encode("utf-8")).decode("ascii")
+    return (
+        _UTF8_OUTPUT
+        + "Invoke-Expression ([Text.Encoding]::UTF8.GetString("
+        f"[Convert]::FromBase64String('{encoded}')))\n"
+        f"Write-Output '{marker}'\n"
+    )
+
+
+def _command(executable: str) -> List[str]:
+    return [executable, "-NoLogo", "-NoProfile", "-NonInteractive", "-Command", "-"]
+
+
+class PowerShellRunner:
+    """Führt jedes Skript in einem neuen PowerShell-Prozess aus."""
+
+    def __init__(
+        self, executable: str = DEFAULT_EXECUTABLE, timeout: float = DEFAULT_TIMEOUT
+    ):
+        self.executable = executable
+        self.timeout = timeout
+
+    def run(self, script: str) -> str:
+        """
+        Führt ``script`` aus und liefert dessen stdout.
+
+        Raises:
+            OSError: PowerShell fehlt, Zeitüberschreitung oder Exit-Code != 0
+        """
+        try:
+            result = subprocess.run(
+                _command(self.executable),
+                input=_command_lines(script, _END_MARKER),
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=self.timeout,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            )
+        except FileNotFoundError as e:
+            raise OSError(f"PowerShell nicht gefunden: {self.executable}") from e
+        except subprocess.TimeoutExpired as e:
+            raise OSError(
+                f"PowerShell: Zeitüberschreitung nach {self.timeout}s"
+            ) from e
+
+        if result.returncode != 0:
+            raise OSError(f"PowerShell-Fehler: {result.stderr.strip()}")
+        lines = result.stdout.splitlines()
+        if _END_MARKER in lines:
+            lines = lines[: lines.index(_END_MARKER)]
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        """Kein Prozess zu beenden (Schnittstelle wie PowerShellHost)."""
+
+
+class PowerShellHost:
+    """
+    Langlebiger PowerShell-Prozess für wiederholte Abfragen.
+
+    Der Prozess wird beim ersten ``run`` gestartet und danach
+    wiederverwendet; die 1–3 Sekunden Startzeit fallen nur einmal an.
+    Bei Zeitüberschreitung oder Prozessende wird er verworfen und beim
+    nächsten Aufruf neu gestartet. Aufrufe sind threadsicher (serialisiert).
+    """
+
+    def __init__(
+        self, executable: str = DEFAULT_EXECUTABLE, timeout: float = DEFAULT_TIMEOUT
+    ):
+        self.executable = executable
+        self.timeout = timeout
+        self._process: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._stderr: List[str] = []
+        self._lock = threading.Lock()
+
+    def _start(self) -> subprocess.Popen:
+        process = subprocess.Popen(
+            _command(self.executable),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+        lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        stderr: List[str] = []
+
+        def _read_stdout() -> None:
+            try:
+                for line in iter(process.stdout.readline, ""):
+                    lines.put(line.rstrip("\r\n"))
+            finally:
+                lines.put(None)  # Prozess beendet oder Lesefehler
+
+        def _read_stderr() -> None:
+            for line in iter(process.stderr.readline, ""):
+                stderr.append(line.rstrip("\r\n"))
+
+        threading.Thread(target=_read_stdout, daemon=True).start()
+        threading.Thread(target=_read_stderr, daemon=True).start()
+        self._process, self._lines, self._stderr = process, lines, stderr
+        return process
+
+    def run(self, script: str) -> str:
+        """
+        Führt ``script`` im Host aus und liefert dessen stdout.
+
+        Raises:
+            OSError: PowerShell fehlt, Zeitüberschreitung oder Host beendet
+        """
+        with self._lock:
+            process = self._process
+            if process is None or process.poll() is not None:
+                try:
+                    process = self._start()
+                except FileNotFoundError as e:
+                    raise OSError(
+                        f"PowerShell nicht gefunden: {self.executable}"
+                    ) from e
+
+            marker = f"{_END_MARKER}{uuid.uuid4().hex}"
+            del self._stderr[:]
+            try:
+                process.stdin.write(_command_lines(script, marker))
+                process.stdin.flush()
+            except OSError as e:
+                self._kill()
+                raise OSError(f"PowerShell-Host nicht erreichbar: {e}") from e
+
+            output: List[str] = []
+            while True:
+                try:
+                    line = self._lines.get(timeout=self.timeout)
+                except queue.Empty:
+                    self._kill()
+                    raise OSError(
+                        f"PowerShell: Zeitüberschreitung nach {self.timeout}s"
+                    ) from None
+                if line is None:
+                    self._process = None
+                    detail = " ".join(self._stderr).strip()
+                    raise OSError(f"PowerShell-Host beendet: {detail}")
+                if line == marker:
+                    return "\n".join(output)
+                output.append(line)
+
+    def _kill(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process = None
+
+    def close(self) -> None:
+        """Beendet den Host-Prozess."""
+        with self._lock:
+            process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            try:
+                process.stdin.close()
+                process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+
+
+def _parse_per_store(
+    output: str, store_locations: Sequence[str], key: str
+) -> Tuple[Dict[str, list], Dict[str, str]]:
+    output = output.strip()
+    try:
+        data = json.loads(output) if output else {}
+    except ValueError as e:
+        raise OSError(f"PowerShell: ungültige Antwort ({e})") from e
+    if not isinstance(data, dict):
+        raise OSError("PowerShell: ungültige Antwort (kein JSON-Objekt)")
+
+    results: Dict[str, list] = {}
+    errors: Dict[str, str] = {}
+    for location in store_locations:
+        entry = data.get(location)
+        if not isinstance(entry, dict):
+            errors[location] = "keine Antwort"
+        elif "error" in entry:
+            errors[location] = str(entry["error"])
+        else:
+            items = entry.get(key) or []
+            # ConvertTo-Json entpackt Arrays mit einem Element nicht immer
+            results[location] = items if isinstance(items, list) else [items]
+    return results, errors
+
+
+def query_certificates(
+    runner,
+    store_locations: Sequence[str],
+    code_signing_only: bool = True,
+) -> Tuple[Dict[str, List[dict]], Dict[str, str]]:
+    """
+    Liest mehrere Speicherorte mit einem einzigen Skript.
+
+    Args:
+        runner: PowerShellRunner oder PowerShellHost
+        store_locations: z. B. ('CurrentUser', 'LocalMachine')
+        code_signing_only: nur Zertifikate mit Code-Signing-EKU (oder ohne EKU)
+
+    Returns:
+        ({Speicherort: [{Subject, Issuer, Thumbprint, NotAfter (UTC)}]},
+        {Speicherort: Fehlermeldung})
+
+    Raises:
+        OSError: wenn PowerShell nicht ausgeführt werden konnte
+    """
+    output = runner.run(build_query_script(store_locations, code_signing_only))
+    return _parse_per_store(output, store_locations, "certificates")
+
+
+def query_thumbprints(
+    runner, store_locations: Sequence[str]
+) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
+    """Thumbprints aller Zertifikate je Speicherort (für Fingerprints)."""
+    output = runner.run(build_thumbprint_script(store_locations))
+    return _parse_per_store(output, store_locations, "thumbprints")
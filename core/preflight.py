@@ -0,0 +1,230 @@
+"""
+Let's Do. | SignIT – Vorabprüfung (Preflight) der Dateiliste.
+
+Prüft alle Dateien parallel, bevor der erste signtool-Prozess startet:
+Existenz, Lesbarkeit, Schreibzugriff/Sperre, Größe und Format-Signatur
+(Magic Bytes). Liefert einen strukturierten Bericht, damit ein fehlerhafter
+Batch sofort scheitert statt mitten im Signiervorgang.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from core.authenticode import read_signature_info
+
+# Schweregrade
+SEVERITY_ERROR = "error"  # Datei kann nicht signiert werden
+SEVERITY_WARNING = "warning"  # Signieren möglich, aber auffällig
+
+# Prüfergebnisse
+ISSUE_MISSING = "missing"
+ISSUE_NOT_A_FILE = "not_a_file"
+ISSUE_EMPTY = "empty"
+ISSUE_TOO_LARGE = "too_large"
+ISSUE_UNREADABLE = "unreadable"
+ISSUE_READ_ONLY = "read_only"
+ISSUE_LOCKED = "locked"
+ISSUE_FORMAT = "format"
+ISSUE_UNKNOWN_FORMAT = "unknown_format"
+ISSUE_ALREADY_SIGNED = "already_signed"
+
+# PE-Images sind auf 4 GiB begrenzt
+MAX_PE_SIZE = 4 * 1024 * 1024 * 1024 - 1
+
+_MAGIC_PE = (b"MZ",)
+_MAGIC_OLE = (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",)
+_MAGIC_CAB = (b"MSCF",)
+_MAGIC_ZIP = (b"PK\x03\x04",)
+_MAGIC_DER = (b"\x30",)
+
+# Erwartete Magic Bytes je Dateiendung
+FORMAT_MAGIC: Dict[str, Tuple[bytes, ...]] = {
+    ".exe": _MAGIC_PE,
+    ".dll": _MAGIC_PE,
+    ".sys": _MAGIC_PE,
+    ".ocx": _MAGIC_PE,
+    ".scr": _MAGIC_PE,
+    ".cpl": _MAGIC_PE,
+    ".drv": _MAGIC_PE,
+    ".efi": _MAGIC_PE,
+    ".msi": _MAGIC_OLE,
+    ".msp": _MAGIC_OLE,
+    ".msm": _MAGIC_OLE,
+    ".cab": _MAGIC_CAB,
+    ".appx": _MAGIC_ZIP,
+    ".msix": _MAGIC_ZIP,
+    ".cat": _MAGIC_DER,
+}
+
+# Skript-Formate ohne Magic Bytes
+TEXT_FORMATS = {".ps1", ".psm1", ".psd1", ".vbs", ".js", ".wsf"}
+
+_PE_EXTENSIONS = {ext for ext, magic in FORMAT_MAGIC.items() if magic is _MAGIC_PE}
+
+
+@dataclass
+class PreflightIssue:
+    """Ein Befund der Vorabprüfung."""
+
+    file_path: str
+    code: str
+    severity: str
+    message: str
+
+
+@dataclass
+class PreflightReport:
+    """Ergebnis der Vorabprüfung über alle Dateien."""
+
+    total: int
+    issues: List[PreflightIssue] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def errors(self) -> List[PreflightIssue]:
+        return [i for i in self.issues if i.severity == SEVERITY_ERROR]
+
+    @property
+    def warnings(self) -> List[PreflightIssue]:
+        return [i for i in self.issues if i.severity == SEVERITY_WARNING]
+
+    @property
+    def failed_files(self) -> Set[str]:
+        """Dateien mit mindestens einem Fehler."""
+        return {i.file_path for i in self.errors}
+
+    @property
+    def ok(self) -> bool:
+        """True, wenn keine Datei einen Fehler hat."""
+        return not self.errors
+
+    def summary(self) -> str:
+        """Einzeilige Zusammenfassung für Log und Dialoge."""
+        return (
+            f"{self.total} Datei(en) geprüft in {self.duration:.2f}s: "
+            f"{len(self.failed_files)} mit Fehlern, {len(self.warnings)} Warnung(en)"
+        )
+
+
+def check_file(
+    file_path: str, thumbprint: Optional[str] = None
+) -> List[PreflightIssue]:
+    """
+    Prüft eine einzelne Datei.
+
+    Args:
+        file_path: Pfad der Datei
+        thumbprint: Wenn gesetzt, wird bei PE-Dateien zusätzlich gemeldet,
+            ob sie bereits signiert sind (und ob mit diesem Zertifikat).
+            Liest nur die Zertifikatstabelle; ob die Signatur den Inhalt
+            noch abdeckt, prüft erst der SignIndex.
+
+    Returns:
+        Liste der Befunde (leer = in Ordnung)
+    """
+    issues: List[PreflightIssue] = []
+
+    def _issue(code: str, severity: str, message: str) -> List[PreflightIssue]:
+        issues.append(PreflightIssue(file_path, code, severity, message))
+        return issues
+
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return _issue(ISSUE_MISSING, SEVERITY_ERROR, "Datei existiert nicht")
+    except OSError as e:
+        return _issue(ISSUE_UNREADABLE, SEVERITY_ERROR, f"Nicht lesbar: {e}")
+
+    if not stat.S_ISREG(st.st_mode):
+        return _issue(ISSUE_NOT_A_FILE, SEVERITY_ERROR, "Keine reguläre Datei")
+    if st.st_size == 0:
+        return _issue(ISSUE_EMPTY, SEVERITY_ERROR, "Datei ist leer (0 Byte)")
+
+    ext = Path(file_path).suffix.lower()
+    if ext in _PE_EXTENSIONS and st.st_size > MAX_PE_SIZE:
+        _issue(ISSUE_TOO_LARGE, SEVERITY_ERROR, "PE-Datei größer als 4 GiB")
+
+    if not st.st_mode & stat.S_IWRITE:
+        return _issue(ISSUE_READ_ONLY, SEVERITY_ERROR, "Datei ist schreibgeschützt")
+
+    # Öffnen zum Schreiben erkennt Sperren (Sharing Violation unter Windows)
+    # und fehlende Rechte, ohne den Inhalt oder die mtime zu verändern.
+    try:
+        with open(file_path, "r+b") as f:
+            head = f.read(8)
+    except PermissionError as e:
+        if getattr(e, "winerror", None) in (32, 33):
+            return _issue(
+                ISSUE_LOCKED,
+                SEVERITY_ERROR,
+                "Datei wird von einem anderen Prozess verwendet",
+            )
+        return _issue(ISSUE_READ_ONLY, SEVERITY_ERROR, f"Kein Schreibzugriff: {e}")
+    except OSError as e:
+        return _issue(ISSUE_UNREADABLE, SEVERITY_ERROR, f"Nicht lesbar: {e}")
+
+    expected = FORMAT_MAGIC.get(ext)
+    if expected is not None:
+        if not head.startswith(expected):
+            _issue(
+                ISSUE_FORMAT,
+                SEVERITY_ERROR,
+                f"Inhalt passt nicht zur Endung {ext} (falsche Format-Signatur)",
+            )
+            return issues
+    elif ext not in TEXT_FORMATS:
+        _issue(
+            ISSUE_UNKNOWN_FORMAT,
+            SEVERITY_WARNING,
+            f"Unbekanntes Format '{ext or '(ohne Endung)'}' – signtool kann ablehnen",
+        )
+
+    if thumbprint and expected is _MAGIC_PE:
+        info = read_signature_info(file_path)
+        if info.signed:
+            signer = (info.signer_thumbprint or "").upper()
+            same = signer == thumbprint.replace(" ", "").upper()
+            _issue(
+                ISSUE_ALREADY_SIGNED,
+                SEVERITY_WARNING,
+                "Bereits mit diesem Zertifikat signiert"
+                if same
+                else "Bereits signiert – Signatur wird ersetzt",
+            )
+
+    return issues
+
+
+def run_preflight(
+    files: List[str],
+    max_workers: int = 16,
+    thumbprint: Optional[str] = None,
+) -> PreflightReport:
+    """
+    Prüft alle Dateien parallel.
+
+    Args:
+        files: Zu prüfende Dateipfade
+        max_workers: Anzahl paralleler Prüf-Threads
+        thumbprint: Optional – meldet zusätzlich bereits signierte PE-Dateien
+
+    Returns:
+        PreflightReport mit allen Befunden (Reihenfolge wie ``files``)
+    """
+    start = time.monotonic()
+    report = PreflightReport(total=len(files))
+    if files:
+        with ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="signit-preflight"
+        ) as pool:
+            for issues in pool.map(lambda fp: check_file(fp, thumbprint), files):
+                report.issues.extend(issues)
+    report.duration = time.monotonic() - start
+    return report
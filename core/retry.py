@@ -0,0 +1,134 @@
+"""
+Let's Do. | SignIT – Fehlerklassifizierung & Wiederholungsstrategie.
+
+Ordnet signtool-Fehler anhand von Exit-Code und Ausgabe einer Fehlerklasse
+zu und legt pro Klasse fest, ob und wie oft mit exponentiellem Backoff
+(mit Jitter) erneut versucht wird.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Tuple
+
+# Fehlerklassen
+ERROR_TIMESTAMP = "timestamp"  # TSA nicht erreichbar, Timeout, HTTP 5xx
+ERROR_FILE_IN_USE = "file_in_use"  # Datei gesperrt (z. B. durch Virenscanner)
+ERROR_CERTIFICATE = "certificate"  # Zertifikat/Schlüssel nicht verfügbar
+ERROR_FILE_FORMAT = "file_format"  # Dateiformat nicht signierbar
+ERROR_NOT_FOUND = "not_found"  # Datei oder signtool.exe fehlt
+ERROR_ACCESS_DENIED = "access_denied"  # Keine Schreibrechte
+ERROR_CANCELLED = "cancelled"  # Vom Benutzer abgebrochen (nie wiederholt)
+ERROR_UNKNOWN = "unknown"
+
+# Anzeigenamen für Log und Statusmeldungen
+ERROR_LABELS: Dict[str, str] = {
+    ERROR_TIMESTAMP: "Timestamp-Server",
+    ERROR_FILE_IN_USE: "Datei gesperrt",
+    ERROR_CERTIFICATE: "Zertifikat",
+    ERROR_FILE_FORMAT: "Dateiformat",
+    ERROR_NOT_FOUND: "Nicht gefunden",
+    ERROR_ACCESS_DENIED: "Zugriff verweigert",
+    ERROR_CANCELLED: "Abgebrochen",
+    ERROR_UNKNOWN: "Unbekannt",
+}
+
+# Reihenfolge ist relevant: die erste passende Regel gewinnt.
+_RULES: List[Tuple[str, Pattern[str]]] = [
+    (
+        ERROR_FILE_IN_USE,
+        re.compile(
+            r"being used by another process|0x80070020|0x80070021|sharing violation",
+            re.I,
+        ),
+    ),
+    (
+        ERROR_TIMESTAMP,
+        re.compile(
+            r"timestamp server|timestamp signature|time ?stamp.*(could not|failed)"
+            r"|HTTP(?: status)?:? ?5\d\d|0x80072ee[27]|0x80072efd|0x80072efe"
+            r"|0x80072f78|0x8019[0-9a-f]{4}|timed? ?out",
+            re.I,
+        ),
+    ),
+    (
+        ERROR_CERTIFICATE,
+        re.compile(
+            r"no certificates were found|private key|0x8009[0-9a-f]{4}"
+            r"|certificate.*(not valid|expired)",
+            re.I,
+        ),
+    ),
+    (
+        ERROR_FILE_FORMAT,
+        re.compile(r"file format cannot be signed|not recognized|0x800700c1", re.I),
+    ),
+    (
+        ERROR_NOT_FOUND,
+        re.compile(
+            r"file not found|cannot find the (file|path)|nicht gefunden|0x80070002"
+            r"|0x80070003",
+            re.I,
+        ),
+    ),
+    (ERROR_ACCESS_DENIED, re.compile(r"access is denied|0x80070005", re.I)),
+]
+
+
+def classify_error(return_code: int, output: str, error: str) -> str:
+    """
+    Ordnet einen fehlgeschlagenen signtool-Aufruf einer Fehlerklasse zu.
+
+    Args:
+        return_code: Exit-Code von signtool (-1 = Prozess nicht startbar)
+        output: stdout des Aufrufs
+        error: stderr des Aufrufs bzw. Fehlermeldung
+
+    Returns:
+        Eine der ERROR_*-Konstanten
+    """
+    text = f"{error}\n{output}"
+    for error_class, pattern in _RULES:
+        if pattern.search(text):
+            return error_class
+    return ERROR_UNKNOWN
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Wiederholungsstrategie je Fehlerklasse.
+
+    Die Wartezeit vor Versuch n+1 beträgt
+    ``base_delay * multiplier ** (n - 1)`` (begrenzt durch ``max_delay``)
+    und wird um ±``jitter`` zufällig gestreut, damit parallele Worker
+    einen gestörten Server nicht im Gleichtakt erneut anfragen.
+    """
+
+    # Maximale Versuche (inkl. erstem) je Klasse; fehlende Klassen = 1
+    max_attempts: Dict[str, int] = field(
+        default_factory=lambda: {ERROR_TIMESTAMP: 4, ERROR_FILE_IN_USE: 5}
+    )
+    # Basis-Wartezeit je Klasse in Sekunden
+    base_delays: Dict[str, float] = field(
+        default_factory=lambda: {ERROR_TIMESTAMP: 2.0, ERROR_FILE_IN_USE: 0.5}
+    )
+    default_base_delay: float = 1.0
+    multiplier: float = 2.0
+    max_delay: float = 30.0
+    jitter: float = 0.5
+    rng: Optional[random.Random] = None
+
+    def should_retry(self, error_class: str, attempt: int) -> bool:
+        """True, wenn nach dem fehlgeschlagenen Versuch ``attempt`` erneut versucht wird."""
+        return attempt < self.max_attempts.get(error_class, 1)
+
+    def delay(self, error_class: str, attempt: int) -> float:
+        """Wartezeit in Sekunden vor dem Versuch ``attempt + 1``."""
+        base = self.base_delays.get(error_class, self.default_base_delay)
+        delay = min(self.max_delay, base * self.multiplier ** max(attempt - 1, 0))
+        rng = self.rng or random
+        spread = delay * self.jitter
+        return max(0.0, delay + rng.uniform(-spread, spread))
@@ -6,11 +6,87 @@ Führt signtool.exe als Subprocess aus und liefert Live-Output.
 
 from __future__ import annotations
 
+import os
+import re
 import subprocess
 import threading
-from dataclasses import dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from core.cancel import CancelToken
+from core.journal import JournalSession, SigningJournal
+from core.retry import (
+    ERROR_CANCELLED,
+    ERROR_LABELS,
+    ERROR_NOT_FOUND,
+    ERROR_TIMESTAMP,
+    ERROR_UNKNOWN,
+    RetryPolicy,
+    classify_error,
+)
+from core.signindex import SignIndex
+from core.throughput import ThroughputSnapshot, ThroughputTracker
+from core.timestamp import TimestampSelector
+
+# Maximale Länge der Kommandozeile (CreateProcess erlaubt 32767 Zeichen)
+MAX_COMMAND_LINE = 32000
+
+CANCELLED_MESSAGE = "Vom Benutzer abgebrochen"
+
+# signtool meldet jede erfolgreich signierte/gestempelte Datei in einer eigenen Zeile
+_SIGNED_LINE = re.compile(
+    r"^\s*Successfully (?:signed|timestamped):\s*(?P<path>.+?)\s*$", re.I
+)
+
+
+# Phasen, denen _execute die Laufzeit eines signtool-Prozesses zuordnet
+PHASE_SIGN = "sign"
+PHASE_TIMESTAMP = "timestamp"
+
+
+@dataclass
+class SignTimings:
+    """
+    Dauer der Phasen einer Datei in Sekunden (``time.monotonic``).
+
+    - ``queue_wait``: Wartezeit auf einen freien Worker (beide Stufen)
+    - ``spawn``: Start der signtool-Prozesse
+    - ``sign``: Laufzeit von ``signtool sign`` ohne Prozessstart; im
+      einstufigen Modus inklusive Zeitstempel (ein Aufruf)
+    - ``timestamp``: Laufzeit von ``signtool timestamp`` (Zwei-Phasen-Modus)
+    - ``total``: vom Einreihen bis zum fertigen Ergebnis, inkl. Backoff
+
+    Bei Batches gelten die Werte des gemeinsamen Aufrufs; Wiederholungen
+    werden aufsummiert.
+    """
+
+    queue_wait: float = 0.0
+    spawn: float = 0.0
+    sign: float = 0.0
+    timestamp: float = 0.0
+    total: float = 0.0
+
+    def __add__(self, other: "SignTimings") -> "SignTimings":
+        return SignTimings(
+            *(getattr(self, f.name) + getattr(other, f.name) for f in fields(self))
+        )
+
+    def to_dict(self) -> Dict[str, float]:
+        return {f.name: round(getattr(self, f.name), 3) for f in fields(self)}
+
+    @staticmethod
+    def mean(timings: Iterable["SignTimings"]) -> Optional["SignTimings"]:
+        """Mittelwert je Phase (None bei leerer Eingabe)."""
+        items = list(timings)
+        if not items:
+            return None
+        total = sum(items, SignTimings())
+        return SignTimings(
+            *(getattr(total, f.name) / len(items) for f in fields(total))
+        )
 
 
 @dataclass
@@ -22,14 +98,133 @@ class SignResult:
     return_code: int
     output: str
     error: str
+    error_class: str = ""
+    attempts: int = 1
+    skipped: bool = False
+    timings: SignTimings = field(default_factory=SignTimings)
+
+
+def _norm_path(path: str) -> str:
+    """Normalisiert einen Pfad für Vergleiche (Windows: case-insensitiv)."""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _cancelled_results(file_paths: List[str], error: str = "") -> List[SignResult]:
+    """Ergebnisse für Dateien, die wegen eines Abbruchs nicht fertig wurden."""
+    return [
+        SignResult(
+            file_path=fp,
+            success=False,
+            return_code=-1,
+            output="",
+            error=error or CANCELLED_MESSAGE,
+            error_class=ERROR_CANCELLED,
+        )
+        for fp in file_paths
+    ]
+
+
+def _attribute_results(
+    file_paths: List[str],
+    return_code: int,
+    stdout_lines: List[str],
+    stderr_lines: List[str],
+) -> List[SignResult]:
+    """
+    Ordnet die Ausgabe eines signtool-Aufrufs den einzelnen Dateien zu.
+
+    Exit-Code 0 bedeutet, dass alle Dateien signiert wurden. Andernfalls
+    gelten nur Dateien mit einer "Successfully signed"-Zeile als erfolgreich;
+    Fehlerzeilen werden der Datei zugeordnet, deren Pfad sie nennen.
+    """
+    output = "\n".join(stdout_lines)
+    error = "\n".join(stderr_lines)
+
+    if len(file_paths) == 1 or return_code == 0:
+        error_class = (
+            "" if return_code == 0 else classify_error(return_code, output, error)
+        )
+        return [
+            SignResult(
+                file_path=fp,
+                success=(return_code == 0),
+                return_code=return_code,
+                output=output,
+                error=error,
+                error_class=error_class,
+            )
+            for fp in file_paths
+        ]
+
+    signed: Set[str] = set()
+    for line in stdout_lines:
+        match = _SIGNED_LINE.match(line)
+        if match:
+            signed.add(_norm_path(match.group("path")))
+
+    results: List[SignResult] = []
+    for fp in file_paths:
+        if _norm_path(fp) in signed:
+            results.append(
+                SignResult(
+                    file_path=fp, success=True, return_code=0, output=output, error=""
+                )
+            )
+            continue
+
+        needles = (_norm_path(fp), os.path.normcase(Path(fp).name))
+        own_errors = [
+            line for line in stderr_lines
+            if any(n in os.path.normcase(line) for n in needles)
+        ]
+        file_error = "\n".join(own_errors) if own_errors else error
+        results.append(
+            SignResult(
+                file_path=fp,
+                success=False,
+                return_code=return_code,
+                output=output,
+                error=file_error,
+                error_class=classify_error(return_code, "", file_error),
+            )
+        )
+    return results
 
 
 class Signer:
     """
     Wrapper um signtool.exe zum Signieren von EXE-Dateien.
 
+    Mit ``batch_size`` > 1 werden mehrere Dateien pro signtool-Aufruf
+    übergeben (begrenzt durch die Länge der Kommandozeile).
+
+    Mit ``max_workers`` > 1 laufen mehrere signtool-Prozesse gleichzeitig
+    (begrenzter Worker-Pool), sodass Wartezeiten auf den Timestamp-Server
+    sich überlappen statt sich aufzusummieren.
+
+    Mit ``two_phase=True`` wird zuerst lokal ohne Zeitstempel signiert;
+    ``signtool timestamp`` läuft danach als eigene Stufe mit
+    ``timestamp_workers`` Prozessen und eigenen Wiederholungsversuchen.
+
+    Mit einer ``retry_policy`` werden vorübergehende Fehler (Timestamp-Server,
+    gesperrte Dateien) klassifiziert und nur die betroffenen Dateien mit
+    exponentiellem Backoff erneut signiert.
+
+    Mit einem ``sign_index`` werden Dateien übersprungen, die seit ihrer
+    letzten Signatur mit demselben Zertifikat unverändert sind.
+
+    Mit einem ``journal`` wird jedes Ergebnis sofort festgehalten; ein
+    unterbrochener Vorgang mit denselben Dateien und demselben Zertifikat
+    wird beim nächsten Start mit den restlichen Dateien fortgesetzt.
+
+    Mit ``machine_store=True`` sucht signtool das Zertifikat im
+    LocalMachine-Speicher (``/sm``) statt unter CurrentUser.
+
+    Mit einem ``timestamp_selector`` wird für jeden Aufruf der aktuell
+    schnellste gesunde Timestamp-Server gewählt statt ``timestamp_url``.
+
     Verwendung:
-        signer = Signer(signtool_path="C:/path/to/signtool.exe")
+        signer = Signer(signtool_path="C:/path/to/signtool.exe", max_workers=4)
         signer.sign_files(
             files=["app.exe"],
             thumbprint="AABB...",
@@ -39,124 +234,502 @@ class Signer:
         )
     """
 
-    def __init__(self, signtool_path: str):
+    def __init__(
+        self,
+        signtool_path: str,
+        max_workers: int = 1,
+        batch_size: int = 1,
+        max_command_line: int = MAX_COMMAND_LINE,
+        two_phase: bool = False,
+        timestamp_workers: int = 4,
+        timestamp_selector: Optional[TimestampSelector] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timestamp_retry_policy: Optional[RetryPolicy] = None,
+        sign_index: Optional[SignIndex] = None,
+        machine_store: bool = False,
+        journal: Optional[SigningJournal] = None,
+    ):
         self.signtool_path = signtool_path
+        self.max_workers = max(1, int(max_workers))
+        self.batch_size = max(1, int(batch_size))
+        self.max_command_line = max_command_line
+        self.two_phase = two_phase
+        self.timestamp_workers = max(1, int(timestamp_workers))
+        self.timestamp_selector = timestamp_selector
+        self.retry_policy = retry_policy
+        self.timestamp_retry_policy = timestamp_retry_policy or RetryPolicy()
+        self.sign_index = sign_index
+        self.machine_store = machine_store
+        self.journal = journal
+        # Durchsatz des laufenden bzw. letzten sign_files-Aufrufs
+        self.throughput: Optional[ThroughputTracker] = None
 
-    def sign_file(
-        self,
-        file_path: str,
-        thumbprint: str,
-        timestamp_url: str,
-        on_log: Optional[Callable[[str], None]] = None,
-    ) -> SignResult:
+    def _sign_command(
+        self, file_paths: List[str], thumbprint: str, timestamp_url: Optional[str]
+    ) -> List[str]:
         """
-        Signiert eine einzelne Datei mit signtool.exe.
-
-        Args:
-            file_path: Pfad zur zu signierenden Datei
-            thumbprint: SHA-1-Thumbprint des Zertifikats
-            timestamp_url: URL des Timestamp-Servers
-            on_log: Callback für Live-Log-Output (optional)
+        Baut die signtool-Kommandozeile für eine oder mehrere Dateien.
 
-        Returns:
-            SignResult mit Erfolg/Fehler-Information
+        Ohne ``timestamp_url`` wird nur lokal signiert (kein /tr, /td).
         """
-        cmd = [
+        cmd = [self.signtool_path, "sign"]
+        if self.machine_store:
+            cmd.append("/sm")
+        cmd += ["/sha1", thumbprint]
+        if timestamp_url:
+            cmd += ["/tr", timestamp_url, "/td", "sha256"]
+        cmd += ["/fd", "sha256", *file_paths]
+        return cmd
+
+    def _timestamp_command(
+        self, file_paths: List[str], timestamp_url: str
+    ) -> List[str]:
+        """Baut die Kommandozeile für ``signtool timestamp``."""
+        return [
             self.signtool_path,
-            "sign",
-            "/sha1",
-            thumbprint,
+            "timestamp",
             "/tr",
             timestamp_url,
             "/td",
             "sha256",
-            "/fd",
-            "sha256",
-            file_path,
+            *file_paths,
         ]
 
-        if on_log:
-            on_log(f"Befehl: {' '.join(cmd)}")
+    def _run_command(
+        self,
+        cmd: List[str],
+        on_log: Optional[Callable[[str], None]] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> Tuple[int, List[str], List[str], float]:
+        """
+        Führt signtool aus und liest stdout/stderr live mit.
 
-        try:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-            )
+        Der Prozess wird bei ``cancel`` angemeldet und bei einem Abbruch
+        beendet; die Lese-Threads enden mit den geschlossenen Pipes.
 
-            stdout_lines: list[str] = []
-            stderr_lines: list[str] = []
+        Returns:
+            Tupel (Return-Code, stdout-Zeilen, stderr-Zeilen,
+            Dauer des Prozessstarts in Sekunden)
 
-            # FIX #1: stdout/stderr parallel lesen, um Pipe-Deadlocks zu vermeiden.
-            def _read_stream(stream, target: list[str], is_error: bool = False) -> None:
-                try:
-                    for line in iter(stream.readline, ""):
-                        line = line.rstrip("\n\r")
-                        if line:
-                            target.append(line)
-                            if on_log:
-                                on_log(
-                                    f"  [FEHLER] {line}" if is_error else f"  {line}"
-                                )
-                finally:
-                    stream.close()
-
-            threads: list[threading.Thread] = []
-            if process.stdout:
-                t_out = threading.Thread(
-                    target=_read_stream,
-                    args=(process.stdout, stdout_lines, False),
-                    daemon=True,
-                )
-                threads.append(t_out)
-                t_out.start()
-
-            if process.stderr:
-                t_err = threading.Thread(
-                    target=_read_stream,
-                    args=(process.stderr, stderr_lines, True),
-                    daemon=True,
-                )
-                threads.append(t_err)
-                t_err.start()
+        Raises:
+            FileNotFoundError: signtool.exe existiert nicht
+        """
+        spawn_start = time.monotonic()
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+        spawn = time.monotonic() - spawn_start
+        if cancel is not None:
+            cancel.register(process)
+
+        stdout_lines: List[str] = []
+        stderr_lines: List[str] = []
 
+        # FIX #1: stdout/stderr parallel lesen, um Pipe-Deadlocks zu vermeiden.
+        def _read_stream(stream, target: List[str], is_error: bool = False) -> None:
+            try:
+                for line in iter(stream.readline, ""):
+                    line = line.rstrip("\n\r")
+                    if line:
+                        target.append(line)
+                        if on_log:
+                            on_log(f"  [FEHLER] {line}" if is_error else f"  {line}")
+            finally:
+                stream.close()
+
+        threads: List[threading.Thread] = []
+        if process.stdout:
+            t_out = threading.Thread(
+                target=_read_stream,
+                args=(process.stdout, stdout_lines, False),
+                daemon=True,
+            )
+            threads.append(t_out)
+            t_out.start()
+
+        if process.stderr:
+            t_err = threading.Thread(
+                target=_read_stream,
+                args=(process.stderr, stderr_lines, True),
+                daemon=True,
+            )
+            threads.append(t_err)
+            t_err.start()
+
+        try:
             process.wait()
             for t in threads:
                 t.join()
+        finally:
+            if cancel is not None:
+                cancel.unregister(process)
 
-            return SignResult(
-                file_path=file_path,
-                success=(process.returncode == 0),
-                return_code=process.returncode,
-                output="\n".join(stdout_lines),
-                error="\n".join(stderr_lines),
-            )
+        return process.returncode, stdout_lines, stderr_lines, spawn
 
+    def _execute(
+        self,
+        file_paths: List[str],
+        cmd: List[str],
+        on_log: Optional[Callable[[str], None]] = None,
+        phase: str = PHASE_SIGN,
+        cancel: Optional[CancelToken] = None,
+    ) -> List[SignResult]:
+        """
+        Führt einen signtool-Aufruf aus und liefert ein SignResult je Datei.
+
+        Die Laufzeit (ohne Prozessstart) wird der Phase ``phase`` zugeordnet.
+        Dateien, die nach einem Abbruch nicht erfolgreich waren, erhalten
+        die Fehlerklasse ``ERROR_CANCELLED``.
+        """
+        if cancel is not None and cancel.cancelled:
+            return _cancelled_results(file_paths)
+        if on_log:
+            on_log(f"Befehl: {' '.join(cmd)}")
+
+        start = time.monotonic()
+        spawn = 0.0
+        try:
+            return_code, stdout_lines, stderr_lines, spawn = self._run_command(
+                cmd, on_log, cancel
+            )
         except FileNotFoundError:
             msg = f"signtool.exe nicht gefunden: {self.signtool_path}"
-            if on_log:
-                on_log(f"  [FEHLER] {msg}")
-            return SignResult(
-                file_path=file_path,
-                success=False,
-                return_code=-1,
-                output="",
-                error=msg,
-            )
+            error_class = ERROR_NOT_FOUND
         except Exception as e:
             msg = f"Unerwarteter Fehler: {e}"
-            if on_log:
-                on_log(f"  [FEHLER] {msg}")
-            return SignResult(
-                file_path=file_path,
+            error_class = ERROR_UNKNOWN
+        else:
+            results = _attribute_results(
+                file_paths, return_code, stdout_lines, stderr_lines
+            )
+            if cancel is not None and cancel.cancelled:
+                for result in results:
+                    if not result.success:
+                        result.error = CANCELLED_MESSAGE
+                        result.error_class = ERROR_CANCELLED
+            self._record_timings(results, start, spawn, phase)
+            return results
+
+        if on_log:
+            on_log(f"  [FEHLER] {msg}")
+        results = [
+            SignResult(
+                file_path=fp,
                 success=False,
                 return_code=-1,
                 output="",
                 error=msg,
+                error_class=error_class,
             )
+            for fp in file_paths
+        ]
+        self._record_timings(results, start, spawn, phase)
+        return results
+
+    @staticmethod
+    def _record_timings(
+        results: List[SignResult], start: float, spawn: float, phase: str
+    ) -> None:
+        """Ordnet die Laufzeit eines Aufrufs allen Dateien des Aufrufs zu."""
+        work = max(time.monotonic() - start - spawn, 0.0)
+        for result in results:
+            result.timings = SignTimings(spawn=spawn, **{phase: work})
+
+    def _execute_timestamped(
+        self,
+        file_paths: List[str],
+        build_cmd: Callable[[Optional[str]], List[str]],
+        timestamp_url: Optional[str],
+        on_log: Optional[Callable[[str], None]] = None,
+        phase: str = PHASE_SIGN,
+        cancel: Optional[CancelToken] = None,
+    ) -> List[SignResult]:
+        """
+        Führt einen Aufruf mit Zeitstempel aus; mit Selector wird der
+        Server pro Aufruf gewählt und dessen Latenz zurückgemeldet.
+        """
+        selector = self.timestamp_selector if timestamp_url else None
+        url = selector.choose() if selector else timestamp_url
+
+        start = time.monotonic()
+        results = self._execute(file_paths, build_cmd(url), on_log, phase, cancel)
+
+        if selector:
+            # Nur melden, wenn der Zeitstempel tatsächlich angefragt wurde:
+            # alles erfolgreich oder ein Timestamp-Fehler. Abbrüche und
+            # andere Fehler (Zertifikat, Datei) sagen nichts über den Server.
+            server_failed = any(r.error_class == ERROR_TIMESTAMP for r in results)
+            cancelled = cancel is not None and cancel.cancelled
+            if not cancelled and (server_failed or all(r.success for r in results)):
+                # signtool stempelt die Dateien nacheinander: Latenz je Datei
+                latency = (time.monotonic() - start) / max(len(file_paths), 1)
+                selector.record(url, latency, not server_failed)
+            else:
+                selector.release(url)
+        return results
+
+    def sign_file(
+        self,
+        file_path: str,
+        thumbprint: str,
+        timestamp_url: Optional[str],
+        on_log: Optional[Callable[[str], None]] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> SignResult:
+        """
+        Signiert eine einzelne Datei mit signtool.exe.
+
+        Args:
+            file_path: Pfad zur zu signierenden Datei
+            thumbprint: SHA-1-Thumbprint des Zertifikats
+            timestamp_url: URL des Timestamp-Servers (None = ohne Zeitstempel)
+            on_log: Callback für Live-Log-Output (optional)
+            cancel: Abbruch-Token, beendet den laufenden Prozess (optional)
+
+        Returns:
+            SignResult mit Erfolg/Fehler-Information
+        """
+        return self._execute_timestamped(
+            [file_path],
+            lambda url: self._sign_command([file_path], thumbprint, url),
+            timestamp_url,
+            on_log,
+            cancel=cancel,
+        )[0]
+
+    def sign_batch(
+        self,
+        file_paths: List[str],
+        thumbprint: str,
+        timestamp_url: Optional[str],
+        on_log: Optional[Callable[[str], None]] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> List[SignResult]:
+        """
+        Signiert mehrere Dateien mit einem einzigen signtool-Aufruf.
+
+        Prozessstart, Öffnen des Zertifikatsspeichers und Zugriff auf den
+        privaten Schlüssel fallen so nur einmal pro Aufruf an. Die Ausgabe
+        von signtool wird anschließend den einzelnen Dateien zugeordnet.
+
+        Args:
+            file_paths: Pfade der zu signierenden Dateien
+            thumbprint: SHA-1-Thumbprint des Zertifikats
+            timestamp_url: URL des Timestamp-Servers (None = ohne Zeitstempel)
+            on_log: Callback für Live-Log-Output (optional)
+            cancel: Abbruch-Token, beendet den laufenden Prozess (optional)
+
+        Returns:
+            Ein SignResult je Datei, in der Reihenfolge von ``file_paths``
+        """
+        if not file_paths:
+            return []
+        return self._execute_timestamped(
+            file_paths,
+            lambda url: self._sign_command(file_paths, thumbprint, url),
+            timestamp_url,
+            on_log,
+            cancel=cancel,
+        )
+
+    def timestamp_files(
+        self,
+        file_paths: List[str],
+        timestamp_url: str,
+        on_log: Optional[Callable[[str], None]] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> List[SignResult]:
+        """
+        Versieht bereits signierte Dateien mit einem RFC-3161-Zeitstempel.
+
+        Args:
+            file_paths: Pfade der signierten Dateien
+            timestamp_url: URL des Timestamp-Servers
+            on_log: Callback für Live-Log-Output (optional)
+            cancel: Abbruch-Token, beendet den laufenden Prozess (optional)
+
+        Returns:
+            Ein SignResult je Datei, in der Reihenfolge von ``file_paths``
+        """
+        if not file_paths:
+            return []
+        return self._execute_timestamped(
+            file_paths,
+            lambda url: self._timestamp_command(file_paths, url),
+            timestamp_url,
+            on_log,
+            PHASE_TIMESTAMP,
+            cancel,
+        )
+
+    def _with_retries(
+        self,
+        file_paths: List[str],
+        run: Callable[[List[str]], List[SignResult]],
+        policy: Optional[RetryPolicy],
+        on_log: Optional[Callable[[str], None]] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> List[SignResult]:
+        """
+        Führt ``run`` aus und wiederholt nur die Dateien, deren Fehlerklasse
+        laut ``policy`` vorübergehend ist – der restliche Batch läuft weiter.
+        Nach einem Abbruch (``cancel``) wird nicht mehr wiederholt.
+
+        Returns:
+            Letztes Ergebnis je Datei, in der Reihenfolge von ``file_paths``
+        """
+        final: Dict[str, SignResult] = {}
+        pending = list(file_paths)
+        attempt = 1
+
+        while pending:
+            retry: List[SignResult] = []
+            for result in run(pending):
+                result.attempts = attempt
+                previous = final.get(result.file_path)
+                if previous is not None:
+                    result.timings = previous.timings + result.timings
+                final[result.file_path] = result
+                if (
+                    not result.success
+                    and policy
+                    and policy.should_retry(result.error_class, attempt)
+                ):
+                    retry.append(result)
+
+            if not retry or policy is None:
+                break
+
+            delay = max(policy.delay(r.error_class, attempt) for r in retry)
+            if on_log:
+                classes = sorted(
+                    {ERROR_LABELS.get(r.error_class, r.error_class) for r in retry}
+                )
+                on_log(
+                    f"  Wiederholung {attempt + 1} für {len(retry)} Datei(en) "
+                    f"[{', '.join(classes)}] in {delay:.1f}s"
+                )
+            if cancel is not None:
+                if cancel.wait(delay):
+                    for result in retry:
+                        result.error = CANCELLED_MESSAGE
+                        result.error_class = ERROR_CANCELLED
+                    break
+            else:
+                time.sleep(delay)
+            pending = [r.file_path for r in retry]
+            attempt += 1
+
+        return [final[fp] for fp in file_paths]
+
+    def _timestamp_stage(
+        self,
+        signed: List[SignResult],
+        timestamp_url: str,
+        on_log: Optional[Callable[[str], None]] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> List[SignResult]:
+        """
+        Zweite Pipeline-Stufe: stempelt lokal signierte Dateien und
+        wiederholt nur die Dateien, deren Zeitstempel vorübergehend
+        fehlgeschlagen ist (``timestamp_retry_policy``).
+
+        Returns:
+            Zusammengeführte Ergebnisse in der Reihenfolge von ``signed``
+        """
+        stamped = self._with_retries(
+            [r.file_path for r in signed],
+            lambda paths: self.timestamp_files(
+                paths, timestamp_url, on_log, cancel
+            ),
+            self.timestamp_retry_policy,
+            on_log,
+            cancel,
+        )
+        final = {r.file_path: r for r in stamped}
+
+        merged: List[SignResult] = []
+        for sign_result in signed:
+            ts_result = final[sign_result.file_path]
+            output = "\n".join(o for o in (sign_result.output, ts_result.output) if o)
+            if ts_result.success:
+                merged.append(
+                    SignResult(
+                        file_path=sign_result.file_path,
+                        success=True,
+                        return_code=0,
+                        output=output,
+                        error="",
+                        attempts=sign_result.attempts + ts_result.attempts - 1,
+                        timings=sign_result.timings + ts_result.timings,
+                    )
+                )
+            else:
+                merged.append(
+                    SignResult(
+                        file_path=sign_result.file_path,
+                        success=False,
+                        return_code=ts_result.return_code,
+                        output=output,
+                        error=(
+                            "Signiert, aber Zeitstempel "
+                            + (
+                                "abgebrochen"
+                                if ts_result.error_class == ERROR_CANCELLED
+                                else f"fehlgeschlagen: {ts_result.error}"
+                            )
+                        ),
+                        error_class=ts_result.error_class,
+                        attempts=sign_result.attempts + ts_result.attempts - 1,
+                        timings=sign_result.timings + ts_result.timings,
+                    )
+                )
+        return merged
+
+    def _make_batches(
+        self, files: List[str], thumbprint: str, timestamp_url: str
+    ) -> List[List[str]]:
+        """
+        Teilt die Dateien in Batches auf, begrenzt durch ``batch_size``
+        und die maximale Länge der Kommandozeile.
+
+        Mit ``timestamp_selector`` steht erst beim Aufruf fest, welcher
+        Server verwendet wird – gerechnet wird mit der längsten URL.
+        """
+        if self.batch_size <= 1:
+            return [[fp] for fp in files]
+
+        if timestamp_url and self.timestamp_selector is not None:
+            timestamp_url = max(
+                [timestamp_url, *self.timestamp_selector.urls], key=len
+            )
+        base_len = len(subprocess.list2cmdline(
+            self._sign_command([], thumbprint, timestamp_url)
+        ))
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_len = base_len
+
+        for fp in files:
+            # +1 für das Leerzeichen, list2cmdline setzt ggf. Anführungszeichen
+            arg_len = len(subprocess.list2cmdline([fp])) + 1
+            if current and (
+                len(current) >= self.batch_size
+                or current_len + arg_len > self.max_command_line
+            ):
+                batches.append(current)
+                current = []
+                current_len = base_len
+            current.append(fp)
+            current_len += arg_len
+
+        if current:
+            batches.append(current)
+        return batches
 
     def sign_files(
         self,
@@ -167,51 +740,305 @@ class Signer:
         on_log: Optional[Callable[[str], None]] = None,
         on_result: Optional[Callable[[SignResult], None]] = None,
         on_complete: Optional[Callable[[List[SignResult]], None]] = None,
-    ) -> None:
+        on_throughput: Optional[Callable[[ThroughputSnapshot], None]] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> threading.Thread:
         """
-        Signiert mehrere Dateien sequentiell in einem Hintergrund-Thread.
+        Signiert mehrere Dateien in einem Hintergrund-Thread.
+
+        Es laufen höchstens ``max_workers`` signtool-Prozesse gleichzeitig;
+        mit ``batch_size`` > 1 signiert jeder Prozess mehrere Dateien.
+        ``on_result`` wird ausgelöst, sobald eine Datei fertig ist (im
+        Zwei-Phasen-Modus erst nach dem Zeitstempel); ``on_complete``
+        erhält die Ergebnisse in der Reihenfolge von ``files``.
+        Übersprungene Dateien (``sign_index``, laut ``journal`` bereits
+        signiert) haben ``skipped=True``.
+        Jedes Ergebnis trägt seine Phasenzeiten (``SignTimings``);
+        ``self.throughput`` schätzt Dateien pro Minute und Restzeit über
+        die nicht übersprungenen Dateien.
+
+        Nach ``cancel.cancel()`` startet kein weiterer signtool-Aufruf,
+        laufende Prozesse werden beendet; alle nicht fertigen Dateien
+        erhalten die Fehlerklasse ``ERROR_CANCELLED``. Das Journal bleibt
+        dann zum Fortsetzen erhalten.
 
         Args:
             files: Liste der Dateipfade
             thumbprint: SHA-1-Thumbprint
             timestamp_url: Timestamp-Server-URL
-            on_progress: Callback(current, total, filename) für Fortschritt
+            on_progress: Callback(current, total, filename) beim Start jedes Aufrufs
             on_log: Callback(message) für Log-Zeilen
             on_result: Callback(SignResult) nach jeder Datei
             on_complete: Callback(List[SignResult]) wenn alles fertig
+            on_throughput: Callback(ThroughputSnapshot) nach jedem Aufruf
+            cancel: Abbruch-Token (optional)
+
+        Returns:
+            Der gestartete Hintergrund-Thread (z. B. für ``join()`` ohne GUI)
         """
+        total = len(files)
+        # Ausgaben einzelnen Dateien zuordnen, sobald sie sich überlappen können
+        tagged = self.max_workers > 1 or self.batch_size > 1 or self.two_phase
+        sign_url: Optional[str] = None if self.two_phase else timestamp_url
+        started = 0
+        started_lock = threading.Lock()
+        tracker = ThroughputTracker(total)
+        session: Optional[JournalSession] = None
 
-        def _worker():
-            results: List[SignResult] = []
-            total = len(files)
+        def _tagged_log(tag: str) -> Optional[Callable[[str], None]]:
+            if not on_log or not (self.max_workers > 1 or self.two_phase):
+                return on_log
+            return lambda msg: on_log(f"  [{tag}] {msg.lstrip()}")
+
+        def _finish(results: List[SignResult], submitted: float) -> None:
+            finished = time.monotonic()
+            completed = 0
+            for result in results:
+                result.timings.total = finished - submitted
+                if result.error_class == ERROR_CANCELLED:
+                    # Nicht fertig: weder Journal noch Durchsatz, Log am Ende
+                    if on_result:
+                        on_result(result)
+                    continue
+                completed += 1
+                if result.success and self.sign_index is not None:
+                    self.sign_index.record(
+                        result.file_path,
+                        thumbprint,
+                        timestamped=bool(timestamp_url),
+                    )
+                if session is not None:
+                    try:
+                        session.record(result)
+                    except OSError as e:
+                        if on_log:
+                            on_log(f"  [FEHLER] Journal nicht geschrieben: {e}")
+                if on_result:
+                    on_result(result)
 
-            for idx, file_path in enumerate(files, start=1):
-                filename = Path(file_path).name
-                if on_progress:
-                    on_progress(idx, total, filename)
                 if on_log:
-                    on_log(f"\n[{idx}/{total}] Signiere: {filename}")
+                    prefix = f"  [{Path(result.file_path).name}]" if tagged else " "
+                    if result.success:
+                        on_log(f"{prefix} -> Erfolgreich signiert!")
+                    else:
+                        label = ERROR_LABELS.get(result.error_class, "")
+                        detail = f", {label}" if label else ""
+                        on_log(
+                            f"{prefix} -> FEHLER (Code: {result.return_code}{detail})"
+                        )
+
+            if completed:
+                tracker.record(completed)
+                if on_throughput:
+                    on_throughput(tracker.snapshot())
+
+        def _sign_stage(batch: List[str]) -> List[SignResult]:
+            nonlocal started
+            if cancel is not None and cancel.cancelled:
+                return _cancelled_results(batch)
+            with started_lock:
+                first = started + 1
+                started += len(batch)
+                last = started
+
+            if len(batch) == 1:
+                label = Path(batch[0]).name
+                position = f"{first}/{total}"
+            else:
+                label = f"{Path(batch[0]).name} (+{len(batch) - 1} weitere)"
+                position = f"{first}-{last}/{total}"
 
-                result = self.sign_file(
-                    file_path=file_path,
+            if on_progress:
+                on_progress(last, total, label)
+            if on_log:
+                on_log(f"\n[{position}] Signiere: {label}")
+
+            batch_log = _tagged_log(Path(batch[0]).name)
+
+            def _run(paths: List[str]) -> List[SignResult]:
+                if len(paths) == 1:
+                    return [
+                        self.sign_file(
+                            file_path=paths[0],
+                            thumbprint=thumbprint,
+                            timestamp_url=sign_url,
+                            on_log=batch_log,
+                            cancel=cancel,
+                        )
+                    ]
+                return self.sign_batch(
+                    file_paths=paths,
                     thumbprint=thumbprint,
-                    timestamp_url=timestamp_url,
-                    on_log=on_log,
+                    timestamp_url=sign_url,
+                    on_log=batch_log,
+                    cancel=cancel,
                 )
-                results.append(result)
 
-                if on_result:
-                    on_result(result)
+            return self._with_retries(
+                batch, _run, self.retry_policy, batch_log, cancel
+            )
+
+        def _stamp_batch(
+            sign_results: List[SignResult], submitted: float, queued: float
+        ) -> List[SignResult]:
+            signed = [r for r in sign_results if r.success]
+            if not signed:
+                return sign_results
+            wait = time.monotonic() - queued
+            stamped = self._timestamp_stage(
+                signed,
+                timestamp_url,
+                _tagged_log(f"Zeitstempel {Path(signed[0].file_path).name}"),
+                cancel,
+            )
+            for result in stamped:
+                result.timings.queue_wait += wait
+            _finish(stamped, submitted)
+            by_path = {r.file_path: r for r in stamped}
+            return [by_path[r.file_path] if r.success else r for r in sign_results]
+
+        def _open_journal() -> List[SignResult]:
+            """Journal öffnen; laut Journal bereits signierte Dateien übernehmen."""
+            nonlocal session
+            if self.journal is None:
+                return []
+            try:
+                session = self.journal.open(files, thumbprint)
+            except OSError as e:
+                if on_log:
+                    on_log(f"  [FEHLER] Journal nicht angelegt: {e}")
+                return []
+            resumed: List[SignResult] = []
+            for fp in files:
+                if session.is_done(fp):
+                    result = SignResult(
+                        file_path=fp,
+                        success=True,
+                        return_code=0,
+                        output="",
+                        error="",
+                        skipped=True,
+                    )
+                    resumed.append(result)
+                    if on_result:
+                        on_result(result)
+            if resumed and on_log:
+                on_log(
+                    f"Unterbrochener Vorgang wird fortgesetzt: {len(resumed)} "
+                    f"Datei(en) laut Journal bereits signiert."
+                )
+            return resumed
 
-                if result.success:
+        def _skip_unchanged(candidates: List[str]) -> List[SignResult]:
+            """Bereits signierte, unveränderte Dateien vorab aussortieren."""
+            if self.sign_index is None:
+                return []
+            # Hashen gibt den GIL frei: Prüfung parallel
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="signit-skip"
+            ) as pool:
+                signed = list(
+                    pool.map(
+                        lambda fp: self.sign_index.is_signed(
+                            fp, thumbprint, require_timestamp=bool(timestamp_url)
+                        ),
+                        candidates,
+                    )
+                )
+            skipped: List[SignResult] = []
+            for fp, is_signed in zip(candidates, signed):
+                if is_signed:
+                    result = SignResult(
+                        file_path=fp,
+                        success=True,
+                        return_code=0,
+                        output="",
+                        error="",
+                        skipped=True,
+                    )
+                    skipped.append(result)
+                    if on_result:
+                        on_result(result)
+            if skipped and on_log:
+                on_log(
+                    f"{len(skipped)} Datei(en) unverändert und bereits mit diesem "
+                    f"Zertifikat signiert – übersprungen."
+                )
+            return skipped
+
+        def _worker():
+            nonlocal started
+            results_by_path: Dict[str, SignResult] = {}
+            for result in _open_journal():
+                results_by_path[result.file_path] = result
+            candidates = [fp for fp in files if fp not in results_by_path]
+            for result in _skip_unchanged(candidates):
+                results_by_path[result.file_path] = result
+            started = len(results_by_path)
+
+            pending = [fp for fp in files if fp not in results_by_path]
+            tracker.total = len(pending)
+            batches = self._make_batches(pending, thumbprint, timestamp_url)
+            # Journal und Überspringen (Hashen) nicht als Signierzeit werten
+            tracker.start()
+
+            with ThreadPoolExecutor(
+                max_workers=self.timestamp_workers,
+                thread_name_prefix="signit-timestamp",
+            ) as ts_pool:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_workers, max(len(batches), 1)),
+                    thread_name_prefix="signit-sign",
+                ) as sign_pool:
+
+                    def _run_batch(batch: List[str], submitted: float):
+                        wait = time.monotonic() - submitted
+                        results = _sign_stage(batch)
+                        for result in results:
+                            result.timings.queue_wait += wait
+                        if not self.two_phase:
+                            _finish(results, submitted)
+                            return results
+                        # Fehlgeschlagene Dateien sofort melden, signierte
+                        # an die Timestamp-Stufe weiterreichen
+                        _finish([r for r in results if not r.success], submitted)
+                        return ts_pool.submit(
+                            _stamp_batch, results, submitted, time.monotonic()
+                        )
+
+                    futures = [
+                        sign_pool.submit(_run_batch, b, time.monotonic())
+                        for b in batches
+                    ]
+                    stage_results = [f.result() for f in futures]
+
+                for value in stage_results:
+                    for result in value.result() if self.two_phase else value:
+                        results_by_path[result.file_path] = result
+
+            results = [results_by_path[fp] for fp in files]
+            cancelled = sum(1 for r in results if r.error_class == ERROR_CANCELLED)
+            if cancelled and on_log:
+                on_log(f"\nAbgebrochen: {cancelled} Datei(en) nicht signiert.")
+
+            if session is not None:
+                try:
+                    session.close(complete=not cancelled)
+                except OSError as e:
                     if on_log:
-                        on_log(f"  -> Erfolgreich signiert!")
-                else:
+                        on_log(f"  [FEHLER] Journal nicht abgeschlossen: {e}")
+
+            if self.sign_index is not None:
+                try:
+                    self.sign_index.save()
+                except OSError as e:
                     if on_log:
-                        on_log(f"  -> FEHLER (Code: {result.return_code})")
+                        on_log(f"  [FEHLER] Signatur-Index nicht gespeichert: {e}")
 
             if on_complete:
                 on_complete(results)
 
+        self.throughput = tracker
         thread = threading.Thread(target=_worker, daemon=True)
         thread.start()
+        return thread
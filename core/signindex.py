@@ -0,0 +1,217 @@
+"""
+Let's Do. | SignIT – Persistenter Signatur-Index.
+
+Merkt sich für jede signierte Datei Größe, Änderungszeit und SHA-256 des
+Ergebnisses sowie Thumbprint, Zeitstempel und Zeitpunkt der Signatur. Unveränderte,
+bereits mit demselben Zertifikat signierte Dateien können so ohne
+signtool-Aufruf übersprungen werden. PE-Dateien ohne Eintrag (z. B. auf
+einem frischen Build-Agent) gelten ebenfalls als signiert, wenn ihre
+eingebettete Signatur vom selben Zertifikat stammt und den Inhalt abdeckt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+from core.authenticode import SignatureInfo, read_signature_info
+from core.pedigest import signature_intact
+from core.utils import get_app_data_dir
+
+INDEX_FILENAME = "sign_index.json"
+INDEX_VERSION = 1
+
+_HASH_CHUNK = 1024 * 1024
+
+
+@dataclass
+class IndexEntry:
+    """Zustand einer Datei direkt nach der Signatur."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    thumbprint: str
+    signed_at: str
+    timestamped: bool = False  # ältere Einträge: unbekannt, gilt als ohne
+
+
+def _normalize_thumbprint(thumbprint: str) -> str:
+    return thumbprint.replace(" ", "").upper()
+
+
+def _index_key(file_path: str) -> str:
+    """Schlüssel einer Datei im Index (normalisiert, case-insensitiv unter Windows)."""
+    return os.path.normcase(os.path.abspath(file_path))
+
+
+def hash_file(file_path: str) -> str:
+    """Berechnet den SHA-256 einer Datei blockweise."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SignIndex:
+    """
+    Thread-sicherer Index bereits signierter Dateien.
+
+    Die Prüfung ist O(1) pro Datei: stimmen Größe und mtime mit dem
+    Eintrag überein, gilt die Datei als unverändert. Nur wenn sich
+    lediglich die mtime geändert hat, wird der Inhalt gehasht.
+
+    Verwendung:
+        index = SignIndex()
+        if not index.is_signed(path, thumbprint):
+            ...  # signieren
+            index.record(path, thumbprint, timestamped=True)
+        index.save()
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path) if path else get_app_data_dir() / INDEX_FILENAME
+        self._entries: Dict[str, IndexEntry] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.load()
+
+    def load(self) -> None:
+        """Lädt den Index von der Platte; ein defekter Index wird verworfen."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return
+            entries = {
+                key: IndexEntry(**value) for key, value in data["entries"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        with self._lock:
+            self._entries = entries
+            self._dirty = False
+
+    def save(self) -> None:
+        """Schreibt den Index atomar (temporäre Datei + os.replace)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": INDEX_VERSION,
+                "entries": {key: asdict(e) for key, e in self._entries.items()},
+            }
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def is_signed(
+        self, file_path: str, thumbprint: str, require_timestamp: bool = False
+    ) -> bool:
+        """
+        Prüft, ob die Datei seit der letzten Signatur mit ``thumbprint``
+        unverändert ist.
+
+        Ohne passenden Eintrag wird die eingebettete Signatur geprüft.
+        ``require_timestamp`` verlangt einen Zeitstempel, damit ohne
+        Zeitstempel signierte Dateien (oder solche aus einem abgebrochenen
+        Zwei-Phasen-Lauf) nachgestempelt werden.
+        """
+        if self._matches_entry(file_path, thumbprint, require_timestamp):
+            return True
+        info = self._valid_signature(file_path, thumbprint, require_timestamp)
+        if info is None:
+            return False
+        self.record(file_path, thumbprint, timestamped=info.timestamped)
+        return True
+
+    def _matches_entry(
+        self, file_path: str, thumbprint: str, require_timestamp: bool
+    ) -> bool:
+        key = _index_key(file_path)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry.thumbprint != _normalize_thumbprint(thumbprint):
+            return False
+        if require_timestamp and not entry.timestamped:
+            return False
+
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False
+        if st.st_size != entry.size:
+            return False
+        if st.st_mtime_ns == entry.mtime_ns:
+            return True
+
+        # Nur die mtime ist anders (z. B. Kopie, touch): Inhalt vergleichen
+        try:
+            if hash_file(file_path) != entry.sha256:
+                return False
+        except OSError:
+            return False
+        with self._lock:
+            entry.mtime_ns = st.st_mtime_ns
+            self._dirty = True
+        return True
+
+    @staticmethod
+    def _valid_signature(
+        file_path: str, thumbprint: str, require_timestamp: bool
+    ) -> Optional[SignatureInfo]:
+        """Eingebettete Signatur von ``thumbprint``, die den Inhalt abdeckt."""
+        info = read_signature_info(file_path)
+        signer = _normalize_thumbprint(info.signer_thumbprint or "")
+        if signer != _normalize_thumbprint(thumbprint):
+            return None
+        if require_timestamp and not info.timestamped:
+            return None
+        return info if signature_intact(info) is True else None
+
+    def record(
+        self, file_path: str, thumbprint: str, timestamped: bool = False
+    ) -> None:
+        """
+        Merkt sich den aktuellen Zustand einer frisch signierten Datei.
+
+        Args:
+            timestamped: die Signatur trägt einen Zeitstempel
+        """
+        try:
+            st = os.stat(file_path)
+            sha256 = hash_file(file_path)
+        except OSError:
+            return
+        entry = IndexEntry(
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            sha256=sha256,
+            thumbprint=_normalize_thumbprint(thumbprint),
+            signed_at=datetime.now(timezone.utc).isoformat(),
+            timestamped=timestamped,
+        )
+        with self._lock:
+            self._entries[_index_key(file_path)] = entry
+            self._dirty = True
+
+    def forget(self, file_path: str) -> None:
+        """Entfernt eine Datei aus dem Index."""
+        with self._lock:
+            if self._entries.pop(_index_key(file_path), None) is not None:
+                self._dirty = True
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,286 @@
+"""
+Let's Do. | SignIT – Suche nach signtool.exe in Windows-SDK-Ordnern.
+
+Durchsucht die SDK-Ordner gezielt entlang des bekannten Layouts
+(``bin/<Version>/<Architektur>/signtool.exe``, ältere Kits
+``bin/<Architektur>/signtool.exe``) per ``os.scandir`` statt rekursiv per
+Glob. Gefundene Kandidaten werden nach SDK-Version und Architektur
+gewertet. Das Ergebnis wird zusammen mit den Änderungszeiten der besuchten
+Ordner gespeichert; solange diese unverändert sind, entfällt die Suche.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import re
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.utils import SIGNTOOL_SEARCH_PATHS, find_signtool_in_path, get_app_data_dir
+
+CACHE_FILENAME = "signtool_cache.json"
+CACHE_VERSION = 1
+
+SIGNTOOL_NAME = "signtool.exe"
+
+# Architektur-Ordner der Windows SDKs
+KNOWN_ARCHITECTURES = ("x64", "x86", "arm64", "arm")
+
+_VERSION = re.compile(r"\d+(?:\.\d+)+")
+_KIT_VERSION = re.compile(r"\d+(?:\.\d+)*")  # Kit-Ordner heißen auch nur "10"
+
+
+def parse_version(
+    name: str, pattern: re.Pattern = _VERSION
+) -> Optional[Tuple[int, ...]]:
+    """
+    Liest eine Versionsnummer aus einem Ordnernamen.
+
+    ``'10.0.22621.0'`` → ``(10, 0, 22621, 0)``, ``'v10.0A'`` → ``(10, 0)``,
+    ohne Versionsnummer ``None``.
+    """
+    match = pattern.search(name)
+    if not match:
+        return None
+    return tuple(int(part) for part in match.group(0).split("."))
+
+
+def preferred_architectures(machine: Optional[str] = None) -> Tuple[str, ...]:
+    """Architekturen in der Reihenfolge der Bevorzugung für diesen Rechner."""
+    machine = (machine or platform.machine()).lower()
+    if machine in ("arm64", "aarch64"):
+        return ("arm64", "x64", "x86", "arm")
+    if machine in ("x86", "i386", "i686"):
+        return ("x86", "arm", "x64", "arm64")
+    return ("x64", "x86", "arm64", "arm")
+
+
+@dataclass
+class SignToolCandidate:
+    """Ein gefundenes signtool.exe."""
+
+    path: str
+    version: Tuple[int, ...]  # () = unbekannt
+    arch: str  # "" = unbekannt (z. B. ClickOnce)
+
+    def sort_key(self, architectures: Sequence[str]) -> Tuple:
+        """Sortierschlüssel: neueste Version zuerst, dann bevorzugte Architektur."""
+        rank = (
+            architectures.index(self.arch)
+            if self.arch in architectures
+            else len(architectures)
+        )
+        return (tuple(-v for v in self.version) + (1,), rank, self.path.lower())
+
+
+def _subdirs(path: str) -> List[os.DirEntry]:
+    try:
+        with os.scandir(path) as entries:
+            return [e for e in entries if e.is_dir()]
+    except OSError:
+        return []
+
+
+def _find_file(directory: str, name: str) -> Optional[str]:
+    """Sucht ``name`` in ``directory`` ohne Beachtung der Groß-/Kleinschreibung."""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.lower() == name and entry.is_file():
+                    return os.path.normpath(entry.path)
+    except OSError:
+        pass
+    return None
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def scan_root(
+    root: str, visited: Optional[Dict[str, Optional[int]]] = None
+) -> List[SignToolCandidate]:
+    """
+    Sucht signtool.exe unterhalb eines SDK-``bin``-Ordners.
+
+    Besucht nur ``root``, Versions- und Architektur-Ordner; andere
+    Unterordner werden nicht betreten.
+
+    Args:
+        root: z. B. ``C:\\Program Files (x86)\\Windows Kits\\10\\bin``
+        visited: erhält {Ordner: mtime_ns} aller besuchten Ordner inkl.
+                 Architektur-Ordner (zur späteren Prüfung, ob sich etwas
+                 geändert hat)
+    """
+    visited = visited if visited is not None else {}
+    visited[root] = _mtime_ns(root)
+    if visited[root] is None:
+        return []
+
+    # Version des Kits aus dem Pfad (z. B. "Windows Kits\8.1\bin")
+    kit_name = os.path.basename(os.path.dirname(os.path.normpath(root)))
+    kit_version = parse_version(kit_name, _KIT_VERSION) or ()
+    candidates: List[SignToolCandidate] = []
+
+    direct = _find_file(root, SIGNTOOL_NAME)  # z. B. ClickOnce\SignTool
+    if direct:
+        candidates.append(SignToolCandidate(direct, kit_version, ""))
+
+    for entry in _subdirs(root):
+        name = entry.name.lower()
+        if name in KNOWN_ARCHITECTURES:
+            visited[entry.path] = _mtime_ns(entry.path)
+            found = _find_file(entry.path, SIGNTOOL_NAME)
+            if found:
+                candidates.append(SignToolCandidate(found, kit_version, name))
+            continue
+
+        version = parse_version(entry.name)
+        if version is None:
+            continue
+        visited[entry.path] = _mtime_ns(entry.path)
+        for arch_dir in _subdirs(entry.path):
+            arch = arch_dir.name.lower()
+            if arch not in KNOWN_ARCHITECTURES:
+                continue
+            # Auch ein nachträglich befüllter Architektur-Ordner entwertet den Cache
+            visited[arch_dir.path] = _mtime_ns(arch_dir.path)
+            found = _find_file(arch_dir.path, SIGNTOOL_NAME)
+            if found:
+                candidates.append(SignToolCandidate(found, version, arch))
+    return candidates
+
+
+def scan_signtools(
+    roots: Sequence[str] = SIGNTOOL_SEARCH_PATHS,
+    architectures: Optional[Sequence[str]] = None,
+    visited: Optional[Dict[str, Optional[int]]] = None,
+) -> List[SignToolCandidate]:
+    """
+    Sucht signtool.exe in allen ``roots``.
+
+    Returns:
+        Kandidaten ohne Duplikate, beste zuerst (neueste SDK-Version,
+        dann bevorzugte Architektur)
+    """
+    architectures = architectures or preferred_architectures()
+    seen = set()
+    candidates: List[SignToolCandidate] = []
+    for root in roots:
+        for candidate in scan_root(root, visited):
+            key = os.path.normcase(candidate.path)
+            if key not in seen:
+                seen.add(key)
+                candidates.append(candidate)
+    candidates.sort(key=lambda c: c.sort_key(architectures))
+    return candidates
+
+
+class SignToolLocator:
+    """
+    Findet signtool.exe und merkt sich das Ergebnis über Programmstarts.
+
+    Der Cache gilt, solange sich die Änderungszeiten aller beim Scan
+    besuchten Ordner nicht geändert haben und der beste Kandidat noch
+    existiert – ein neu installiertes SDK ändert ``bin`` und löst damit
+    einen neuen Scan aus.
+
+    Verwendung:
+        locator = SignToolLocator()
+        path = locator.locate()         # PATH, dann Cache bzw. Scan
+        locator.candidates              # alle Kandidaten, beste zuerst
+    """
+
+    def __init__(
+        self,
+        roots: Optional[Sequence[str]] = None,
+        cache_path: Optional[str] = None,
+        architectures: Optional[Sequence[str]] = None,
+    ):
+        self.roots = list(roots if roots is not None else SIGNTOOL_SEARCH_PATHS)
+        self.cache_path = (
+            Path(cache_path) if cache_path else get_app_data_dir() / CACHE_FILENAME
+        )
+        self.architectures = tuple(architectures or preferred_architectures())
+        self.candidates: List[SignToolCandidate] = []
+        self.from_cache = False
+        self._lock = threading.Lock()
+
+    def _load_cache(self) -> Optional[List[SignToolCandidate]]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION or data.get("roots") != self.roots:
+                return None
+            for directory, mtime_ns in data["directories"].items():
+                if _mtime_ns(directory) != mtime_ns:
+                    return None
+            candidates = [
+                SignToolCandidate(c["path"], tuple(c["version"]), c["arch"])
+                for c in data["candidates"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if candidates and not os.path.isfile(candidates[0].path):
+            return None
+        return candidates
+
+    def _save_cache(
+        self,
+        candidates: List[SignToolCandidate],
+        directories: Dict[str, Optional[int]],
+    ) -> None:
+        data = {
+            "version": CACHE_VERSION,
+            "roots": self.roots,
+            "directories": directories,
+            "candidates": [asdict(c) for c in candidates],
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass  # Cache ist optional
+
+    def scan(self, use_cache: bool = True) -> List[SignToolCandidate]:
+        """
+        Kandidaten aus dem Cache oder per Scan der SDK-Ordner.
+
+        Args:
+            use_cache: False erzwingt einen neuen Scan
+        """
+        with self._lock:
+            cached = self._load_cache() if use_cache else None
+            if cached is not None:
+                self.candidates, self.from_cache = cached, True
+                return cached
+
+            directories: Dict[str, Optional[int]] = {}
+            candidates = scan_signtools(self.roots, self.architectures, directories)
+            self._save_cache(candidates, directories)
+            self.candidates, self.from_cache = candidates, False
+            return candidates
+
+    def locate(self, use_cache: bool = True) -> Optional[str]:
+        """
+        Findet signtool.exe – erst im PATH, dann in den SDK-Ordnern.
+
+        Returns:
+            Pfad zu signtool.exe oder None
+        """
+        path_result = find_signtool_in_path()
+        if path_result:
+            self.candidates, self.from_cache = [], False
+            return path_result
+        candidates = self.scan(use_cache)
+        return candidates[0].path if candidates else None
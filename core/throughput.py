@@ -0,0 +1,125 @@
+"""
+Let's Do. | SignIT – Durchsatz und Restzeit eines Signiervorgangs.
+
+Zählt abgeschlossene Dateien in einem gleitenden Zeitfenster und leitet
+daraus Dateien pro Minute und die voraussichtliche Restzeit ab. Das
+Fenster glättet Batches (mehrere Dateien auf einmal fertig) und passt
+sich an, wenn ein Timestamp-Server langsamer wird.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Optional, Tuple
+
+DEFAULT_WINDOW = 30.0  # Sekunden
+
+
+@dataclass(frozen=True)
+class ThroughputSnapshot:
+    """Momentaufnahme des Durchsatzes."""
+
+    done: int
+    total: int
+    elapsed: float  # Sekunden seit Start
+    files_per_minute: Optional[float]  # None = noch keine Messung
+    eta: Optional[float]  # Restzeit in Sekunden (None = unbekannt)
+
+    @property
+    def remaining(self) -> int:
+        return max(self.total - self.done, 0)
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Formatiert Sekunden als ``m:ss`` bzw. ``h:mm:ss`` (None = "–")."""
+    if seconds is None:
+        return "–"
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+class ThroughputTracker:
+    """
+    Thread-sicherer Durchsatzzähler mit gleitendem Fenster.
+
+    Verwendung:
+        tracker = ThroughputTracker(total=len(files))
+        tracker.start()                     # optional: Uhr neu starten
+        tracker.record(len(batch))          # aus Worker-Threads
+        snap = tracker.snapshot()           # files_per_minute, eta
+    """
+
+    def __init__(
+        self,
+        total: int,
+        window: float = DEFAULT_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            total: Anzahl der zu bearbeitenden Dateien
+            window: Länge des gleitenden Fensters in Sekunden
+            clock: Zeitquelle (monoton)
+        """
+        self.total = total
+        self.window = window
+        self._clock = clock
+        self._started = clock()
+        self._done = 0
+        self._events: Deque[Tuple[float, int]] = deque()
+        self._in_window = 0
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Startet die Uhr neu, z. B. wenn die eigentliche Arbeit erst nach
+        einer Vorbereitung beginnt (sonst zählt diese als langsamer Start).
+        """
+        with self._lock:
+            self._started = self._clock()
+
+    def record(self, count: int = 1) -> None:
+        """Meldet ``count`` abgeschlossene Dateien."""
+        if count <= 0:
+            return
+        now = self._clock()
+        with self._lock:
+            self._done += count
+            self._events.append((now, count))
+            self._in_window += count
+            self._expire(now)
+
+    def _expire(self, now: float) -> None:
+        limit = now - self.window
+        while self._events and self._events[0][0] < limit:
+            self._in_window -= self._events.popleft()[1]
+
+    def snapshot(self) -> ThroughputSnapshot:
+        """Aktueller Durchsatz und Restzeit."""
+        now = self._clock()
+        with self._lock:
+            self._expire(now)
+            done, in_window = self._done, self._in_window
+        elapsed = now - self._started
+        span = min(elapsed, self.window)
+
+        rate: Optional[float] = None  # Dateien pro Sekunde
+        if done and span > 0:
+            rate = in_window / span
+        eta: Optional[float] = None
+        if rate:
+            eta = max(self.total - done, 0) / rate
+        return ThroughputSnapshot(
+            done=done,
+            total=self.total,
+            elapsed=elapsed,
+            files_per_minute=rate * 60 if rate is not None else None,
+            eta=eta,
+        )
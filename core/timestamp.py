@@ -0,0 +1,236 @@
+"""
+Let's Do. | SignIT – Timestamp-Server-Auswahl.
+
+Misst Latenz und Fehlerquote der Timestamp-Server in einem gleitenden
+Fenster, leitet jede Anfrage an den aktuell schnellsten gesunden Server
+und sperrt wiederholt fehlschlagende Server per Circuit Breaker, bis sie
+nach einer Abkühlzeit erneut getestet werden.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+# Zustände des Circuit Breakers
+STATE_CLOSED = "closed"  # Server wird normal verwendet
+STATE_OPEN = "open"  # Server gesperrt bis zum Ablauf der Abkühlzeit
+STATE_HALF_OPEN = "half_open"  # Eine Test-Anfrage ist unterwegs
+
+
+@dataclass
+class ServerStats:
+    """Rollierende Statistik und Breaker-Zustand eines Timestamp-Servers."""
+
+    url: str
+    samples: Deque[Tuple[float, bool]] = field(default_factory=deque)
+    state: str = STATE_CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    cooldown: float = 0.0
+
+    @property
+    def mean_latency(self) -> Optional[float]:
+        """Mittlere Latenz erfolgreicher Anfragen im Fenster (None = unbekannt)."""
+        latencies = [lat for lat, ok in self.samples if ok]
+        if not latencies:
+            return None
+        return sum(latencies) / len(latencies)
+
+    @property
+    def error_rate(self) -> float:
+        """Anteil fehlgeschlagener Anfragen im Fenster (0.0 – 1.0)."""
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, ok in self.samples if not ok) / len(self.samples)
+
+
+class TimestampSelector:
+    """
+    Thread-sichere Auswahl des schnellsten gesunden Timestamp-Servers.
+
+    Verwendung:
+        selector = TimestampSelector([url for _, url in TIMESTAMP_SERVERS])
+        url = selector.choose()
+        ...  # signtool mit url ausführen
+        selector.record(url, latency=elapsed, success=ok)
+        # oder, wenn der Aufruf nichts über den Server aussagt:
+        selector.release(url)
+
+    Jedes ``choose()`` muss mit ``record()`` oder ``release()`` abgeschlossen
+    werden, sonst bleibt eine Test-Anfrage (half-open) offen.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        window: int = 20,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0,
+        max_cooldown: float = 600.0,
+        default_latency: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            urls: Timestamp-Server in bevorzugter Reihenfolge
+            window: Anzahl der Messwerte im gleitenden Fenster je Server
+            failure_threshold: Fehler in Folge, ab denen der Breaker öffnet
+            cooldown: Sekunden bis zur ersten Test-Anfrage nach dem Öffnen
+            max_cooldown: Obergrenze der verdoppelten Abkühlzeit
+            default_latency: Angenommene Latenz für noch ungemessene Server
+            clock: Zeitquelle (injizierbar für Tests)
+        """
+        if not urls:
+            raise ValueError("Mindestens ein Timestamp-Server erforderlich")
+
+        self._order = list(dict.fromkeys(urls))
+        self._stats: Dict[str, ServerStats] = {
+            url: ServerStats(url=url, samples=deque(maxlen=window))
+            for url in self._order
+        }
+        self._failure_threshold = max(1, failure_threshold)
+        self._cooldown = cooldown
+        self._max_cooldown = max_cooldown
+        self._default_latency = default_latency
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    @property
+    def urls(self) -> List[str]:
+        """Alle bekannten Server in konfigurierter Reihenfolge."""
+        return list(self._order)
+
+    def _score(self, stats: ServerStats) -> float:
+        """Niedriger ist besser: Latenz, gewichtet mit der Fehlerquote."""
+        latency = stats.mean_latency
+        if latency is None:
+            latency = self._default_latency
+        return latency / max(1.0 - stats.error_rate, 0.1)
+
+    def choose(self) -> str:
+        """
+        Liefert die URL des aktuell besten Servers.
+
+        Gesperrte Server, deren Abkühlzeit abgelaufen ist, erhalten genau
+        eine Test-Anfrage (half-open). Sind alle Server gesperrt, wird der
+        Server gewählt, dessen Sperre am frühesten endet.
+        """
+        with self._lock:
+            now = self._clock()
+
+            for url in self._order:
+                stats = self._stats[url]
+                if stats.state == STATE_OPEN and now - stats.opened_at >= stats.cooldown:
+                    stats.state = STATE_HALF_OPEN
+                    return url
+
+            healthy = [
+                (self._score(self._stats[url]), idx, url)
+                for idx, url in enumerate(self._order)
+                if self._stats[url].state == STATE_CLOSED
+            ]
+            if healthy:
+                return min(healthy)[2]
+
+            return min(
+                self._order,
+                key=lambda u: self._stats[u].opened_at + self._stats[u].cooldown,
+            )
+
+    def record(self, url: str, latency: float, success: bool) -> None:
+        """
+        Meldet das Ergebnis einer Anfrage an ``url``.
+
+        Args:
+            url: Verwendeter Server
+            latency: Dauer der Anfrage in Sekunden
+            success: True, wenn der Zeitstempel erfolgreich war
+        """
+        with self._lock:
+            stats = self._stats.get(url)
+            if stats is None:
+                return
+
+            stats.samples.append((latency, success))
+            if success:
+                stats.consecutive_failures = 0
+                stats.state = STATE_CLOSED
+                stats.cooldown = 0.0
+                return
+
+            stats.consecutive_failures += 1
+            if stats.state == STATE_HALF_OPEN:
+                # Test-Anfrage fehlgeschlagen: erneut sperren, Abkühlzeit verdoppeln
+                stats.cooldown = min(stats.cooldown * 2, self._max_cooldown)
+                stats.state = STATE_OPEN
+                stats.opened_at = self._clock()
+            elif (
+                stats.state == STATE_CLOSED
+                and stats.consecutive_failures >= self._failure_threshold
+            ):
+                stats.cooldown = self._cooldown
+                stats.state = STATE_OPEN
+                stats.opened_at = self._clock()
+
+    def release(self, url: str) -> None:
+        """
+        Gibt eine gewählte URL ohne Ergebnis zurück (abgebrochen oder ohne
+        Zeitstempel fehlgeschlagen).
+
+        Eine offene Test-Anfrage wird zurück auf gesperrt gesetzt; da
+        ``opened_at`` erhalten bleibt, ist der Server beim nächsten
+        ``choose()`` sofort wieder Testkandidat.
+        """
+        with self._lock:
+            stats = self._stats.get(url)
+            if stats is not None and stats.state == STATE_HALF_OPEN:
+                stats.state = STATE_OPEN
+
+    def probe(self, url: str, timeout: float = 5.0) -> bool:
+        """
+        Prüft die Erreichbarkeit eines Servers per HTTP und meldet die Latenz.
+
+        Jede HTTP-Antwort unter 500 zählt als erreichbar – TSA-Endpunkte
+        beantworten leere Anfragen üblicherweise mit 4xx.
+        """
+        # Erst hier importieren: urllib/http.client kosten Startzeit (CLI)
+        import urllib.error
+        import urllib.request
+
+        start = self._clock()
+        try:
+            with urllib.request.urlopen(url, timeout=timeout) as response:
+                ok = response.status < 500
+        except urllib.error.HTTPError as e:
+            ok = e.code < 500
+        except Exception:
+            ok = False
+        self.record(url, self._clock() - start, ok)
+        return ok
+
+    def probe_all(self, timeout: float = 5.0) -> Dict[str, bool]:
+        """Testet alle Server parallel und liefert {url: erreichbar}."""
+        with ThreadPoolExecutor(
+            max_workers=len(self._order), thread_name_prefix="signit-tsa-probe"
+        ) as pool:
+            results = pool.map(lambda u: self.probe(u, timeout), self._order)
+            return dict(zip(self._order, results))
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        """Aktuelle Statistik aller Server (z. B. für Log-Ausgaben)."""
+        with self._lock:
+            return [
+                {
+                    "url": url,
+                    "state": self._stats[url].state,
+                    "mean_latency": self._stats[url].mean_latency,
+                    "error_rate": self._stats[url].error_rate,
+                    "samples": len(self._stats[url].samples),
+                }
+                for url in self._order
+            ]
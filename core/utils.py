@@ -9,7 +9,6 @@ from __future__ import annotations
 
 import os
 import shutil
-import glob
 from pathlib import Path
 from typing import List, Optional
 
@@ -35,6 +34,19 @@ TIMESTAMP_SERVERS = [
 ]
 
 
+def get_app_data_dir() -> Path:
+    """
+    Liefert das Verzeichnis für persistente Anwendungsdaten (Caches, Index).
+
+    Windows: %LOCALAPPDATA%\\SignIT, sonst ~/.signit. Das Verzeichnis
+    wird bei Bedarf angelegt.
+    """
+    base = os.environ.get("LOCALAPPDATA")
+    path = Path(base) / "SignIT" if base else Path.home() / ".signit"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def find_signtool_in_path() -> Optional[str]:
     """
     Sucht signtool.exe im System-PATH.
@@ -48,58 +60,35 @@ def find_signtool_in_path() -> Optional[str]:
     return None
 
 
-def find_signtool_in_windows_kits() -> List[str]:
+def find_signtool_in_windows_kits(roots: Optional[List[str]] = None) -> List[str]:
     """
     Durchsucht bekannte Windows SDK-Installationspfade nach signtool.exe.
 
+    Args:
+        roots: zu durchsuchende ``bin``-Ordner (Standard: SIGNTOOL_SEARCH_PATHS)
+
     Returns:
-        Liste gefundener signtool.exe-Pfade (neueste zuerst)
+        Liste gefundener signtool.exe-Pfade (beste zuerst: neueste SDK-Version,
+        dann bevorzugte Architektur)
     """
-    found: List[str] = []
-
-    for base_path in SIGNTOOL_SEARCH_PATHS:
-        if not os.path.exists(base_path):
-            continue
-
-        # Rekursiv nach signtool.exe suchen
-        pattern = os.path.join(base_path, "**", "signtool.exe")
-        matches = glob.glob(pattern, recursive=True)
-        found.extend(matches)
+    from core.signtoolsearch import scan_signtools
 
-    # Doppelte entfernen und nach Pfad sortieren (neuere SDKs = höhere Versionen)
-    seen = set()
-    unique: List[str] = []
-    for p in sorted(found, reverse=True):
-        norm = os.path.normpath(p).lower()
-        if norm not in seen:
-            seen.add(norm)
-            unique.append(os.path.normpath(p))
+    return [c.path for c in scan_signtools(roots or SIGNTOOL_SEARCH_PATHS)]
 
-    return unique
 
-
-def find_signtool() -> Optional[str]:
+def find_signtool(use_cache: bool = True) -> Optional[str]:
     """
     Findet signtool.exe – erst im PATH, dann in Windows SDK-Ordnern.
 
+    Das Ergebnis der SDK-Suche wird zwischengespeichert (siehe
+    core.signtoolsearch.SignToolLocator).
+
     Returns:
         Pfad zu signtool.exe oder None
     """
-    # Zuerst im PATH suchen
-    path_result = find_signtool_in_path()
-    if path_result:
-        return path_result
-
-    # Dann in bekannten Installationsordnern
-    kit_results = find_signtool_in_windows_kits()
-    if kit_results:
-        # Bevorzuge x64-Version
-        for p in kit_results:
-            if "x64" in p.lower():
-                return p
-        return kit_results[0]
+    from core.signtoolsearch import SignToolLocator
 
-    return None
+    return SignToolLocator().locate(use_cache)
 
 
 def validate_signtool(path: str) -> bool:
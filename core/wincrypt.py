@@ -0,0 +1,300 @@
+"""
+Let's Do. | SignIT – Win32-Bindung an den Windows-Zertifikatsspeicher.
+
+ctypes-Strukturen und crypt32/advapi32/ncrypt-Funktionen. Die DLLs werden
+beim Import dieses Moduls gebunden – core.certstore importiert es erst,
+wenn der native Provider tatsächlich verwendet wird.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.wintypes as wt
+from datetime import datetime, timezone
+from typing import List
+
+from core.certstore import CertInfo
+from core.x509 import parse_certificate
+
+# ---------------------------------------------------------------------------
+# Win32-API-Konstanten & -Strukturen
+# ---------------------------------------------------------------------------
+CERT_STORE_PROV_SYSTEM = 10
+CERT_SYSTEM_STORE_CURRENT_USER = 0x00010000
+CERT_SYSTEM_STORE_LOCAL_MACHINE = 0x00020000
+X509_ASN_ENCODING = 0x00000001
+PKCS_7_ASN_ENCODING = 0x00010000
+ENCODING = X509_ASN_ENCODING | PKCS_7_ASN_ENCODING
+CERT_FIND_ANY = 0
+
+
+class CRYPT_DATA_BLOB(ctypes.Structure):
+    _fields_ = [
+        ("cbData", wt.DWORD),
+        ("pbData", ctypes.POINTER(ctypes.c_byte)),
+    ]
+
+
+class CRYPT_BIT_BLOB(ctypes.Structure):
+    _fields_ = [
+        ("cbData", wt.DWORD),
+        ("pbData", ctypes.POINTER(ctypes.c_byte)),
+        ("cUnusedBits", wt.DWORD),
+    ]
+
+
+class CRYPT_ALGORITHM_IDENTIFIER(ctypes.Structure):
+    _fields_ = [
+        ("pszObjId", ctypes.c_char_p),
+        ("Parameters", CRYPT_DATA_BLOB),
+    ]
+
+
+class CERT_PUBLIC_KEY_INFO(ctypes.Structure):
+    _fields_ = [
+        ("Algorithm", CRYPT_ALGORITHM_IDENTIFIER),
+        ("PublicKey", CRYPT_BIT_BLOB),
+    ]
+
+
+class FILETIME(ctypes.Structure):
+    _fields_ = [
+        ("dwLowDateTime", wt.DWORD),
+        ("dwHighDateTime", wt.DWORD),
+    ]
+
+
+class CERT_INFO(ctypes.Structure):
+    _fields_ = [
+        ("dwVersion", wt.DWORD),
+        ("SerialNumber", CRYPT_DATA_BLOB),
+        ("SignatureAlgorithm", CRYPT_ALGORITHM_IDENTIFIER),
+        ("Issuer", CRYPT_DATA_BLOB),
+        ("NotBefore", FILETIME),
+        ("NotAfter", FILETIME),
+        ("Subject", CRYPT_DATA_BLOB),
+        ("SubjectPublicKeyInfo", CERT_PUBLIC_KEY_INFO),
+        ("IssuerUniqueId", CRYPT_BIT_BLOB),
+        ("SubjectUniqueId", CRYPT_BIT_BLOB),
+        ("cExtension", wt.DWORD),
+        ("rgExtension", ctypes.c_void_p),
+    ]
+
+
+class CERT_CONTEXT(ctypes.Structure):
+    _fields_ = [
+        ("dwCertEncodingType", wt.DWORD),
+        ("pbCertEncoded", ctypes.POINTER(ctypes.c_byte)),
+        ("cbCertEncoded", wt.DWORD),
+        ("pCertInfo", ctypes.POINTER(CERT_INFO)),
+        ("hCertStore", ctypes.c_void_p),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Win32-API-Funktionen laden
+# ---------------------------------------------------------------------------
+_crypt32 = ctypes.windll.crypt32  # type: ignore[attr-defined]
+
+CertOpenStore = _crypt32.CertOpenStore
+CertOpenStore.argtypes = [
+    ctypes.c_char_p,  # lpszStoreProvider
+    wt.DWORD,  # dwEncodingType
+    ctypes.c_void_p,  # hCryptProv
+    wt.DWORD,  # dwFlags
+    ctypes.c_wchar_p,  # pvPara
+]
+CertOpenStore.restype = ctypes.c_void_p
+
+CertFindCertificateInStore = _crypt32.CertFindCertificateInStore
+CertFindCertificateInStore.argtypes = [
+    ctypes.c_void_p,  # hCertStore
+    wt.DWORD,  # dwCertEncodingType
+    wt.DWORD,  # dwFindFlags
+    wt.DWORD,  # dwFindType
+    ctypes.c_void_p,  # pvFindPara
+    ctypes.POINTER(CERT_CONTEXT),  # pPrevCertContext
+]
+CertFindCertificateInStore.restype = ctypes.POINTER(CERT_CONTEXT)
+
+CertCloseStore = _crypt32.CertCloseStore
+CertCloseStore.argtypes = [ctypes.c_void_p, wt.DWORD]
+CertCloseStore.restype = wt.BOOL
+
+CertFreeCertificateContext = _crypt32.CertFreeCertificateContext
+CertFreeCertificateContext.argtypes = [ctypes.POINTER(CERT_CONTEXT)]
+CertFreeCertificateContext.restype = wt.BOOL
+
+_advapi32 = ctypes.windll.advapi32  # type: ignore[attr-defined]
+CryptReleaseContext = _advapi32.CryptReleaseContext
+CryptReleaseContext.argtypes = [ctypes.c_void_p, wt.DWORD]
+CryptReleaseContext.restype = wt.BOOL
+
+try:
+    _ncrypt = ctypes.windll.ncrypt  # type: ignore[attr-defined]
+    NCryptFreeObject = _ncrypt.NCryptFreeObject
+    NCryptFreeObject.argtypes = [ctypes.c_void_p]
+    NCryptFreeObject.restype = wt.DWORD
+except Exception:
+    NCryptFreeObject = None
+
+# CryptAcquireCertificatePrivateKey – prüft ob Private Key vorhanden
+CryptAcquireCertificatePrivateKey = _crypt32.CryptAcquireCertificatePrivateKey
+CryptAcquireCertificatePrivateKey.argtypes = [
+    ctypes.POINTER(CERT_CONTEXT),  # pCert
+    wt.DWORD,  # dwFlags
+    ctypes.c_void_p,  # pvParameters
+    ctypes.POINTER(ctypes.c_void_p),  # phCryptProvOrNCryptKey
+    ctypes.POINTER(wt.DWORD),  # pdwKeySpec
+    ctypes.POINTER(wt.BOOL),  # pfCallerFreeProvOrNCryptKey
+]
+CryptAcquireCertificatePrivateKey.restype = wt.BOOL
+
+CRYPT_ACQUIRE_SILENT_FLAG = 0x00000040
+CRYPT_ACQUIRE_CACHE_FLAG = 0x00000001
+CERT_NCRYPT_KEY_SPEC = 0xFFFFFFFF
+
+
+# ---------------------------------------------------------------------------
+# Hilfsfunktionen
+# ---------------------------------------------------------------------------
+def _get_thumbprint(ctx: ctypes.POINTER(CERT_CONTEXT)) -> str:
+    """Berechnet den SHA-1-Thumbprint des Zertifikats."""
+    import hashlib
+
+    cert_data = ctypes.string_at(
+        ctx.contents.pbCertEncoded,
+        ctx.contents.cbCertEncoded,
+    )
+    return hashlib.sha1(cert_data).hexdigest().upper()
+
+
+def _has_private_key(ctx: ctypes.POINTER(CERT_CONTEXT)) -> bool:
+    """Prüft, ob das Zertifikat einen privaten Schlüssel besitzt."""
+    hProv = ctypes.c_void_p()
+    dwKeySpec = wt.DWORD()
+    fCallerFree = wt.BOOL()
+    result = CryptAcquireCertificatePrivateKey(
+        ctx,
+        CRYPT_ACQUIRE_SILENT_FLAG | CRYPT_ACQUIRE_CACHE_FLAG,
+        None,
+        ctypes.byref(hProv),
+        ctypes.byref(dwKeySpec),
+        ctypes.byref(fCallerFree),
+    )
+    if not result:
+        return False
+
+    # FIX #2: Akquirierte Key-Handles freigeben, um Handle-Leaks zu vermeiden.
+    if bool(fCallerFree) and hProv.value:
+        try:
+            if dwKeySpec.value == CERT_NCRYPT_KEY_SPEC and NCryptFreeObject:
+                NCryptFreeObject(hProv)
+            else:
+                CryptReleaseContext(hProv, 0)
+        except Exception:
+            pass
+
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Speicher auslesen
+# ---------------------------------------------------------------------------
+def _open_store(store_location: str) -> int:
+    """Öffnet ``<store_location>\\My``; schließen mit CertCloseStore."""
+    flags = (
+        CERT_SYSTEM_STORE_CURRENT_USER
+        if store_location == "CurrentUser"
+        else CERT_SYSTEM_STORE_LOCAL_MACHINE
+    )
+
+    store = CertOpenStore(
+        ctypes.c_char_p(CERT_STORE_PROV_SYSTEM),
+        0,
+        None,
+        flags,
+        "My",
+    )
+    if not store:
+        raise OSError(
+            f"Zertifikatsspeicher konnte nicht geöffnet werden "
+            f"(Store: {store_location}\\My)"
+        )
+    return store
+
+
+def read_store(store_location: str = "CurrentUser") -> List[CertInfo]:
+    """
+    Liest Zertifikate aus dem Windows-Zertifikatsspeicher über Win32-API.
+
+    Args:
+        store_location: 'CurrentUser' oder 'LocalMachine'
+
+    Returns:
+        Liste von CertInfo-Objekten (nur gültige Zertifikate mit Private Key)
+    """
+    store = _open_store(store_location)
+    certs: List[CertInfo] = []
+    ctx = None
+    now = datetime.now(timezone.utc)
+
+    try:
+        while True:
+            ctx = CertFindCertificateInStore(
+                store, ENCODING, 0, CERT_FIND_ANY, None, ctx
+            )
+            if not ctx:
+                break
+
+            # Ein Durchlauf über die DER-Bytes statt mehrerer Win32-Aufrufe
+            encoded = ctypes.string_at(
+                ctx.contents.pbCertEncoded, ctx.contents.cbCertEncoded
+            )
+            try:
+                parsed = parse_certificate(encoded)
+            except ValueError:
+                continue
+
+            # Nur gültige Code-Signing-Zertifikate – vor der teuren
+            # Private-Key-Prüfung (Smartcard/HSM) aussortieren
+            if parsed.not_after <= now or not parsed.is_code_signing:
+                continue
+            if not _has_private_key(ctx):
+                continue
+
+            cert = CertInfo(
+                subject=parsed.subject,
+                issuer=parsed.issuer,
+                thumbprint=parsed.thumbprint,
+                not_after=parsed.not_after,
+                has_private_key=True,
+            )
+            certs.append(cert)
+    finally:
+        CertCloseStore(store, 0)
+
+    return certs
+
+
+def store_thumbprints(store_location: str = "CurrentUser") -> List[str]:
+    """
+    Liefert die SHA-1-Thumbprints aller Zertifikate im Speicher.
+
+    Ohne Zugriff auf private Schlüssel und ohne Namensauflösung – dient
+    als günstige Änderungserkennung für den Zertifikats-Cache.
+    """
+    store = _open_store(store_location)
+    thumbprints: List[str] = []
+    ctx = None
+    try:
+        while True:
+            ctx = CertFindCertificateInStore(
+                store, ENCODING, 0, CERT_FIND_ANY, None, ctx
+            )
+            if not ctx:
+                break
+            thumbprints.append(_get_thumbprint(ctx))
+    finally:
+        CertCloseStore(store, 0)
+    return thumbprints
@@ -0,0 +1,205 @@
+"""
+Let's Do. | SignIT – X.509-Zertifikate lesen.
+
+Liest Anzeigenamen, Gültigkeit, Extended Key Usage, Key Usage und die
+SHA-1-/SHA-256-Thumbprints in einem Durchlauf direkt aus den DER-kodierten
+Zertifikatsbytes (core.der) – ohne Win32-API und ohne externe
+Abhängigkeiten. Enthält außerdem einen Leser für PEM-Dateien.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import FrozenSet, List, Optional, Tuple
+
+from core import der
+
+OID_COMMON_NAME = "2.5.4.3"
+OID_ORGANIZATIONAL_UNIT = "2.5.4.11"
+OID_ORGANIZATION = "2.5.4.10"
+OID_EMAIL_ADDRESS = "1.2.840.113549.1.9.1"
+
+OID_KEY_USAGE = "2.5.29.15"
+OID_EXTENDED_KEY_USAGE = "2.5.29.37"
+OID_ANY_EXTENDED_KEY_USAGE = "2.5.29.37.0"
+OID_CODE_SIGNING = "1.3.6.1.5.5.7.3.3"
+
+# Bits der Key-Usage-Extension (RFC 5280, Bit 0 = höchstwertiges Bit)
+KEY_USAGE_NAMES = (
+    "digitalSignature",
+    "nonRepudiation",
+    "keyEncipherment",
+    "dataEncipherment",
+    "keyAgreement",
+    "keyCertSign",
+    "cRLSign",
+    "encipherOnly",
+    "decipherOnly",
+)
+
+# Reihenfolge wie CERT_NAME_SIMPLE_DISPLAY_TYPE unter Windows
+_DISPLAY_NAME_OIDS = (
+    OID_COMMON_NAME,
+    OID_ORGANIZATIONAL_UNIT,
+    OID_ORGANIZATION,
+    OID_EMAIL_ADDRESS,
+)
+
+_PEM_BLOCK = re.compile(
+    rb"-----BEGIN (?P<label>[A-Z0-9 ]+)-----(?P<body>.*?)-----END (?P=label)-----",
+    re.S,
+)
+
+
+@dataclass
+class Certificate:
+    """Die für SignIT relevanten Felder eines X.509-Zertifikats."""
+
+    subject: str
+    issuer: str
+    not_before: datetime
+    not_after: datetime
+    thumbprint: str  # SHA-1 über das gesamte Zertifikat, hex, Großbuchstaben
+    thumbprint_sha256: str
+    extended_key_usage: Optional[FrozenSet[str]] = None  # None = keine Extension
+    key_usage: Optional[FrozenSet[str]] = None  # None = keine Extension
+
+    @property
+    def is_code_signing(self) -> bool:
+        """
+        Ob das Zertifikat für Code-Signing verwendbar ist.
+
+        Ohne EKU-Extension gilt es – wie unter Windows – für alle Zwecke;
+        eine vorhandene Key Usage muss ``digitalSignature`` enthalten.
+        """
+        if self.extended_key_usage is not None and not (
+            OID_CODE_SIGNING in self.extended_key_usage
+            or OID_ANY_EXTENDED_KEY_USAGE in self.extended_key_usage
+        ):
+            return False
+        return self.key_usage is None or "digitalSignature" in self.key_usage
+
+
+def _decode_string(data: bytes, element: der.Element) -> str:
+    raw = der.content_bytes(data, element)
+    if element.tag == der.TAG_BMP_STRING:
+        return raw.decode("utf-16-be", errors="replace")
+    if element.tag == der.TAG_T61_STRING:
+        return raw.decode("latin-1")
+    return raw.decode("utf-8", errors="replace")
+
+
+def _decode_time(data: bytes, element: der.Element) -> datetime:
+    """Dekodiert UTCTime bzw. GeneralizedTime (immer UTC)."""
+    text = der.content_bytes(data, element).decode("ascii").rstrip("Z")
+    if element.tag == der.TAG_UTC_TIME:
+        # RFC 5280: YY >= 50 bedeutet 19YY
+        year = int(text[:2])
+        text = f"{1900 + year if year >= 50 else 2000 + year}{text[2:]}"
+    elif element.tag != der.TAG_GENERALIZED_TIME:
+        raise ValueError("X.509: Zeitangabe erwartet")
+    text = text.split(".")[0]
+    return datetime.strptime(text[:14], "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc)
+
+
+def _display_name(data: bytes, name: der.Element) -> str:
+    """Anzeigename eines Distinguished Name (CN, sonst OU, O, E-Mail)."""
+    values = {}
+    for rdn in der.iter_children(data, name):
+        for attribute in der.iter_children(data, rdn):
+            oid_element, value = der.children(data, attribute)[:2]
+            oid = der.read_oid(data, oid_element)
+            if oid in _DISPLAY_NAME_OIDS and oid not in values:
+                values[oid] = _decode_string(data, value)
+    for oid in _DISPLAY_NAME_OIDS:
+        if oid in values:
+            return values[oid]
+    return ""
+
+
+def _decode_key_usage(data: bytes, value: der.Element) -> FrozenSet[str]:
+    """Dekodiert den BIT STRING der Key-Usage-Extension."""
+    bits = der.parse(data, value.content)
+    raw = der.content_bytes(data, bits)[1:]  # erstes Byte: ungenutzte Bits
+    return frozenset(
+        name
+        for i, name in enumerate(KEY_USAGE_NAMES)
+        if i // 8 < len(raw) and raw[i // 8] & (0x80 >> (i % 8))
+    )
+
+
+def _decode_eku(data: bytes, value: der.Element) -> FrozenSet[str]:
+    """Dekodiert die OID-Liste der Extended-Key-Usage-Extension."""
+    usages = der.parse(data, value.content)
+    return frozenset(
+        der.read_oid(data, oid) for oid in der.iter_children(data, usages)
+    )
+
+
+def parse_certificate(data: bytes) -> Certificate:
+    """
+    Liest ein DER-kodiertes X.509-Zertifikat in einem Durchlauf.
+
+    Raises:
+        ValueError: wenn die Daten kein gültiges Zertifikat sind
+    """
+    try:
+        cert = der.parse(data)
+        tbs = der.children(data, cert)[0]
+        fields = der.children(data, tbs)
+        if fields and fields[0].tag == der.context_tag(0):
+            fields = fields[1:]  # explizite Version überspringen
+        _serial, _sig_alg, issuer, validity, subject = fields[:5]
+        not_before, not_after = der.children(data, validity)[:2]
+
+        eku: Optional[FrozenSet[str]] = None
+        key_usage: Optional[FrozenSet[str]] = None
+        for field in fields[6:]:
+            if field.tag != der.context_tag(3):
+                continue  # issuerUniqueID / subjectUniqueID
+            extensions = der.parse(data, field.content)
+            for extension in der.iter_children(data, extensions):
+                parts = der.children(data, extension)
+                oid = der.read_oid(data, parts[0])
+                value = parts[-1]  # OCTET STRING (das optionale "critical" davor)
+                if oid == OID_EXTENDED_KEY_USAGE:
+                    eku = _decode_eku(data, value)
+                elif oid == OID_KEY_USAGE:
+                    key_usage = _decode_key_usage(data, value)
+
+        encoded = der.raw_bytes(data, cert)
+        return Certificate(
+            subject=_display_name(data, subject),
+            issuer=_display_name(data, issuer),
+            not_before=_decode_time(data, not_before),
+            not_after=_decode_time(data, not_after),
+            thumbprint=hashlib.sha1(encoded).hexdigest().upper(),
+            thumbprint_sha256=hashlib.sha256(encoded).hexdigest().upper(),
+            extended_key_usage=eku,
+            key_usage=key_usage,
+        )
+    except (IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"X.509: ungültiges Zertifikat ({e})") from e
+
+
+def read_pem_blocks(data: bytes) -> List[Tuple[str, bytes]]:
+    """
+    Liest alle PEM-Blöcke einer Datei.
+
+    Returns:
+        Liste von (Label, DER-Bytes), z. B. ("CERTIFICATE", b"0...")
+    """
+    blocks: List[Tuple[str, bytes]] = []
+    for match in _PEM_BLOCK.finditer(data):
+        # Header-Zeilen (z. B. "Proc-Type: ...") gehören nicht zum Base64-Inhalt
+        body = b"".join(
+            line.strip()
+            for line in match.group("body").splitlines()
+            if b":" not in line
+        )
+        blocks.append((match.group("label").decode("ascii"), base64.b64decode(body)))
+    return blocks
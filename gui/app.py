@@ -10,13 +10,16 @@ from __future__ import annotations
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import customtkinter as ctk
 
 from core.certstore import CertInfo
+from core.fileset import FileSet, FileSetDiff
+from core.signer import SignResult
 from gui.about_dialog import AboutDialog
 from gui.cert_panel import CertPanel
+from gui.event_bus import UIEventBus
 from gui.file_panel import FilePanel
 from gui.log_panel import LogPanel
 from gui.sign_panel import SignPanel
@@ -90,6 +93,9 @@ class SignITApp(ctk.CTk):
         self._log_panel = LogPanel(right_frame)
         self._log_panel.grid(row=0, column=0, sticky="nsew")
 
+        # Ereignisse aus Worker-Threads, gebündelt im 50-ms-Takt
+        self._event_bus = UIEventBus(self, log_sink=self._log_panel.log_many)
+
         # --- Linke Spalte: Konfiguration (scrollbar) ---
         left_frame = ctk.CTkScrollableFrame(
             self,
@@ -103,6 +109,7 @@ class SignITApp(ctk.CTk):
             left_frame,
             on_cert_selected=self._on_cert_selected,
             on_log=self._log_message,
+            event_bus=self._event_bus,
         )
         self._cert_panel.pack(fill="x", pady=(0, 16))
 
@@ -116,6 +123,7 @@ class SignITApp(ctk.CTk):
             left_frame,
             on_files_changed=self._on_files_changed,
             on_log=self._log_message,
+            event_bus=self._event_bus,
         )
         self._file_panel.pack(fill="x", pady=(0, 16))
 
@@ -129,6 +137,8 @@ class SignITApp(ctk.CTk):
             left_frame,
             on_log=self._log_message,
             on_status=self._set_status,
+            on_complete=self._on_signing_complete,
+            event_bus=self._event_bus,
         )
         self._sign_panel.pack(fill="x", pady=(0, 12))
 
@@ -192,10 +202,14 @@ class SignITApp(ctk.CTk):
         """Callback wenn ein Zertifikat ausgewählt wird."""
         self._sign_panel.set_certificate(cert)
 
-    def _on_files_changed(self, files: list) -> None:
+    def _on_files_changed(self, files: FileSet, diff: FileSetDiff) -> None:
         """Callback wenn sich die Dateiliste ändert."""
         self._sign_panel.set_files(files)
 
+    def _on_signing_complete(self, results: List[SignResult]) -> None:
+        """Callback nach einem Signiervorgang: signierte Dateien sind gewachsen."""
+        self._file_panel.refresh_metadata()
+
     def _log_message(self, message: str, tag: str = "") -> None:
         """Leitet Log-Nachrichten an das LogPanel weiter."""
         if hasattr(self, "_log_panel"):
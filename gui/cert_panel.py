@@ -8,21 +8,27 @@ und ermöglicht die Auswahl eines Zertifikats zum Signieren.
 from __future__ import annotations
 
 import threading
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import customtkinter as ctk
 
-from core.certstore import CertInfo, get_certificates
+from core.certcache import CertCache
+from core.certstore import STORE_LOCATIONS, CertInfo
+from gui.event_bus import UIEventBus
 
 
 class CertPanel(ctk.CTkFrame):
     """Panel zur Auswahl eines Code-Signing-Zertifikats."""
 
+    ALL_STORES = "Alle"
+    STORE_SHORT = {"CurrentUser": "CU", "LocalMachine": "LM"}
+
     def __init__(
         self,
         master,
         on_cert_selected: Optional[Callable[[Optional[CertInfo]], None]] = None,
         on_log: Optional[Callable[[str, str], None]] = None,
+        event_bus: Optional[UIEventBus] = None,
         **kwargs,
     ):
         super().__init__(master, **kwargs)
@@ -30,9 +36,15 @@ class CertPanel(ctk.CTkFrame):
 
         self._on_cert_selected = on_cert_selected
         self._on_log = on_log
+        # Ergebnisse des Lade-Threads gelangen über den Bus in den UI-Thread
+        self._event_bus = event_bus or UIEventBus(
+            self, log_sink=lambda entries: None
+        )
         self._certs: List[CertInfo] = []
         self._selected_cert: Optional[CertInfo] = None
         self._cert_frames: List[ctk.CTkFrame] = []
+        self._cert_cache = CertCache()
+        self._load_generation = 0
 
         # --- Header-Bereich ---
         header = ctk.CTkFrame(self, fg_color="transparent")
@@ -54,10 +66,10 @@ class CertPanel(ctk.CTkFrame):
             font=ctk.CTkFont(size=13),
         ).pack(side="left", padx=(0, 8))
 
-        self._store_var = ctk.StringVar(value="CurrentUser")
+        self._store_var = ctk.StringVar(value=self.ALL_STORES)
         self._store_menu = ctk.CTkSegmentedButton(
             controls,
-            values=["CurrentUser", "LocalMachine"],
+            values=[*STORE_LOCATIONS, self.ALL_STORES],
             variable=self._store_var,
             command=self._on_store_changed,
             font=ctk.CTkFont(size=12),
@@ -70,7 +82,7 @@ class CertPanel(ctk.CTkFrame):
             width=120,
             height=30,
             font=ctk.CTkFont(size=12),
-            command=self.load_certificates,
+            command=lambda: self.load_certificates(force=True),
         )
         self._refresh_btn.pack(side="left")
 
@@ -100,9 +112,10 @@ class CertPanel(ctk.CTkFrame):
         self._header_frame.columnconfigure(1, weight=2)
         self._header_frame.columnconfigure(2, weight=1)
         self._header_frame.columnconfigure(3, weight=2)
+        self._header_frame.columnconfigure(4, weight=1)
 
         for col, text in enumerate(
-            ["Subject", "Aussteller", "Gueltig bis", "Thumbprint"]
+            ["Subject", "Aussteller", "Gueltig bis", "Thumbprint", "Speicher"]
         ):
             ctk.CTkLabel(
                 self._header_frame,
@@ -125,36 +138,112 @@ class CertPanel(ctk.CTkFrame):
         """Wird aufgerufen, wenn der Store-Ort gewechselt wird."""
         self.load_certificates()
 
-    def load_certificates(self) -> None:
-        """Lädt Zertifikate im Hintergrund-Thread."""
+    def load_certificates(self, force: bool = False) -> None:
+        """
+        Lädt Zertifikate im Hintergrund-Thread.
+
+        Eine gecachte Liste wird sofort angezeigt und anschließend im
+        Hintergrund revalidiert; neu gezeichnet wird nur bei Änderungen.
+        ``force`` lädt den Speicher unabhängig vom Cache vollständig neu.
+        """
         # FIX #3: Store-Wert im UI-Thread lesen und an Worker übergeben (Tk-Thread-Safety).
         store = self._store_var.get()
+        # "Alle": alle Speicherorte gleichzeitig laden und zusammenführen
+        locations = STORE_LOCATIONS if store == self.ALL_STORES else (store,)
+        self._load_generation += 1
+        generation = self._load_generation
         self._refresh_btn.configure(state="disabled", text="Lade...")
-        self._status_label.configure(text="Lade Zertifikate...", text_color="#fbbf24")
-        self._clear_cert_list()
 
-        if self._on_log:
-            self._on_log(f"Lade Zertifikate aus Speicher: {store}\\My ...", "info")
+        cached = None if force else self._cert_cache.get_many(locations)
+        if cached is not None:
+            self._display_certificates(cached, from_cache=True)
+        else:
+            self._status_label.configure(
+                text="Lade Zertifikate...", text_color="#fbbf24"
+            )
+            self._clear_cert_list()
+            if self._on_log:
+                names = ", ".join(f"{loc}\\My" for loc in locations)
+                self._on_log(f"Lade Zertifikate aus Speicher: {names} ...", "info")
+
+        bus = self._event_bus
 
-        def _load(selected_store: str):
+        def _load(selected: Tuple[str, ...]):
             try:
-                certs = get_certificates(selected_store)
-                self.after(0, lambda: self._display_certificates(certs))
+                certs, changed, errors = self._cert_cache.refresh_many(
+                    selected, force=force
+                )
             except Exception as e:
-                self.after(0, lambda: self._show_error(str(e)))
+                bus.post(self._load_failed, generation, str(e), cached)
+                return
+            bus.post(
+                self._load_finished,
+                generation,
+                certs,
+                changed or cached is None,
+                errors,
+            )
 
-        thread = threading.Thread(target=_load, args=(store,), daemon=True)
+        thread = threading.Thread(target=_load, args=(locations,), daemon=True)
         thread.start()
 
-    def _display_certificates(self, certs: List[CertInfo]) -> None:
+    def _load_finished(
+        self,
+        generation: int,
+        certs: List[CertInfo],
+        changed: bool,
+        errors: Dict[str, str],
+    ) -> None:
+        """Ergebnis der Revalidierung; veraltete Ladevorgänge werden ignoriert."""
+        if generation != self._load_generation:
+            return
+        if self._on_log:
+            for location, message in errors.items():
+                self._on_log(
+                    f"Speicher {location}\\My nicht lesbar: {message}", "warning"
+                )
+        if changed:
+            self._display_certificates(certs)
+            return
+        self._refresh_btn.configure(state="normal", text="Aktualisieren")
+        self._status_label.configure(
+            text=f"{len(certs)} Zertifikat(e) gefunden",
+            text_color="#4ade80" if certs else "#f87171",
+        )
+
+    def _load_failed(
+        self, generation: int, message: str, cached: Optional[List[CertInfo]]
+    ) -> None:
+        """Fehler beim Laden; eine bereits angezeigte Cache-Liste bleibt stehen."""
+        if generation != self._load_generation:
+            return
+        if cached is None:
+            self._show_error(message)
+            return
+        self._refresh_btn.configure(state="normal", text="Aktualisieren")
+        self._status_label.configure(
+            text="Zwischengespeicherte Liste (Aktualisierung fehlgeschlagen)",
+            text_color="#fbbf24",
+        )
+        if self._on_log:
+            self._on_log(
+                f"Fehler beim Aktualisieren der Zertifikate: {message}", "error"
+            )
+
+    def _display_certificates(
+        self, certs: List[CertInfo], from_cache: bool = False
+    ) -> None:
         """Zeigt die geladenen Zertifikate in der Liste an."""
         self._certs = certs
-        self._refresh_btn.configure(state="normal", text="Aktualisieren")
+        if not from_cache:
+            self._refresh_btn.configure(state="normal", text="Aktualisieren")
 
         if self._placeholder:
             self._placeholder.destroy()
             self._placeholder = None
 
+        # Auswahl über das Neuzeichnen hinweg beibehalten
+        previous = self._selected_cert
         self._clear_cert_list()
 
         if not certs:
@@ -171,18 +260,38 @@ class CertPanel(ctk.CTkFrame):
             )
             if self._on_log:
                 self._on_log("Keine gültigen Zertifikate gefunden.", "warning")
+            if previous and self._on_cert_selected:
+                self._on_cert_selected(None)
             return
 
-        self._status_label.configure(
-            text=f"{len(certs)} Zertifikat(e) gefunden",
-            text_color="#4ade80",
-        )
-        if self._on_log:
-            self._on_log(f"{len(certs)} Zertifikat(e) gefunden.", "success")
+        if from_cache:
+            self._status_label.configure(
+                text=f"{len(certs)} Zertifikat(e) – prüfe auf Änderungen...",
+                text_color="#fbbf24",
+            )
+            if self._on_log:
+                self._on_log(
+                    f"{len(certs)} Zertifikat(e) aus dem Cache angezeigt.", "dim"
+                )
+        else:
+            self._status_label.configure(
+                text=f"{len(certs)} Zertifikat(e) gefunden",
+                text_color="#4ade80",
+            )
+            if self._on_log:
+                self._on_log(f"{len(certs)} Zertifikat(e) gefunden.", "success")
 
+        reselect = None
         for cert in certs:
             frame = self._create_cert_row(cert)
             self._cert_frames.append(frame)
+            if previous and cert.thumbprint == previous.thumbprint:
+                reselect = (cert, frame)
+
+        if reselect:
+            self._select_cert(*reselect)
+        elif previous and self._on_cert_selected:
+            self._on_cert_selected(None)
 
     def _create_cert_row(self, cert: CertInfo) -> ctk.CTkFrame:
         """Erstellt eine Zeile in der Zertifikatsliste."""
@@ -197,6 +306,7 @@ class CertPanel(ctk.CTkFrame):
         frame.columnconfigure(1, weight=2)
         frame.columnconfigure(2, weight=1)
         frame.columnconfigure(3, weight=2)
+        frame.columnconfigure(4, weight=1)
 
         # Hover-Effekt manuell (CTkFrame hat kein hover_color)
         frame._is_selected = False  # type: ignore[attr-defined]
@@ -248,6 +358,15 @@ class CertPanel(ctk.CTkFrame):
             anchor="w",
         ).grid(row=0, column=3, sticky="w", padx=8, pady=6)
 
+        # Herkunft (CU = CurrentUser, LM = LocalMachine)
+        ctk.CTkLabel(
+            frame,
+            text="+".join(self.STORE_SHORT.get(s, s) for s in cert.stores),
+            font=ctk.CTkFont(size=11),
+            text_color="#888888",
+            anchor="w",
+        ).grid(row=0, column=4, sticky="w", padx=8, pady=6)
+
         # Klick-Event auf den gesamten Frame + alle Kinder
         frame.bind("<Button-1>", lambda e, c=cert, f=frame: self._select_cert(c, f))
         for child in frame.winfo_children():
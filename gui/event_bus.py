@@ -0,0 +1,136 @@
+"""
+Let's Do. | SignIT – Ereignis-Warteschlange zwischen Worker-Threads und GUI.
+
+Worker-Threads (Signer, Vorabprüfung) dürfen Tk-Widgets nicht direkt
+ändern. Statt jede Log-Zeile und jeden Fortschrittsschritt einzeln per
+``after(0, ...)`` in die Tk-Ereignisschleife zu stellen, sammelt der
+UIEventBus alle Ereignisse in einer threadsicheren Warteschlange und
+arbeitet sie in einem festen Takt (Standard: 50 ms) im UI-Thread ab:
+
+- Log-Zeilen werden gesammelt und in einem Aufruf eingefügt.
+- Fortschrittsmeldungen werden pro Schlüssel auf den letzten Wert
+  zusammengefasst.
+- Sonstige Ereignisse (z. B. Abschluss) laufen in Reihenfolge; vorher
+  eingereihte Log-Zeilen und Fortschritte werden zuerst angewendet.
+
+Der Aufwand im UI-Thread wächst so mit der Taktrate, nicht mit der
+Menge der Ausgabe.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+LogEntry = Tuple[str, str]  # (Nachricht, Farb-Tag)
+LogSink = Callable[[Sequence[LogEntry]], None]
+
+DEFAULT_INTERVAL_MS = 50
+
+_LOG = "log"
+_CALL = "call"
+
+
+class UIEventBus:
+    """
+    Threadsichere Warteschlange, die im UI-Thread getaktet abgearbeitet wird.
+
+    Verwendung:
+        bus = UIEventBus(root, log_sink=log_panel.log_many)
+        # in einem Worker-Thread:
+        bus.post_log("Signiere: a.exe", "info")
+        bus.post_progress("sign", panel.update_progress, 3, 10, "a.exe")
+        bus.post(panel.signing_complete, results)
+    """
+
+    def __init__(
+        self,
+        widget,
+        log_sink: LogSink,
+        interval_ms: int = DEFAULT_INTERVAL_MS,
+    ):
+        """
+        Args:
+            widget: Tk-Widget, dessen ``after`` den Takt liefert
+            log_sink: erhält im UI-Thread alle seit dem letzten Takt
+                      gesammelten Log-Zeilen als Liste von (Nachricht, Tag)
+            interval_ms: Abstand der Abarbeitung in Millisekunden
+        """
+        self._widget = widget
+        self._log_sink = log_sink
+        self.interval_ms = interval_ms
+        self._lock = threading.Lock()
+        self._events: List[Tuple[str, Any]] = []
+        self._progress: Dict[str, Tuple[Callable[..., None], tuple]] = {}
+        self._after_id: Optional[str] = None
+        self.start()
+
+    # ------------------------------------------------------------------
+    # Einreihen (aus beliebigen Threads)
+    # ------------------------------------------------------------------
+    def post_log(self, message: str, tag: str = "") -> None:
+        """Reiht eine Log-Zeile ein."""
+        with self._lock:
+            self._events.append((_LOG, (message, tag)))
+
+    def post_progress(self, key: str, callback: Callable[..., None], *args) -> None:
+        """
+        Meldet einen Fortschritt; pro ``key`` zählt nur der letzte Wert.
+
+        ``callback(*args)`` wird im nächsten Takt einmal aufgerufen.
+        """
+        with self._lock:
+            # neu einsortieren: Reihenfolge = Zeitpunkt der letzten Meldung
+            self._progress.pop(key, None)
+            self._progress[key] = (callback, args)
+
+    def post(self, callback: Callable[..., None], *args) -> None:
+        """Reiht einen Aufruf ein, der im UI-Thread ausgeführt wird."""
+        with self._lock:
+            self._events.append((_CALL, (callback, args)))
+
+    # ------------------------------------------------------------------
+    # Abarbeitung (UI-Thread)
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Startet den Takt (geschieht bereits im Konstruktor)."""
+        if self._after_id is None:
+            self._after_id = self._widget.after(self.interval_ms, self._tick)
+
+    def stop(self) -> None:
+        """Hält den Takt an; bereits eingereihte Ereignisse bleiben erhalten."""
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self) -> None:
+        self._after_id = None
+        try:
+            self.drain()
+        finally:
+            self.start()
+
+    def drain(self) -> None:
+        """Arbeitet alle eingereihten Ereignisse sofort ab (nur im UI-Thread)."""
+        with self._lock:
+            events, self._events = self._events, []
+            progress, self._progress = self._progress, {}
+
+        logs: List[LogEntry] = []
+
+        def _flush() -> None:
+            if logs:
+                self._log_sink(list(logs))
+                logs.clear()
+            for callback, args in progress.values():
+                callback(*args)
+            progress.clear()
+
+        for kind, payload in events:
+            if kind == _LOG:
+                logs.append(payload)
+            else:
+                _flush()
+                callback, args = payload
+                callback(*args)
+        _flush()
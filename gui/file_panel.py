@@ -3,29 +3,124 @@ Let's Do. | SignIT – Datei-Auswahl-Panel.
 
 Ermöglicht die Auswahl von EXE-Dateien zum Signieren.
 Unterstützt Mehrfachauswahl, Drag-and-Drop-ähnliche UX,
-und Entfernen einzelner Dateien.
+und Entfernen einzelner Dateien. Die Liste ist virtualisiert: es gibt
+nur Widgets für die sichtbaren Zeilen, beim Scrollen werden sie mit
+anderen Dateien befüllt – auch bei 10.000+ Dateien. Dateigrößen kommen
+aus dem FileMetaService (core.filemeta) und werden nachgetragen,
+sobald sie im Hintergrund ermittelt sind; neu geprüft werden sie nach
+dem Signieren und wenn das Fenster wieder den Fokus bekommt. "Ordner
+hinzufügen" durchsucht einen Ordner rekursiv im Hintergrund
+(core.folderscan) und fügt die Treffer blockweise hinzu. Welche Dateien
+dabei zählen, legen die beiden Musterfelder unter den Buttons fest.
 """
 
 from __future__ import annotations
 
-import os
 from pathlib import Path
 from tkinter import filedialog
 from typing import Callable, List, Optional
 
 import customtkinter as ctk
 
+from core.filemeta import FileMeta, FileMetaService
+from core.folderscan import DEFAULT_INCLUDE, FolderScan, ScanStats, split_patterns
+from core.fileset import FileSet, FileSetDiff
 from core.utils import format_file_size
+from gui.event_bus import UIEventBus
+
+PLACEHOLDER_TEXT = (
+    'Klicken Sie "Dateien hinzufügen" oder ziehen Sie Dateien hierher...'
+)
+
+
+class _FileRow:
+    """Wiederverwendbare Zeile der virtualisierten Dateiliste."""
+
+    def __init__(self, master, on_remove: Callable[[], None]):
+        self.frame = ctk.CTkFrame(
+            master, fg_color="#0f3460", corner_radius=4, height=36
+        )
+        self.frame.pack_propagate(False)
+        self.path: Optional[str] = None
+
+        self.name_label = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            anchor="w",
+        )
+        self.name_label.pack(side="left", padx=(4, 0))
+
+        self.dir_label = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color="#888888",
+            anchor="w",
+        )
+        self.dir_label.pack(side="left", padx=(8, 0))
+
+        self.size_label = ctk.CTkLabel(
+            self.frame,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color="#aaaaaa",
+        )
+        self.size_label.pack(side="right", padx=(0, 8))
+
+        # Entfernen-Button
+        ctk.CTkButton(
+            self.frame,
+            text="X",
+            width=28,
+            height=24,
+            font=ctk.CTkFont(size=11, weight="bold"),
+            fg_color="#662222",
+            hover_color="#883333",
+            command=on_remove,
+        ).pack(side="right", padx=(0, 4))
+
+        self._meta: Optional[FileMeta] = None
+
+    def show(self, filepath: str, meta: Optional[FileMeta]) -> None:
+        """Befüllt die Zeile mit einer Datei (``meta`` None = noch unbekannt)."""
+        if filepath != self.path:
+            self.path = filepath
+            self.name_label.configure(text=f"  {Path(filepath).name}")
+
+            # Pfad (gekürzt)
+            dir_path = str(Path(filepath).parent)
+            if len(dir_path) > 50:
+                dir_path = "..." + dir_path[-47:]
+            self.dir_label.configure(text=dir_path)
+        elif meta is self._meta:
+            return
+        self._meta = meta
+
+        # Dateigröße
+        if meta is None:
+            self.size_label.configure(text="…", text_color="#666666")
+        elif meta.size is None:
+            self.size_label.configure(text="?", text_color="#f87171")
+        else:
+            self.size_label.configure(
+                text=format_file_size(meta.size),
+                text_color="#aaaaaa" if meta.readable else "#f87171",
+            )
 
 
 class FilePanel(ctk.CTkFrame):
     """Panel zur Auswahl und Verwaltung der zu signierenden Dateien."""
 
+    VISIBLE_ROWS = 5
+    ROW_PITCH = 38  # Zeilenhöhe inkl. Abstand (px)
+
     def __init__(
         self,
         master,
-        on_files_changed: Optional[Callable[[List[str]], None]] = None,
+        on_files_changed: Optional[Callable[[FileSet, FileSetDiff], None]] = None,
         on_log: Optional[Callable[[str, str], None]] = None,
+        event_bus: Optional[UIEventBus] = None,
         **kwargs,
     ):
         super().__init__(master, **kwargs)
@@ -33,8 +128,22 @@ class FilePanel(ctk.CTkFrame):
 
         self._on_files_changed = on_files_changed
         self._on_log = on_log
-        self._files: List[str] = []
-        self._file_frames: List[ctk.CTkFrame] = []
+        self._files = FileSet()
+
+        # Dateigrößen im Hintergrund; Aktualisierungen gebündelt neu zeichnen
+        self._event_bus = event_bus or UIEventBus(
+            self, log_sink=lambda entries: None
+        )
+        self._meta = FileMetaService(
+            on_update=lambda path, meta: self._event_bus.post_progress(
+                "filemeta", self._render_rows
+            )
+        )
+        self._first_row = 0  # Index der obersten sichtbaren Datei
+        self._folder_scan: Optional[FolderScan] = None
+        self._folder_added = 0  # vom laufenden Ordnerdurchlauf hinzugefügt
+        # Zählt die Durchläufe; Blöcke älterer Durchläufe werden verworfen
+        self._folder_scan_id = 0
 
         # --- Header ---
         header = ctk.CTkFrame(self, fg_color="transparent")
@@ -60,6 +169,16 @@ class FilePanel(ctk.CTkFrame):
         )
         self._add_btn.pack(side="left")
 
+        self._add_folder_btn = ctk.CTkButton(
+            btn_frame,
+            text="Ordner hinzufügen...",
+            width=160,
+            height=32,
+            font=ctk.CTkFont(size=13),
+            command=self._browse_folder,
+        )
+        self._add_folder_btn.pack(side="left", padx=(8, 0))
+
         self._clear_btn = ctk.CTkButton(
             btn_frame,
             text="Alle entfernen",
@@ -80,24 +199,87 @@ class FilePanel(ctk.CTkFrame):
         )
         self._count_label.pack(side="right")
 
-        # --- Dateiliste (scrollbar) ---
-        self._scroll_frame = ctk.CTkScrollableFrame(
-            self,
-            fg_color="#1a1a2e",
-            corner_radius=8,
-            height=140,
+        # --- Muster für "Ordner hinzufügen" ---
+        pattern_frame = ctk.CTkFrame(self, fg_color="transparent")
+        pattern_frame.pack(fill="x", padx=0, pady=(0, 8))
+
+        self._include_entry = self._pattern_entry(
+            pattern_frame, "Ordner: einschließen", "; ".join(DEFAULT_INCLUDE)
+        )
+        self._exclude_entry = self._pattern_entry(
+            pattern_frame, "ausschließen", "", placeholder="z. B. obj; tests/*"
+        )
+
+        # --- Dateiliste (virtualisiert) ---
+        list_frame = ctk.CTkFrame(self, fg_color="#1a1a2e", corner_radius=8)
+        list_frame.pack(fill="both", expand=True)
+
+        self._scrollbar = ctk.CTkScrollbar(list_frame, command=self._on_scrollbar)
+        self._scrollbar.pack(side="right", fill="y", padx=(0, 2), pady=4)
+
+        self._rows_frame = ctk.CTkFrame(
+            list_frame,
+            fg_color="transparent",
+            height=self.VISIBLE_ROWS * self.ROW_PITCH + 8,
         )
-        self._scroll_frame.pack(fill="both", expand=True)
+        self._rows_frame.pack(side="left", fill="both", expand=True, padx=4, pady=4)
+        self._rows_frame.pack_propagate(False)
+
+        self._rows = [
+            _FileRow(self._rows_frame, on_remove=lambda i=i: self._remove_row(i))
+            for i in range(self.VISIBLE_ROWS)
+        ]
 
         # Platzhalter
         self._placeholder = ctk.CTkLabel(
-            self._scroll_frame,
-            text='Klicken Sie "Dateien hinzufügen" oder ziehen Sie Dateien hierher...',
+            self._rows_frame,
+            text=PLACEHOLDER_TEXT,
             font=ctk.CTkFont(size=13),
             text_color="#666666",
         )
         self._placeholder.pack(pady=30)
 
+        # Mausrad (Windows/macOS: <MouseWheel>, X11: Button-4/5)
+        for widget in [self._rows_frame] + [r.frame for r in self._rows]:
+            widget.bind("<MouseWheel>", self._on_mousewheel, add="+")
+            widget.bind("<Button-4>", lambda e: self._scroll_by(-1), add="+")
+            widget.bind("<Button-5>", lambda e: self._scroll_by(1), add="+")
+
+        # Zurück im Fenster: Dateien können sich außerhalb geändert haben
+        toplevel = self.winfo_toplevel()
+        toplevel.bind(
+            "<FocusIn>",
+            lambda e: self.refresh_metadata() if e.widget is toplevel else None,
+            add="+",
+        )
+
+        self._refresh_file_list()
+
+    def refresh_metadata(self) -> None:
+        """Prüft Größe und Lesbarkeit erneut (sichtbare Zeilen sofort)."""
+        if self._files:
+            self._meta.invalidate()
+            self._render_rows()
+
+    @staticmethod
+    def _pattern_entry(
+        master, label: str, value: str, placeholder: str = ""
+    ) -> ctk.CTkEntry:
+        """Beschriftetes Eingabefeld für Muster (durch ``;`` getrennt)."""
+        ctk.CTkLabel(
+            master, text=label, font=ctk.CTkFont(size=12), text_color="#888888"
+        ).pack(side="left", padx=(0, 6))
+        entry = ctk.CTkEntry(
+            master,
+            height=28,
+            font=ctk.CTkFont(size=12),
+            placeholder_text=placeholder,
+        )
+        entry.pack(side="left", fill="x", expand=True, padx=(0, 12))
+        if value:
+            entry.insert(0, value)
+        return entry
+
     def _browse_files(self) -> None:
         """Öffnet den Datei-Dialog für Mehrfachauswahl."""
         filepaths = filedialog.askopenfilenames(
@@ -113,135 +295,200 @@ class FilePanel(ctk.CTkFrame):
         if filepaths:
             self._add_files(list(filepaths))
 
-    def _add_files(self, new_files: List[str]) -> None:
-        """Fügt neue Dateien zur Liste hinzu (ohne Duplikate)."""
-        added = 0
-        for fp in new_files:
-            norm = os.path.normpath(fp)
-            if norm not in self._files:
-                self._files.append(norm)
-                added += 1
+    def _browse_folder(self) -> None:
+        """Wählt einen Ordner und durchsucht ihn im Hintergrund (bzw. bricht ab)."""
+        if self._folder_scan is not None:
+            self._folder_scan.cancel()
+            return
+
+        folder = filedialog.askdirectory(title="Ordner mit Dateien zum Signieren")
+        if not folder:
+            return
+
+        include = split_patterns(self._include_entry.get())
+        exclude = split_patterns(self._exclude_entry.get())
+        bus = self._event_bus
+        self._folder_scan_id += 1
+        scan_id = self._folder_scan_id
+        self._folder_added = 0
+        self._folder_scan = FolderScan(
+            folder,
+            include=include,
+            exclude=exclude,
+            on_chunk=lambda chunk: bus.post(self._add_folder_chunk, scan_id, chunk),
+            on_complete=lambda stats: bus.post(
+                self._folder_scan_complete, scan_id, stats
+            ),
+        )
+        self._add_folder_btn.configure(text="Abbrechen", fg_color="#662222")
+        if self._on_log:
+            patterns = "; ".join(include) or "alle Dateien"
+            if exclude:
+                patterns += f", ohne {'; '.join(exclude)}"
+            self._on_log(f"Durchsuche Ordner: {folder} ({patterns})", "info")
+        self._folder_scan.start()
+
+    def _add_folder_chunk(self, scan_id: int, chunk: List[str]) -> None:
+        """Übernimmt einen Block des Ordnerdurchlaufs (im UI-Thread)."""
+        # Nach "Alle entfernen" oder einem neuen Durchlauf noch zugestellte
+        # Blöcke gehören nicht mehr in die Liste
+        if scan_id != self._folder_scan_id:
+            return
+        # Keine Metadaten vorab: bei großen Bäumen nur die sichtbaren Zeilen
+        self._folder_added += self._add_files(chunk, prefetch=False, log=False)
+        self._count_label.configure(
+            text=f"{len(self._files)} Datei(en) – durchsuche Ordner..."
+        )
+
+    def _folder_scan_complete(self, scan_id: int, stats: ScanStats) -> None:
+        """Schließt den Ordnerdurchlauf ab (im UI-Thread)."""
+        if scan_id != self._folder_scan_id:
+            return
+        self._folder_scan = None
+        self._reset_folder_button()
+        self._refresh_file_list()
+        if self._on_log:
+            state = "abgebrochen" if stats.cancelled else "abgeschlossen"
+            self._on_log(
+                f"Ordnersuche {state}: {self._folder_added} Datei(en) hinzugefügt "
+                f"({stats.matched} Treffer in {stats.directories} Ordnern). "
+                f"Gesamt: {len(self._files)}",
+                "warning" if stats.cancelled else "info",
+            )
+            for error in stats.errors[:10]:
+                self._on_log(f"  Nicht lesbar: {error}", "warning")
 
-        if added > 0:
+    def _reset_folder_button(self) -> None:
+        self._add_folder_btn.configure(
+            text="Ordner hinzufügen...",
+            fg_color=self._add_btn.cget("fg_color"),
+        )
+
+    def _add_files(
+        self, new_files: List[str], prefetch: bool = True, log: bool = True
+    ) -> int:
+        """
+        Fügt neue Dateien zur Liste hinzu (ohne Duplikate).
+
+        Returns:
+            Anzahl tatsächlich hinzugefügter Dateien
+        """
+        diff = self._files.add_many(new_files)
+        if diff.added:
+            if prefetch:
+                self._meta.prefetch(diff.added)
             self._refresh_file_list()
-            if self._on_log:
+            if self._on_log and log:
                 self._on_log(
-                    f"{added} Datei(en) hinzugefügt. Gesamt: {len(self._files)}",
+                    f"{len(diff.added)} Datei(en) hinzugefügt. "
+                    f"Gesamt: {len(self._files)}",
                     "info",
                 )
-            if self._on_files_changed:
-                self._on_files_changed(self._files.copy())
+            self._notify(diff)
+        return len(diff.added)
 
     def _remove_file(self, filepath: str) -> None:
         """Entfernt eine einzelne Datei aus der Liste."""
-        if filepath in self._files:
-            self._files.remove(filepath)
+        diff = self._files.remove(filepath)
+        if diff.removed:
+            self._meta.forget(diff.removed)
             self._refresh_file_list()
             if self._on_log:
                 self._on_log(f"Datei entfernt: {Path(filepath).name}", "dim")
-            if self._on_files_changed:
-                self._on_files_changed(self._files.copy())
+            self._notify(diff)
+
+    def _remove_row(self, row: int) -> None:
+        """Entfernt die Datei, die in Zeile ``row`` angezeigt wird."""
+        path = self._rows[row].path
+        if path is not None:
+            self._remove_file(path)
 
     def _clear_files(self) -> None:
         """Entfernt alle Dateien aus der Liste."""
+        if self._folder_scan is not None:
+            self._folder_scan.cancel()
+            self._folder_scan = None
+            self._folder_scan_id += 1
+            self._reset_folder_button()
+            if self._on_log:
+                self._on_log("Ordnersuche abgebrochen.", "warning")
         if not self._files:
             return
-        self._files.clear()
+        diff = self._files.clear()
+        self._meta.clear()
+        self._first_row = 0
         self._refresh_file_list()
         if self._on_log:
             self._on_log("Alle Dateien entfernt.", "dim")
+        self._notify(diff)
+
+    def _notify(self, diff: FileSetDiff) -> None:
+        """Meldet eine Änderung (die FileSet-Instanz selbst, keine Kopie)."""
         if self._on_files_changed:
-            self._on_files_changed(self._files.copy())
+            self._on_files_changed(self._files, diff)
 
+    # ------------------------------------------------------------------
+    # Virtualisierte Anzeige
+    # ------------------------------------------------------------------
     def _refresh_file_list(self) -> None:
-        """Aktualisiert die angezeigte Dateiliste."""
-        # Alte Einträge löschen
-        for f in self._file_frames:
-            f.destroy()
-        self._file_frames.clear()
-
-        if self._placeholder:
-            self._placeholder.destroy()
-            self._placeholder = None
-
-        if not self._files:
+        """Aktualisiert Zähler, Platzhalter und die sichtbaren Zeilen."""
+        count = len(self._files)
+        if not count:
             self._count_label.configure(text="Keine Dateien ausgewählt")
-            self._placeholder = ctk.CTkLabel(
-                self._scroll_frame,
-                text='Klicken Sie "Dateien hinzufügen" oder ziehen Sie Dateien hierher...',
-                font=ctk.CTkFont(size=13),
-                text_color="#666666",
-            )
+            for row in self._rows:
+                row.frame.pack_forget()
+                row.path = None
             self._placeholder.pack(pady=30)
+            self._scrollbar.set(0.0, 1.0)
             return
 
-        self._count_label.configure(text=f"{len(self._files)} Datei(en) ausgewählt")
-
-        for filepath in self._files:
-            frame = self._create_file_row(filepath)
-            self._file_frames.append(frame)
+        self._placeholder.pack_forget()
+        self._count_label.configure(text=f"{count} Datei(en) ausgewählt")
+        self._render_rows()
+
+    def _render_rows(self) -> None:
+        """Befüllt die Zeilen-Widgets mit dem sichtbaren Ausschnitt."""
+        count = len(self._files)
+        max_first = max(0, count - self.VISIBLE_ROWS)
+        self._first_row = min(max(0, self._first_row), max_first)
+
+        for offset, row in enumerate(self._rows):
+            index = self._first_row + offset
+            if index < count:
+                path = self._files[index]
+                row.show(path, self._meta.get(path))
+                if not row.frame.winfo_manager():
+                    row.frame.pack(fill="x", padx=2, pady=1)
+            else:
+                row.frame.pack_forget()
+                row.path = None
+
+        if count:
+            self._scrollbar.set(
+                self._first_row / count,
+                min(1.0, (self._first_row + self.VISIBLE_ROWS) / count),
+            )
 
-    def _create_file_row(self, filepath: str) -> ctk.CTkFrame:
-        """Erstellt eine Zeile für eine Datei in der Liste."""
-        frame = ctk.CTkFrame(
-            self._scroll_frame,
-            fg_color="#0f3460",
-            corner_radius=4,
-            height=36,
-        )
-        frame.pack(fill="x", padx=2, pady=1)
-        frame.pack_propagate(False)
+    def _scroll_to(self, first_row: int) -> None:
+        if first_row != self._first_row and self._files:
+            self._first_row = first_row
+            self._render_rows()
 
-        # Dateiname
-        name = Path(filepath).name
-        ctk.CTkLabel(
-            frame,
-            text=f"  {name}",
-            font=ctk.CTkFont(size=12, weight="bold"),
-            anchor="w",
-        ).pack(side="left", padx=(4, 0))
+    def _scroll_by(self, rows: int) -> None:
+        self._scroll_to(self._first_row + rows)
 
-        # Pfad (gekürzt)
-        dir_path = str(Path(filepath).parent)
-        if len(dir_path) > 50:
-            dir_path = "..." + dir_path[-47:]
-        ctk.CTkLabel(
-            frame,
-            text=dir_path,
-            font=ctk.CTkFont(size=11),
-            text_color="#888888",
-            anchor="w",
-        ).pack(side="left", padx=(8, 0))
-
-        # Dateigröße
-        try:
-            size = os.path.getsize(filepath)
-            size_text = format_file_size(size)
-        except OSError:
-            size_text = "?"
-        ctk.CTkLabel(
-            frame,
-            text=size_text,
-            font=ctk.CTkFont(size=11),
-            text_color="#aaaaaa",
-        ).pack(side="right", padx=(0, 8))
-
-        # Entfernen-Button
-        remove_btn = ctk.CTkButton(
-            frame,
-            text="X",
-            width=28,
-            height=24,
-            font=ctk.CTkFont(size=11, weight="bold"),
-            fg_color="#662222",
-            hover_color="#883333",
-            command=lambda fp=filepath: self._remove_file(fp),
-        )
-        remove_btn.pack(side="right", padx=(0, 4))
+    def _on_mousewheel(self, event) -> None:
+        self._scroll_by(-1 if event.delta > 0 else 1)
 
-        return frame
+    def _on_scrollbar(self, action: str, value: str, unit: str = "") -> None:
+        """Command der Scrollbar: ('moveto', Anteil) oder ('scroll', n, Einheit)."""
+        if action == "moveto":
+            self._scroll_to(int(float(value) * len(self._files)))
+        elif action == "scroll":
+            step = self.VISIBLE_ROWS if unit == "pages" else 1
+            self._scroll_by(int(value) * step)
 
     @property
     def files(self) -> List[str]:
         """Gibt die Liste der ausgewählten Dateien zurück."""
-        return self._files.copy()
+        return self._files.to_list()
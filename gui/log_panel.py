@@ -2,23 +2,35 @@
 Let's Do. | SignIT – Log-/Output-Panel.
 
 Zeigt den Live-Log-Output des Signiervorgangs mit farblicher
-Hervorhebung (Erfolg = grün, Fehler = rot).
+Hervorhebung (Erfolg = grün, Fehler = rot). Die Zeilen liegen in einem
+begrenzten LogStore (core.logstore); das Textfeld zeigt nur die neuesten
+``RENDER_LINES`` Meldungen.
 """
 
 from __future__ import annotations
 
 import customtkinter as ctk
+from collections import deque
 from datetime import datetime
+from typing import Deque, List, Optional, Sequence, Tuple
+
+from core.logstore import LogLine, LogStore, RotatingLogFile
 
 
 class LogPanel(ctk.CTkFrame):
     """Log-Panel mit farbigem Output für den Signiervorgang."""
 
-    def __init__(self, master, **kwargs):
+    RENDER_LINES = 2000  # im Textfeld dargestellte Meldungen
+
+    def __init__(self, master, store: Optional[LogStore] = None, **kwargs):
         super().__init__(master, **kwargs)
 
         self.configure(fg_color="transparent")
 
+        self._store = store or LogStore(log_file=RotatingLogFile.open_default())
+        # Textzeilen je dargestellter Meldung (mehrzeilige Meldungen zählen mehr)
+        self._rendered: Deque[int] = deque()
+
         # --- Header ---
         header = ctk.CTkFrame(self, fg_color="transparent")
         header.pack(fill="x", padx=0, pady=(0, 5))
@@ -72,10 +84,6 @@ class LogPanel(ctk.CTkFrame):
         self._textbox._textbox.tag_configure("dim", foreground="#888888")
         self._textbox._textbox.tag_configure("timestamp", foreground="#666666")
 
-    def _get_timestamp(self) -> str:
-        """Gibt einen formatierten Zeitstempel zurück."""
-        return datetime.now().strftime("[%H:%M:%S] ")
-
     def log(self, message: str, tag: str = "") -> None:
         """
         Fügt eine Zeile zum Log hinzu.
@@ -84,16 +92,48 @@ class LogPanel(ctk.CTkFrame):
             message: Die Log-Nachricht
             tag: Farb-Tag ('success', 'error', 'warning', 'info', 'header', 'dim')
         """
-        self._textbox.configure(state="normal")
+        self.log_many([(message, tag)])
 
-        # Zeitstempel einfügen
-        ts = self._get_timestamp()
-        self._textbox._textbox.insert("end", ts, "timestamp")
+    def log_many(self, entries: Sequence[Tuple[str, str]]) -> None:
+        """
+        Fügt mehrere Zeilen in einem Aufruf hinzu (für gebündelte Ausgabe).
 
-        # Nachricht einfügen
-        tags = (tag,) if tag else ()
-        self._textbox._textbox.insert("end", message + "\n", tags)
+        Args:
+            entries: Liste von (Nachricht, Farb-Tag)
+        """
+        if not entries:
+            return
+        lines = self._store.extend(entries)
+        if len(lines) >= self.RENDER_LINES:
+            # Alles Bisherige fällt ohnehin aus dem Fenster
+            self._render(lines[-self.RENDER_LINES :], replace=True)
+        else:
+            self._render(lines)
+
+    def _render(self, lines: List[LogLine], replace: bool = False) -> None:
+        """Hängt Zeilen an das Textfeld an und kürzt es auf RENDER_LINES Meldungen."""
+        text = self._textbox._textbox
+        chunks: List[object] = []
+        for line in lines:
+            chunks += [
+                f"[{line.time}] ",
+                "timestamp",
+                line.message + "\n",
+                (line.tag,) if line.tag else (),
+            ]
 
+        self._textbox.configure(state="normal")
+        if replace:
+            text.delete("1.0", "end")
+            self._rendered.clear()
+        text.insert("end", *chunks)
+        self._rendered.extend(line.message.count("\n") + 1 for line in lines)
+        # Älteste Meldungen samt all ihrer Textzeilen entfernen
+        excess = 0
+        while len(self._rendered) > self.RENDER_LINES:
+            excess += self._rendered.popleft()
+        if excess:
+            text.delete("1.0", f"{excess + 1}.0")
         self._textbox.configure(state="disabled")
         self._textbox.see("end")
 
@@ -123,16 +163,17 @@ class LogPanel(ctk.CTkFrame):
 
     def clear(self) -> None:
         """Löscht den gesamten Log-Inhalt."""
+        self._store.clear()
         self._textbox.configure(state="normal")
         self._textbox.delete("1.0", "end")
         self._textbox.configure(state="disabled")
+        self._rendered.clear()
 
     def _export_log(self) -> None:
-        """Exportiert das Log als Textdatei."""
-        from tkinter import filedialog
+        """Exportiert das Log als Textdatei (Kopie der Logdatei)."""
+        from tkinter import filedialog, messagebox
 
-        content = self._textbox._textbox.get("1.0", "end-1c")
-        if not content.strip():
+        if not len(self._store):
             return
 
         filepath = filedialog.asksaveasfilename(
@@ -142,10 +183,13 @@ class LogPanel(ctk.CTkFrame):
             initialfile=f"signit-log-{datetime.now().strftime('%Y%m%d-%H%M%S')}.txt",
         )
         if filepath:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(content)
+            try:
+                self._store.export(filepath)
+            except OSError as e:
+                messagebox.showerror("Protokoll exportieren", str(e))
+                return
             self.log_info(f"Protokoll exportiert: {filepath}")
 
     def get_content(self) -> str:
-        """Gibt den gesamten Log-Inhalt als String zurück."""
-        return self._textbox._textbox.get("1.0", "end-1c")
+        """Gibt den gespeicherten Log-Inhalt (Ringpuffer) als String zurück."""
+        return self._store.text()
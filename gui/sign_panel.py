@@ -8,20 +8,25 @@ Fortschrittsanzeige und den Start-Button für den Signiervorgang.
 from __future__ import annotations
 
 import os
+import threading
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Sequence
 
 import customtkinter as ctk
 
+from core.cancel import CancelToken
 from core.certstore import CertInfo
-from core.signer import Signer, SignResult
-from core.utils import (
-    TIMESTAMP_SERVERS,
-    find_signtool,
-    find_signtool_in_windows_kits,
-    validate_signtool,
-)
+from core.journal import SigningJournal
+from core.preflight import SEVERITY_ERROR, PreflightReport, run_preflight
+from core.retry import ERROR_CANCELLED, ERROR_LABELS, RetryPolicy
+from core.signer import Signer, SignResult, SignTimings
+from core.signindex import SignIndex
+from core.throughput import ThroughputSnapshot, format_duration
+from core.timestamp import TimestampSelector
+from core.signtoolsearch import SignToolLocator
+from core.utils import TIMESTAMP_SERVERS, validate_signtool
+from gui.event_bus import UIEventBus
 
 
 class SignPanel(ctk.CTkFrame):
@@ -30,11 +35,21 @@ class SignPanel(ctk.CTkFrame):
     und Ausführung des Signiervorgangs.
     """
 
+    WORKER_CHOICES = (1, 2, 4, 8, 16)
+    DEFAULT_WORKERS = 4
+    BATCH_CHOICES = (1, 10, 25, 50, 100)
+    DEFAULT_BATCH_SIZE = 1
+    AUTO_TS_LABEL = "Automatisch (schnellster)"
+    AUTO_TS_URL = "auto"
+    MAX_PREFLIGHT_LOG_LINES = 50
+
     def __init__(
         self,
         master,
         on_log: Optional[Callable[[str, str], None]] = None,
         on_status: Optional[Callable[[str], None]] = None,
+        on_complete: Optional[Callable[[List[SignResult]], None]] = None,
+        event_bus: Optional[UIEventBus] = None,
         **kwargs,
     ):
         super().__init__(master, **kwargs)
@@ -42,9 +57,17 @@ class SignPanel(ctk.CTkFrame):
 
         self._on_log = on_log
         self._on_status = on_status
+        self._on_complete = on_complete  # nach jedem Vorgang (im UI-Thread)
+        # Worker-Ereignisse (Log, Fortschritt, Abschluss) gebündelt an die GUI
+        self._event_bus = event_bus or UIEventBus(self, log_sink=self._log_entries)
         self._selected_cert: Optional[CertInfo] = None
-        self._files: List[str] = []
+        self._files: Sequence[str] = []
         self._is_signing = False
+        self._ts_selector: Optional[TimestampSelector] = None
+        self._sign_index: Optional[SignIndex] = None
+        self._journal: Optional[SigningJournal] = None
+        self._signer: Optional[Signer] = None  # laufender/letzter Vorgang
+        self._cancel_token: Optional[CancelToken] = None
 
         # ===================================================================
         # Abschnitt: SignTool-Pfad
@@ -87,7 +110,7 @@ class SignPanel(ctk.CTkFrame):
             font=ctk.CTkFont(size=12),
             fg_color="#555555",
             hover_color="#666666",
-            command=self._auto_find_signtool,
+            command=lambda: self._auto_find_signtool(force=True),
         )
         self._auto_find_btn.pack(side="left", padx=(6, 0))
 
@@ -115,7 +138,7 @@ class SignPanel(ctk.CTkFrame):
         ts_row.pack(fill="x", pady=(4, 0))
 
         # Vorauswahl-Dropdown
-        ts_names = [name for name, _ in TIMESTAMP_SERVERS]
+        ts_names = [name for name, _ in TIMESTAMP_SERVERS] + [self.AUTO_TS_LABEL]
         self._ts_dropdown = ctk.CTkComboBox(
             ts_row,
             values=ts_names,
@@ -171,6 +194,62 @@ class SignPanel(ctk.CTkFrame):
         )
         self._summary_files.pack(anchor="w", padx=12, pady=(2, 8))
 
+        # Parallelität (Anzahl gleichzeitiger signtool-Prozesse)
+        workers_row = ctk.CTkFrame(sign_section, fg_color="transparent")
+        workers_row.pack(fill="x", pady=(0, 8))
+
+        ctk.CTkLabel(
+            workers_row,
+            text="Parallele Prozesse:",
+            font=ctk.CTkFont(size=12),
+        ).pack(side="left")
+
+        self._workers_dropdown = ctk.CTkComboBox(
+            workers_row,
+            values=[str(n) for n in self.WORKER_CHOICES],
+            font=ctk.CTkFont(size=12),
+            width=80,
+            height=30,
+        )
+        self._workers_dropdown.set(str(self.DEFAULT_WORKERS))
+        self._workers_dropdown.pack(side="left", padx=(8, 0))
+
+        ctk.CTkLabel(
+            workers_row,
+            text="Dateien pro Aufruf:",
+            font=ctk.CTkFont(size=12),
+        ).pack(side="left", padx=(16, 0))
+
+        self._batch_dropdown = ctk.CTkComboBox(
+            workers_row,
+            values=[str(n) for n in self.BATCH_CHOICES],
+            font=ctk.CTkFont(size=12),
+            width=80,
+            height=30,
+        )
+        self._batch_dropdown.set(str(self.DEFAULT_BATCH_SIZE))
+        self._batch_dropdown.pack(side="left", padx=(8, 0))
+
+        # Zwei-Phasen-Modus: erst lokal signieren, dann separat stempeln
+        self._two_phase_var = ctk.BooleanVar(value=False)
+        self._two_phase_check = ctk.CTkCheckBox(
+            workers_row,
+            text="Zeitstempel separat",
+            variable=self._two_phase_var,
+            font=ctk.CTkFont(size=12),
+        )
+        self._two_phase_check.pack(side="left", padx=(16, 0))
+
+        # Unveränderte, bereits signierte Dateien überspringen
+        self._skip_unchanged_var = ctk.BooleanVar(value=True)
+        self._skip_unchanged_check = ctk.CTkCheckBox(
+            workers_row,
+            text="Unveränderte überspringen",
+            variable=self._skip_unchanged_var,
+            font=ctk.CTkFont(size=12),
+        )
+        self._skip_unchanged_check.pack(side="left", padx=(16, 0))
+
         # Fortschrittsbalken
         self._progress_bar = ctk.CTkProgressBar(
             sign_section,
@@ -188,9 +267,21 @@ class SignPanel(ctk.CTkFrame):
         )
         self._progress_label.pack(anchor="w")
 
-        # Sign-Button
-        self._sign_btn = ctk.CTkButton(
+        # Durchsatz und Restzeit
+        self._rate_label = ctk.CTkLabel(
             sign_section,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color="#666666",
+        )
+        self._rate_label.pack(anchor="w")
+
+        # Sign- und Abbrechen-Button
+        btn_row = ctk.CTkFrame(sign_section, fg_color="transparent")
+        btn_row.pack(pady=(8, 0))
+
+        self._sign_btn = ctk.CTkButton(
+            btn_row,
             text="Jetzt signieren",
             width=200,
             height=42,
@@ -199,9 +290,23 @@ class SignPanel(ctk.CTkFrame):
             hover_color="#228b4a",
             command=self._start_signing,
         )
-        self._sign_btn.pack(pady=(8, 0))
+        self._sign_btn.pack(side="left")
 
-        # --- Automatisch signtool suchen ---
+        self._cancel_btn = ctk.CTkButton(
+            btn_row,
+            text="Abbrechen",
+            width=110,
+            height=42,
+            font=ctk.CTkFont(size=13),
+            fg_color="#662222",
+            hover_color="#882222",
+            state="disabled",
+            command=self._cancel_signing,
+        )
+        self._cancel_btn.pack(side="left", padx=(8, 0))
+
+        # --- Automatisch signtool suchen (im Hintergrund) ---
+        self._signtool_locator = SignToolLocator()
         self._auto_find_signtool()
 
     def _browse_signtool(self) -> None:
@@ -215,18 +320,50 @@ class SignPanel(ctk.CTkFrame):
             self._signtool_entry.insert(0, filepath)
             self._validate_signtool_path(filepath)
 
-    def _auto_find_signtool(self) -> None:
-        """Sucht automatisch nach signtool.exe."""
+    def _auto_find_signtool(self, force: bool = False) -> None:
+        """
+        Sucht signtool.exe im Hintergrund.
+
+        Beim Start wird das gespeicherte Ergebnis verwendet, solange sich
+        die SDK-Ordner nicht geändert haben; ``force`` (Button
+        "Auto-Suche") durchsucht sie neu.
+        """
         if self._on_log:
             self._on_log("Suche signtool.exe...", "info")
+        self._auto_find_btn.configure(state="disabled")
+        self._signtool_status.configure(
+            text="Suche signtool.exe...", text_color="#888888"
+        )
+        bus = self._event_bus
+
+        def _search():
+            try:
+                result = self._signtool_locator.locate(use_cache=not force)
+            except Exception:
+                result = None
+            bus.post(self._signtool_found, result, force)
+
+        threading.Thread(target=_search, daemon=True).start()
+
+    def _signtool_found(self, result: Optional[str], force: bool) -> None:
+        """Übernimmt das Ergebnis der Hintergrundsuche (im UI-Thread)."""
+        self._auto_find_btn.configure(state="normal")
+        current = self._signtool_entry.get().strip()
+        if current and not force:
+            # Inzwischen manuell eingetragen – nicht überschreiben
+            self._validate_signtool_path(current)
+            return
 
-        result = find_signtool()
         if result:
             self._signtool_entry.delete(0, "end")
             self._signtool_entry.insert(0, result)
             self._validate_signtool_path(result)
             if self._on_log:
-                self._on_log(f"signtool.exe gefunden: {result}", "success")
+                source = " (gespeichert)" if self._signtool_locator.from_cache else ""
+                self._on_log(f"signtool.exe gefunden{source}: {result}", "success")
+                others = [c.path for c in self._signtool_locator.candidates[1:4]]
+                if others:
+                    self._on_log(f"Weitere Pfade: {', '.join(others)}", "dim")
         else:
             self._signtool_status.configure(
                 text="signtool.exe nicht gefunden. Bitte manuell angeben.",
@@ -239,12 +376,6 @@ class SignPanel(ctk.CTkFrame):
                     "warning",
                 )
 
-            # Zeige gefundene Pfade als Hilfe
-            found = find_signtool_in_windows_kits()
-            if found:
-                if self._on_log:
-                    self._on_log(f"Mögliche Pfade: {', '.join(found[:3])}", "dim")
-
     def _validate_signtool_path(self, path: str) -> bool:
         """Validiert den signtool-Pfad und aktualisiert den Status."""
         if validate_signtool(path):
@@ -260,8 +391,26 @@ class SignPanel(ctk.CTkFrame):
             )
             return False
 
+    def _get_worker_count(self) -> int:
+        """Liest die Anzahl paralleler Prozesse (Fallback: Standardwert)."""
+        try:
+            return max(1, int(self._workers_dropdown.get().strip()))
+        except ValueError:
+            return self.DEFAULT_WORKERS
+
+    def _get_batch_size(self) -> int:
+        """Liest die Anzahl Dateien pro signtool-Aufruf (Fallback: Standardwert)."""
+        try:
+            return max(1, int(self._batch_dropdown.get().strip()))
+        except ValueError:
+            return self.DEFAULT_BATCH_SIZE
+
     def _on_ts_selected(self, choice: str) -> None:
         """Aktualisiert die URL beim Wechsel des Timestamp-Servers."""
+        if choice == self.AUTO_TS_LABEL:
+            self._ts_entry.delete(0, "end")
+            self._ts_entry.insert(0, self.AUTO_TS_URL)
+            return
         for name, url in TIMESTAMP_SERVERS:
             if name == choice:
                 self._ts_entry.delete(0, "end")
@@ -282,8 +431,13 @@ class SignPanel(ctk.CTkFrame):
                 text_color="#aaaaaa",
             )
 
-    def set_files(self, files: List[str]) -> None:
-        """Setzt die Dateiliste (von FilePanel aufgerufen)."""
+    def set_files(self, files: Sequence[str]) -> None:
+        """
+        Setzt die Dateiliste (von FilePanel aufgerufen).
+
+        ``files`` ist die FileSet-Instanz des FilePanels; beim Start des
+        Signiervorgangs wird eine Kopie gezogen.
+        """
         self._files = files
         count = len(files)
         if count > 0:
@@ -333,39 +487,218 @@ class SignPanel(ctk.CTkFrame):
             )
             return
 
+        # --- Vorabprüfung aller Dateien (parallel, im Hintergrund) ---
+        self._is_signing = True
+        self._sign_btn.configure(state="disabled", text="Prüfe Dateien...")
+        if self._on_status:
+            self._on_status("Prüfe Dateien...")
+
+        files = list(self._files)
+        bus = self._event_bus
+
+        def _check():
+            try:
+                # Nur stat/open/Magic Bytes – ob eine Datei bereits signiert
+                # ist, prüft der SignIndex beim Überspringen (ohne doppeltes
+                # Hashen)
+                report = run_preflight(files)
+            except Exception as e:
+                # Sonst bliebe der Sign-Button bis zum Neustart gesperrt
+                bus.post(self._preflight_failed, e)
+                return
+            bus.post(self._preflight_complete, report, files, signtool_path, ts_url)
+
+        threading.Thread(target=_check, daemon=True).start()
+
+    def _preflight_failed(self, error: Exception) -> None:
+        """Die Vorabprüfung selbst ist abgestürzt (nicht: Befunde gefunden)."""
+        if self._on_log:
+            self._on_log(f"Vorabprüfung fehlgeschlagen: {error}", "error")
+        if self._on_status:
+            self._on_status("Vorabprüfung fehlgeschlagen")
+        self._reset_sign_button()
+
+    def _reset_sign_button(self) -> None:
+        """Gibt den Sign-Button nach Abbruch oder Abschluss wieder frei."""
+        self._is_signing = False
+        self._cancel_token = None
+        self._sign_btn.configure(state="normal", text="Jetzt signieren")
+        self._cancel_btn.configure(state="disabled", text="Abbrechen")
+
+    def _cancel_signing(self) -> None:
+        """Bricht den laufenden Signiervorgang ab (beendet signtool-Prozesse)."""
+        if self._cancel_token is None or self._cancel_token.cancelled:
+            return
+        self._cancel_token.cancel()
+        self._cancel_btn.configure(state="disabled", text="Breche ab...")
+        if self._on_log:
+            self._on_log(
+                "Abbruch angefordert – laufende signtool-Prozesse werden beendet.",
+                "warning",
+            )
+        if self._on_status:
+            self._on_status("Breche ab...")
+
+    def _preflight_complete(
+        self,
+        report: PreflightReport,
+        files: List[str],
+        signtool_path: str,
+        ts_url: str,
+    ) -> None:
+        """Wertet die Vorabprüfung aus und startet ggf. den Signiervorgang."""
+        if self._on_log:
+            tag = "success" if report.ok and not report.warnings else "warning"
+            self._on_log(f"Vorabprüfung: {report.summary()}", tag)
+            for issue in report.issues[: self.MAX_PREFLIGHT_LOG_LINES]:
+                self._on_log(
+                    f"  {Path(issue.file_path).name}: {issue.message}",
+                    "error" if issue.severity == SEVERITY_ERROR else "warning",
+                )
+            hidden = len(report.issues) - self.MAX_PREFLIGHT_LOG_LINES
+            if hidden > 0:
+                self._on_log(f"  ... und {hidden} weitere Befunde", "dim")
+
+        failed = report.failed_files
+        if failed:
+            remaining = [fp for fp in files if fp not in failed]
+            if not remaining:
+                messagebox.showerror(
+                    "Vorabprüfung fehlgeschlagen",
+                    f"Keine der {len(files)} Datei(en) kann signiert werden.\n"
+                    "Details siehe Protokoll.",
+                )
+                self._reset_sign_button()
+                if self._on_status:
+                    self._on_status("Vorabprüfung fehlgeschlagen")
+                return
+
+            proceed = messagebox.askyesno(
+                "Vorabprüfung",
+                f"{len(failed)} von {len(files)} Datei(en) können nicht signiert "
+                f"werden (Details siehe Protokoll).\n\n"
+                f"Mit den übrigen {len(remaining)} Datei(en) fortfahren?",
+            )
+            if not proceed:
+                self._reset_sign_button()
+                if self._on_status:
+                    self._on_status("Abgebrochen")
+                return
+            files = remaining
+
+        self._launch_signing(files, signtool_path, ts_url)
+
+    def _launch_signing(
+        self, files: List[str], signtool_path: str, ts_url: str
+    ) -> None:
+        """Fragt die Bestätigung ab und startet den Signiervorgang."""
+        workers = self._get_worker_count()
+        batch_size = self._get_batch_size()
+        two_phase = bool(self._two_phase_var.get())
+
+        sign_index: Optional[SignIndex] = None
+        if self._skip_unchanged_var.get():
+            if self._sign_index is None:
+                self._sign_index = SignIndex()
+            sign_index = self._sign_index
+
+        # "auto": Server pro Aufruf nach Latenz/Fehlerquote wählen.
+        # Der Selector bleibt über mehrere Durchläufe erhalten.
+        selector: Optional[TimestampSelector] = None
+        if ts_url.lower() == self.AUTO_TS_URL:
+            if self._ts_selector is None:
+                self._ts_selector = TimestampSelector(
+                    [url for _, url in TIMESTAMP_SERVERS]
+                )
+            selector = self._ts_selector
+            # Nur Platzhalter – choose() würde eine Test-Anfrage belegen
+            ts_url = selector.urls[0]
+
+        # --- Unterbrochenen Vorgang fortsetzen? ---
+        if self._journal is None:
+            self._journal = SigningJournal()
+        thumbprint = self._selected_cert.thumbprint
+        resume_note = ""
+        state = self._journal.inspect(files, thumbprint)
+        if state is not None and state.done:
+            resume = messagebox.askyesno(
+                "Unterbrochener Vorgang",
+                f"Für diese Dateien und dieses Zertifikat wurde ein "
+                f"unterbrochener Signiervorgang gefunden: {len(state.done)} von "
+                f"{state.total} Datei(en) sind bereits signiert.\n\n"
+                f"Fortsetzen? (Nein = alle Dateien neu signieren)",
+            )
+            if resume:
+                resume_note = (
+                    f"\n\n{len(state.done)} davon sind bereits signiert "
+                    f"und werden übersprungen."
+                )
+            else:
+                self._journal.discard(files, thumbprint)
+
         # --- Bestätigung ---
-        count = len(self._files)
+        count = len(files)
         confirm = messagebox.askyesno(
             "Signierung starten",
             f"Möchten Sie {count} Datei(en) mit dem Zertifikat\n"
             f"'{self._selected_cert.subject}'\n"
-            f"signieren?",
+            f"signieren?{resume_note}",
         )
         if not confirm:
+            self._reset_sign_button()
+            if self._on_status:
+                self._on_status("Bereit")
             return
 
         # --- Signierung starten ---
-        self._is_signing = True
         self._sign_btn.configure(state="disabled", text="Signiere...")
+        self._cancel_token = CancelToken()
+        self._cancel_btn.configure(state="normal")
         self._progress_bar.set(0)
         self._progress_label.configure(text="Starte Signiervorgang...")
+        self._rate_label.configure(text="")
 
         if self._on_log:
             self._on_log("=" * 60, "header")
             self._on_log("SIGNIERVORGANG GESTARTET", "header")
             self._on_log(f"Zertifikat: {self._selected_cert.subject}", "info")
             self._on_log(f"Thumbprint: {self._selected_cert.thumbprint}", "dim")
-            self._on_log(f"Timestamp:  {ts_url}", "dim")
+            if self._selected_cert.stores:
+                self._on_log(
+                    f"Speicher:   {', '.join(self._selected_cert.stores)}", "dim"
+                )
+            self._on_log(
+                f"Timestamp:  {'automatisch' if selector else ts_url}", "dim"
+            )
             self._on_log(f"Dateien:    {count}", "dim")
+            self._on_log(f"Parallel:   {workers}", "dim")
+            self._on_log(f"Pro Aufruf: {batch_size}", "dim")
+            if two_phase:
+                self._on_log("Modus:      Signieren, danach Zeitstempel", "dim")
             self._on_log("=" * 60, "header")
 
         if self._on_status:
             self._on_status("Signiere...")
 
-        signer = Signer(signtool_path)
+        signer = Signer(
+            signtool_path,
+            max_workers=workers,
+            batch_size=batch_size,
+            two_phase=two_phase,
+            timestamp_selector=selector,
+            retry_policy=RetryPolicy(),
+            sign_index=sign_index,
+            machine_store=self._selected_cert.machine_store_only,
+            journal=self._journal,
+        )
+
+        self._signer = signer
+        bus = self._event_bus
 
         def _on_progress(current: int, total: int, filename: str):
-            self.after(0, lambda: self._update_progress(current, total, filename))
+            bus.post_progress(
+                "sign", self._update_progress, current, total, filename
+            )
 
         def _on_log_line(msg: str):
             # Automatische Farb-Erkennung
@@ -380,25 +713,35 @@ class SignPanel(ctk.CTkFrame):
             elif "Befehl:" in msg:
                 tag = "dim"
 
-            if self._on_log:
-                self.after(0, lambda: self._on_log(msg, tag))
+            bus.post_log(msg, tag)
 
         def _on_result(result: SignResult):
             pass  # Wird über on_log abgedeckt
 
+        def _on_throughput(snapshot: ThroughputSnapshot):
+            bus.post_progress("throughput", self._update_throughput, snapshot)
+
         def _on_complete(results: List[SignResult]):
-            self.after(0, lambda: self._signing_complete(results))
+            bus.post(self._signing_complete, results)
 
         signer.sign_files(
-            files=self._files,
+            files=files,
             thumbprint=self._selected_cert.thumbprint,
             timestamp_url=ts_url,
             on_progress=_on_progress,
             on_log=_on_log_line,
             on_result=_on_result,
             on_complete=_on_complete,
+            on_throughput=_on_throughput,
+            cancel=self._cancel_token,
         )
 
+    def _log_entries(self, entries) -> None:
+        """Gibt gebündelte Log-Zeilen einzeln an ``on_log`` weiter."""
+        if self._on_log:
+            for message, tag in entries:
+                self._on_log(message, tag)
+
     def _update_progress(self, current: int, total: int, filename: str) -> None:
         """Aktualisiert die Fortschrittsanzeige."""
         progress = current / total
@@ -409,18 +752,111 @@ class SignPanel(ctk.CTkFrame):
         if self._on_status:
             self._on_status(f"Signiere [{current}/{total}]: {filename}")
 
+    def _update_throughput(self, snapshot: ThroughputSnapshot) -> None:
+        """Zeigt Dateien pro Minute und die geschätzte Restzeit."""
+        if snapshot.files_per_minute is None:
+            return
+        text = f"{snapshot.files_per_minute:.1f} Dateien/min"
+        if snapshot.remaining:
+            text += f" · Restzeit ca. {format_duration(snapshot.eta)}"
+        self._rate_label.configure(text=text)
+
+    def _log_timings(self, results: List[SignResult]) -> None:
+        """Schreibt die mittleren Phasenzeiten der signierten Dateien ins Log."""
+        mean = SignTimings.mean(
+            r.timings
+            for r in results
+            if not r.skipped and r.error_class != ERROR_CANCELLED
+        )
+        if mean is None or not self._on_log:
+            return
+        parts = [
+            f"Warteschlange {mean.queue_wait:.2f}s",
+            f"Prozessstart {mean.spawn:.2f}s",
+            f"Signieren {mean.sign:.2f}s",
+        ]
+        if mean.timestamp:
+            parts.append(f"Zeitstempel {mean.timestamp:.2f}s")
+        parts.append(f"gesamt {mean.total:.2f}s")
+        self._on_log(f"Zeiten pro Datei (Ø): {', '.join(parts)}", "dim")
+
+    def _log_timestamp_stats(self) -> None:
+        """Schreibt die gemessenen Timestamp-Server-Statistiken ins Log."""
+        if not self._ts_selector or not self._on_log:
+            return
+        for entry in self._ts_selector.snapshot():
+            if not entry["samples"]:
+                continue
+            latency = entry["mean_latency"]
+            latency_text = f"{latency:.2f}s" if latency is not None else "–"
+            self._on_log(
+                f"Timestamp {entry['url']}: Ø {latency_text}, "
+                f"Fehler {entry['error_rate']:.0%}, Status {entry['state']}",
+                "dim",
+            )
+
     def _signing_complete(self, results: List[SignResult]) -> None:
         """Wird nach Abschluss des Signiervorgangs aufgerufen."""
-        self._is_signing = False
-        self._sign_btn.configure(state="normal", text="Jetzt signieren")
+        self._reset_sign_button()
+        if self._on_complete:
+            self._on_complete(results)
 
         success = sum(1 for r in results if r.success)
-        failed = sum(1 for r in results if not r.success)
+        skipped = sum(1 for r in results if r.skipped)
+        cancelled = sum(1 for r in results if r.error_class == ERROR_CANCELLED)
+        failed = sum(
+            1 for r in results if not r.success and r.error_class != ERROR_CANCELLED
+        )
         total = len(results)
 
-        self._progress_bar.set(1.0)
+        self._progress_bar.set((total - cancelled) / total if total else 1.0)
+        self._log_timestamp_stats()
+        self._log_timings(results)
+
+        tracker = self._signer.throughput if self._signer else None
+        if tracker is not None:
+            snapshot = tracker.snapshot()
+            rate = snapshot.done / snapshot.elapsed * 60 if snapshot.elapsed else 0.0
+            self._rate_label.configure(
+                text=f"Dauer {format_duration(snapshot.elapsed)} · "
+                f"Ø {rate:.1f} Dateien/min"
+            )
 
-        if failed == 0:
+        if skipped and self._on_log:
+            self._on_log(
+                f"{skipped} Datei(en) unverändert übersprungen (bereits signiert).",
+                "dim",
+            )
+
+        retried = sum(1 for r in results if r.attempts > 1)
+        if retried and self._on_log:
+            self._on_log(
+                f"{retried} Datei(en) erst nach Wiederholung abgeschlossen.", "dim"
+            )
+
+        if cancelled:
+            failed_text = f", {failed} fehlgeschlagen" if failed else ""
+            self._progress_label.configure(
+                text=f"Abgebrochen – {success} signiert{failed_text}, "
+                f"{cancelled} nicht signiert",
+                text_color="#fbbf24",
+            )
+            if self._on_log:
+                self._on_log("=" * 60, "header")
+                self._on_log(
+                    f"ABGEBROCHEN: {success} signiert{failed_text}, "
+                    f"{cancelled} nicht signiert",
+                    "warning",
+                )
+                self._log_failures(results)
+                self._on_log(
+                    "Ein erneuter Start mit denselben Dateien setzt den Vorgang fort.",
+                    "dim",
+                )
+                self._on_log("=" * 60, "header")
+            if self._on_status:
+                self._on_status(f"Abgebrochen - {cancelled} Datei(en) nicht signiert")
+        elif failed == 0:
             self._progress_label.configure(
                 text=f"Alle {total} Datei(en) erfolgreich signiert!",
                 text_color="#4ade80",
@@ -445,11 +881,20 @@ class SignPanel(ctk.CTkFrame):
                     f"ERGEBNIS: {success} erfolgreich, {failed} fehlgeschlagen",
                     "error" if success == 0 else "warning",
                 )
-                for r in results:
-                    if not r.success:
-                        self._on_log(
-                            f"  FEHLER: {Path(r.file_path).name} – {r.error}", "error"
-                        )
+                self._log_failures(results)
                 self._on_log("=" * 60, "header")
             if self._on_status:
                 self._on_status(f"Fertig - {failed} Fehler")
+
+    def _log_failures(self, results: List[SignResult]) -> None:
+        """Listet fehlgeschlagene (nicht abgebrochene) Dateien im Log auf."""
+        if not self._on_log:
+            return
+        for r in results:
+            if not r.success and r.error_class != ERROR_CANCELLED:
+                label = ERROR_LABELS.get(r.error_class, "")
+                label_text = f"[{label}] " if label else ""
+                self._on_log(
+                    f"  FEHLER: {Path(r.file_path).name} – {label_text}{r.error}",
+                    "error",
+                )
@@ -3,7 +3,8 @@ Let's Do. | SignIT – Entry-Point.
 
 Startet die SignIT GUI-Anwendung zum Signieren
 von EXE-Dateien mit Code-Signing-Zertifikaten aus dem
-Windows-Zertifikatsspeicher.
+Windows-Zertifikatsspeicher. Mit ``--cli`` läuft SignIT
+ohne GUI auf der Kommandozeile (siehe core/cli.py).
 
 Projekt:  Let's Do. | SignIT
 Lizenz:   Apache License 2.0
@@ -37,9 +38,16 @@ def _setup_path() -> None:
 
 
 def main() -> None:
-    """Startet die Anwendung."""
+    """Startet die Anwendung (mit ``--cli`` ohne GUI)."""
     _setup_path()
 
+    # Kommandozeilenmodus: GUI-Stack (tkinter/customtkinter) nie importieren
+    if "--cli" in sys.argv[1:]:
+        from core.cli import main as cli_main
+
+        cli_main([arg for arg in sys.argv[1:] if arg != "--cli"])
+        return
+
     from gui.app import SignITApp
 
     app = SignITApp()
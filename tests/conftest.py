@@ -0,0 +1,70 @@
+"""Gemeinsame Fixtures der Tests."""
+
+import struct
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from benchmarks.fake_tsa import FakeTSA
+from benchmarks.run import write_launcher
+from core.authenticode import read_pe_layout
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+SIGNED_DLL = FIXTURES / "signed.dll"
+SIGNED_DLL_THUMBPRINT = "ABDCA79AF9DD48A0EA702AD45260B3C03093FB4B"
+
+
+@pytest.fixture
+def signed_dll(tmp_path: Path) -> Path:
+    """Beschreibbare Kopie der signierten Test-DLL."""
+    path = tmp_path / "signed.dll"
+    path.write_bytes(SIGNED_DLL.read_bytes())
+    return path
+
+
+@pytest.fixture
+def unsigned_dll(tmp_path: Path) -> Path:
+    """Die Test-DLL ohne Signatur: Zertifikatstabelle und Verweis entfernt."""
+    data = bytearray(SIGNED_DLL.read_bytes())
+    with open(SIGNED_DLL, "rb") as f:
+        layout = read_pe_layout(f)
+    struct.pack_into("<II", data, layout.security_dir_offset, 0, 0)
+    path = tmp_path / "unsigned.dll"
+    path.write_bytes(bytes(data[: layout.cert_table_offset]))
+    return path
+
+
+@pytest.fixture
+def fake_tsa() -> Iterator[FakeTSA]:
+    """Lokaler Timestamp-Server (benchmarks/fake_tsa.py)."""
+    with FakeTSA() as tsa:
+        yield tsa
+
+
+@pytest.fixture
+def fake_signtool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Pfad zu einem ``signtool``, das benchmarks/fake_signtool.py startet."""
+    for name in (
+        "FAKE_SIGNTOOL_LATENCY",
+        "FAKE_SIGNTOOL_FILE_LATENCY",
+        "FAKE_SIGNTOOL_OUTPUT_LINES",
+        "FAKE_SIGNTOOL_FAILURE_RATE",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    directory = tmp_path / "bin"
+    directory.mkdir()
+    return write_launcher(directory)
+
+
+def make_files(directory: Path, *names: str) -> list:
+    """Legt kleine PE-Platzhalter an und liefert ihre Pfade."""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for name in names:
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"MZ" + b"\0" * 62)
+        paths.append(str(path))
+    return paths
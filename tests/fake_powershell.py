@@ -0,0 +1,64 @@
+"""
+Stub für ``powershell -Command -``: liest Befehle zeilenweise von stdin.
+
+Beantwortet Abfrage-Skripte mit festen Zertifikaten. Wie Windows
+PowerShell schreibt es in der OEM-Codepage (cp850), bis die Ausgabe per
+``[Console]::OutputEncoding`` auf UTF-8 umgestellt wird.
+
+FAKE_PS_MODE:
+    exit     beendet sich nach dem ersten Befehl ohne Antwort
+    garbage  antwortet mit ungültigem UTF-8
+"""
+
+import base64
+import json
+import os
+import re
+import sys
+
+CERTIFICATE = {
+    "Subject": "Müller Code Signing",
+    "Issuer": "Müller CA",
+    "Thumbprint": "8D607AAFD7DA3054248F3ABE891ADEAED6FBEBE3",
+    "NotAfter": "2036-10-15T07:25:35",
+}
+
+
+def answer(script: str) -> dict:
+    locations = re.search(r"foreach \(\$loc in @\((.*?)\)\)", script).group(1)
+    result = {}
+    for location in re.findall(r"'([^']*)'", locations):
+        if location == "LocalMachine":
+            result[location] = {"error": "Zugriff verweigert"}
+        elif "thumbprints =" in script:
+            result[location] = {"thumbprints": CERTIFICATE["Thumbprint"]}
+        else:
+            # Einzelnes Element: ConvertTo-Json entpackt das Array
+            result[location] = {"certificates": CERTIFICATE}
+    return result
+
+
+def main() -> None:
+    encoding = "cp850"
+    mode = os.environ.get("FAKE_PS_MODE", "")
+    out = sys.stdout.buffer
+    for line in sys.stdin:
+        if "OutputEncoding" in line and "UTF8" in line:
+            encoding = "utf-8"
+        elif line.startswith("Invoke-Expression"):
+            if mode == "exit":
+                return
+            encoded = re.search(r"FromBase64String\('([^']*)'\)", line).group(1)
+            script = base64.b64decode(encoded).decode("utf-8")
+            if mode == "garbage":
+                out.write(b"\xff\xfe M\xfcller\n")
+            else:
+                text = json.dumps(answer(script), ensure_ascii=False)
+                out.write(text.encode(encoding) + b"\n")
+        elif line.startswith("Write-Output"):
+            out.write(line.split("'")[1].encode("ascii") + b"\n")
+        out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Authenticode-Erkennung aus der PE-Zertifikatstabelle."""
+
+from pathlib import Path
+
+from core.authenticode import read_pe_layout, read_signature_info, scan_files
+from tests.conftest import SIGNED_DLL, SIGNED_DLL_THUMBPRINT
+
+
+def test_pe_layout_of_signed_dll() -> None:
+    with open(SIGNED_DLL, "rb") as f:
+        layout = read_pe_layout(f)
+    assert layout is not None
+    assert not layout.is_pe32_plus
+    assert layout.checksum_offset == layout.pe_offset + 24 + 64
+    assert layout.cert_table_offset % 8 == 0
+    assert layout.cert_table_offset + layout.cert_table_size == layout.file_size
+
+
+def test_signed_dll() -> None:
+    info = read_signature_info(str(SIGNED_DLL))
+    assert info.is_pe
+    assert info.signed
+    assert info.signer_thumbprint == SIGNED_DLL_THUMBPRINT
+    assert info.timestamped
+    assert info.error == ""
+
+
+def test_unsigned_dll(unsigned_dll: Path) -> None:
+    info = read_signature_info(str(unsigned_dll))
+    assert info.is_pe
+    assert not info.signed
+    assert info.signer_thumbprint is None
+
+
+def test_non_pe_file(tmp_path: Path) -> None:
+    path = tmp_path / "readme.txt"
+    path.write_text("kein PE")
+    info = read_signature_info(str(path))
+    assert not info.is_pe
+    assert not info.signed
+
+
+def test_certificate_table_outside_file(signed_dll: Path) -> None:
+    data = signed_dll.read_bytes()
+    signed_dll.write_bytes(data[:-100])
+    info = read_signature_info(str(signed_dll))
+    assert not info.signed
+    assert info.error
+
+
+def test_scan_files_keeps_order(unsigned_dll: Path) -> None:
+    infos = scan_files([str(SIGNED_DLL), str(unsigned_dll)], max_workers=2)
+    assert [i.signed for i in infos] == [True, False]
@@ -0,0 +1,167 @@
+"""Benchmark-Werkzeuge: Fake-signtool, Fake-TSA, Auswertung und ein Lauf."""
+
+import json
+import urllib.error
+import urllib.request
+from dataclasses import asdict
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from benchmarks import fake_signtool
+from benchmarks.fake_tsa import FakeTSA
+from benchmarks.run import (
+    Scenario,
+    ScenarioResult,
+    compare,
+    format_table,
+    percentile,
+    run_scenario,
+)
+from tests.conftest import make_files
+
+
+@pytest.mark.parametrize(
+    "q, expected",
+    [(0, 1.0), (50, 5.0), (95, 10.0), (99, 10.0), (100, 10.0), (10, 1.0), (11, 2.0)],
+)
+def test_percentile_nearest_rank(q: float, expected: float) -> None:
+    values = [float(v) for v in (7, 3, 10, 1, 5, 2, 9, 4, 8, 6)]
+    assert percentile(values, q) == expected
+
+
+def test_percentile_empty() -> None:
+    assert percentile([], 50) == 0.0
+
+
+def test_parse_args() -> None:
+    command, flags, files = fake_signtool.parse_args(
+        [
+            "SIGN", "/SHA1", "AB", "/fd", "sha256", "/tr", "http://tsa",
+            "/sm", "/v", "a.exe", "b dir/b.dll",
+        ]
+    )
+    assert command == "sign"
+    assert flags == {
+        "/sha1": "AB",
+        "/fd": "sha256",
+        "/tr": "http://tsa",
+        "/sm": "",
+        "/v": "",
+    }
+    assert files == ["a.exe", "b dir/b.dll"]
+    assert fake_signtool.parse_args([]) == ("", {}, [])
+
+
+def test_value_flag_at_end_is_a_file() -> None:
+    assert fake_signtool.parse_args(["sign", "/tr"]) == ("sign", {}, ["/tr"])
+
+
+def test_fake_signtool_messages(
+    tmp_path: Path,
+    fake_tsa: FakeTSA,
+    capsys: pytest.CaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    a, b = make_files(tmp_path, "a.exe", "b.exe")
+    monkeypatch.delenv("FAKE_SIGNTOOL_FAILURE_RATE", raising=False)
+    assert fake_signtool.main(["timestamp", "/tr", fake_tsa.url, a, b]) == 0
+    out = capsys.readouterr().out
+    assert f"Successfully timestamped: {a}" in out
+    assert "Number of errors: 0" in out
+
+    fake_tsa.failure_rate = 1.0
+    assert fake_signtool.main(["sign", "/tr", fake_tsa.url, a]) == 1
+    assert f"{fake_signtool.TIMESTAMP_ERROR} {a}" in capsys.readouterr().err
+
+    monkeypatch.setenv("FAKE_SIGNTOOL_FAILURE_RATE", "1")
+    assert fake_signtool.main(["sign", a]) == 1
+    assert f"{fake_signtool.FILE_IN_USE_ERROR} {a}" in capsys.readouterr().err
+
+    assert fake_signtool.main(["verify", a]) == 1
+    assert fake_signtool.main(["sign"]) == 1
+
+
+def _post(url: str) -> int:
+    request = urllib.request.Request(url, data=b"query")
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+    try:
+        with opener.open(request, timeout=10) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def test_fake_tsa_failure_rate_is_reproducible() -> None:
+    statuses: List[List[int]] = []
+    for _ in range(2):
+        with FakeTSA(failure_rate=0.5, seed=7) as tsa:
+            statuses.append([_post(tsa.url) for _ in range(20)])
+            assert tsa.requests == 20
+            assert tsa.failures == statuses[-1].count(503)
+    assert statuses[0] == statuses[1]
+    assert set(statuses[0]) == {200, 503}
+
+
+def _result(name: str, fps: float, p95: float, failed: int = 0) -> ScenarioResult:
+    mode, files = name.split("/")
+    return ScenarioResult(
+        name=name,
+        mode=mode,
+        files=int(files),
+        succeeded=int(files) - failed,
+        failed=failed,
+        wall=1.0,
+        files_per_second=fps,
+        p50=p95 / 2,
+        p95=p95,
+        p99=p95,
+        mean_spawn=0.0,
+        mean_queue_wait=0.0,
+        peak_rss_mb=None,
+    )
+
+
+def test_compare_reports_regressions(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps(
+            {
+                "results": [
+                    asdict(_result("batch/10", 100.0, 0.2)),
+                    asdict(_result("parallel/10", 50.0, 0.5)),
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    results = [
+        _result("batch/10", 85.0, 0.21),  # innerhalb von 20 %
+        _result("parallel/10", 30.0, 0.7, failed=1),
+        _result("sequential/10", 1.0, 9.0),  # nicht in der Baseline
+    ]
+    regressions = compare(results, str(baseline), tolerance=0.2)
+    assert len(regressions) == 3
+    assert all(r.startswith("parallel/10: ") for r in regressions)
+    assert compare(results[:1], str(baseline), tolerance=0.1) == [
+        "batch/10: Durchsatz 85.0/s (Baseline 100.0/s)"
+    ]
+
+
+def test_format_table() -> None:
+    table = format_table([_result("batch/10", 12.5, 0.2)]).splitlines()
+    assert len(table) == 3
+    assert table[2].startswith("batch/10")
+    assert "12.5" in table[2] and table[2].endswith("–")
+
+
+def test_run_scenario(fake_tsa: FakeTSA, monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("FAKE_SIGNTOOL_LATENCY", "FAKE_SIGNTOOL_FAILURE_RATE"):
+        monkeypatch.delenv(name, raising=False)
+    result = run_scenario(Scenario("batch", 10), [fake_tsa.url])
+    assert result.name == "batch/10"
+    assert (result.succeeded, result.failed) == (10, 0)
+    assert result.files_per_second > 0
+    assert 0 < result.p50 <= result.p95 <= result.p99
+    assert fake_tsa.requests == 10
@@ -0,0 +1,50 @@
+"""Zertifikatsquellen: Basisklasse, Speicher im Arbeitsspeicher, Fingerprint."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from core.certstore import (
+    CertificateProvider,
+    CertInfo,
+    MemoryProvider,
+    compute_fingerprint,
+)
+
+
+def _cert(thumbprint: str) -> CertInfo:
+    return CertInfo(
+        subject="CN=Test",
+        issuer="CN=Test CA",
+        thumbprint=thumbprint,
+        not_after=datetime(2036, 1, 1, tzinfo=timezone.utc),
+        has_private_key=True,
+    )
+
+
+def test_provider_without_list_certificates_cannot_be_created() -> None:
+    class Incomplete(CertificateProvider):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+    with pytest.raises(TypeError):
+        CertificateProvider()
+
+
+def test_memory_provider_lists_and_fingerprints() -> None:
+    provider = MemoryProvider({"CurrentUser": [_cert("AA" * 20)]})
+    provider.add(_cert("bb" * 20), "LocalMachine")
+    assert [c.thumbprint for c in provider.list_certificates()] == ["AA" * 20]
+    assert provider.list_certificates("Unbekannt") == []
+
+    certs, errors = provider.list_many(["CurrentUser", "LocalMachine"])
+    assert errors == {}
+    assert [c.thumbprint for c in certs["LocalMachine"]] == ["bb" * 20]
+    assert provider.fingerprint("LocalMachine") == compute_fingerprint(["BB" * 20])
+
+
+def test_fingerprint_ignores_order_and_case() -> None:
+    assert compute_fingerprint(["ab", "CD"]) == compute_fingerprint(["cd", "AB"])
+    assert compute_fingerprint(["ab"]) != compute_fingerprint(["ab", "cd"])
+    assert compute_fingerprint([]).startswith("0:")
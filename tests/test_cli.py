@@ -0,0 +1,171 @@
+"""Kommandozeile: Eingaben expandieren und Ende-zu-Ende mit Fake-signtool."""
+
+import io
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Tuple
+
+import pytest
+
+from benchmarks.fake_tsa import FakeTSA
+from core import cli
+from core.cli import (
+    EXIT_CANCELLED,
+    EXIT_ENVIRONMENT,
+    EXIT_FAILED,
+    EXIT_OK,
+    expand_inputs,
+    run,
+)
+from tests.conftest import make_files
+
+THUMBPRINT = "0" * 40
+
+
+def test_glob_is_sorted_and_files_only(tmp_path: Path) -> None:
+    make_files(tmp_path, "b.exe", "a.exe", "c.dll")
+    (tmp_path / "d.exe").mkdir()
+    files = expand_inputs([str(tmp_path / "*.exe")])
+    assert files == [str(tmp_path / "a.exe"), str(tmp_path / "b.exe")]
+
+
+def test_recursive_glob(tmp_path: Path) -> None:
+    make_files(tmp_path, "a.exe", "sub/deep/b.exe")
+    files = expand_inputs([str(tmp_path / "**" / "*.exe")])
+    assert sorted(map(os.path.basename, files)) == ["a.exe", "b.exe"]
+
+
+def test_listfile_with_comments_patterns_and_duplicates(tmp_path: Path) -> None:
+    a, b = make_files(tmp_path, "a.exe", "b.dll")
+    listfile = tmp_path / "files.txt"
+    listfile.write_text(
+        "\ufeff# Kommentar\n"
+        f"{a}\n"
+        "\n"
+        f"{tmp_path / '*.dll'}\n"
+        f"{a}\n"
+        f"{tmp_path / 'missing.exe'}\n"
+        f"{tmp_path / 'nomatch*.sys'}\n",
+        encoding="utf-8",
+    )
+    files = expand_inputs([f"@{listfile}", b])
+    assert files == [a, b, str(tmp_path / "missing.exe")]
+
+
+def test_folder_uses_include_and_exclude(tmp_path: Path) -> None:
+    make_files(tmp_path, "app.exe", "lib.dll", "obj/tmp.exe", "notes.txt")
+    files = expand_inputs([str(tmp_path)], include=["*.exe", "*.dll"], exclude=["obj"])
+    assert sorted(map(os.path.basename, files)) == ["app.exe", "lib.dll"]
+
+
+def _run(args: List[str]) -> Tuple[int, List[dict]]:
+    out, err = io.StringIO(), io.StringIO()
+    code = run(args, out, err)
+    return code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_signs_with_fake_signtool(
+    tmp_path: Path, fake_signtool: str, fake_tsa: FakeTSA
+) -> None:
+    files = make_files(tmp_path / "in", "a.exe", "b.exe", "c.exe")
+    code, records = _run(
+        [
+            "-t", THUMBPRINT,
+            "--signtool", fake_signtool,
+            "--timestamp-url", fake_tsa.url,
+            "--batch-size", "2",
+            str(tmp_path / "in"),
+        ]
+    )
+    assert code == EXIT_OK
+    results = [r for r in records if r["event"] == "result"]
+    assert sorted(r["file"] for r in results) == sorted(files)
+    assert all(r["success"] for r in results)
+    assert records[-1]["event"] == "summary"
+    assert records[-1]["succeeded"] == 3
+    assert fake_tsa.requests == 3
+
+
+def test_timestamp_failure_exit_code(
+    tmp_path: Path, fake_signtool: str, fake_tsa: FakeTSA
+) -> None:
+    fake_tsa.failure_rate = 1.0
+    make_files(tmp_path, "a.exe")
+    code, records = _run(
+        [
+            "-t", THUMBPRINT,
+            "--signtool", fake_signtool,
+            "--timestamp-url", fake_tsa.url,
+            "--no-retry",
+            str(tmp_path / "a.exe"),
+        ]
+    )
+    assert code == EXIT_FAILED
+    assert records[0]["error_class"] == "timestamp"
+
+
+def test_missing_signtool(tmp_path: Path) -> None:
+    signtool = str(tmp_path / "signtool.exe")
+    code, _ = _run(["-t", THUMBPRINT, "--signtool", signtool, "a.exe"])
+    assert code == EXIT_ENVIRONMENT
+
+
+@pytest.mark.skipif(os.name == "nt", reason="würde die Test-Konsole übernehmen")
+def test_missing_streams_do_not_crash(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Wie in der mit console=False gebauten EXE
+    monkeypatch.setattr(cli.sys, "stdout", None)
+    monkeypatch.setattr(cli.sys, "stderr", None)
+    cli.attach_console()
+    try:
+        assert run(["-t", THUMBPRINT, "--signtool", "fehlt.exe", "a.exe"]) == (
+            EXIT_ENVIRONMENT
+        )
+    finally:
+        cli.sys.stdout.close()
+        cli.sys.stderr.close()
+
+
+class _CtrlC:
+    """Ersatz für threading.Event, bei dem jedes Warten mit Strg+C endet."""
+
+    def set(self) -> None:
+        pass
+
+    def wait(self, timeout: float) -> bool:
+        raise KeyboardInterrupt
+
+
+def test_second_ctrl_c_returns_cancelled(
+    tmp_path: Path, fake_signtool: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FAKE_SIGNTOOL_LATENCY", "0.5")
+    monkeypatch.setattr(
+        cli, "threading", SimpleNamespace(Event=_CtrlC, Lock=threading.Lock)
+    )
+    before = set(threading.enumerate())
+    make_files(tmp_path, "a.exe")
+    err = io.StringIO()
+    code = run(
+        [
+            "-t", THUMBPRINT,
+            "--signtool", fake_signtool,
+            "--timestamp-url", "",
+            str(tmp_path / "a.exe"),
+        ],
+        io.StringIO(),
+        err,
+    )
+    assert code == EXIT_CANCELLED
+    assert "Abbruch erzwungen" in err.getvalue()
+    # Der Signier-Thread wurde abgebrochen und endet von selbst (ggf. startet
+    # er gerade erst seine Worker, daher kein join())
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline and any(
+        t.is_alive() for t in set(threading.enumerate()) - before
+    ):
+        time.sleep(0.05)
+    assert not any(t.is_alive() for t in set(threading.enumerate()) - before)
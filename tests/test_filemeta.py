@@ -0,0 +1,108 @@
+"""Datei-Metadaten: Cache, explizite Neuprüfung und Änderungsmeldungen."""
+
+import threading
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from core import filemeta
+from core.filemeta import FileMeta, FileMetaService
+from tests.conftest import make_files
+
+
+class _Recorder:
+    """Zählt stat-Aufrufe und sammelt on_update-Meldungen."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch):
+        self.stats = 0
+        self.updates: List[Tuple[str, FileMeta]] = []
+        self._lock = threading.Lock()
+        real_stat = filemeta.stat_file
+
+        def _stat(path: str) -> FileMeta:
+            with self._lock:
+                self.stats += 1
+            return real_stat(path)
+
+        monkeypatch.setattr(filemeta, "stat_file", _stat)
+        self.service = FileMetaService(on_update=self._on_update, max_workers=1)
+
+    def _on_update(self, path: str, meta: FileMeta) -> None:
+        self.updates.append((path, meta))
+
+    def settle(self) -> None:
+        """Wartet, bis alle eingereihten Abfragen erledigt sind."""
+        self.service.prefetch([])
+        self.service._pool.submit(lambda: None).result(5)
+
+
+@pytest.fixture
+def recorder(monkeypatch: pytest.MonkeyPatch):
+    rec = _Recorder(monkeypatch)
+    yield rec
+    rec.service.shutdown()
+
+
+def test_get_fetches_once(recorder: _Recorder, tmp_path: Path) -> None:
+    (path,) = make_files(tmp_path, "a.exe")
+    assert recorder.service.get(path) is None
+    recorder.settle()
+    meta = recorder.service.get(path)
+    assert (meta.size, meta.readable) == (64, True)
+    for _ in range(5):
+        recorder.service.get(path)
+    recorder.settle()
+    assert recorder.stats == 1
+    assert len(recorder.updates) == 1
+
+
+def test_invalidate_refreshes_on_next_get(
+    recorder: _Recorder, tmp_path: Path
+) -> None:
+    a, b = make_files(tmp_path, "a.exe", "b.exe")
+    recorder.service.prefetch([a, b])
+    recorder.settle()
+    recorder.updates.clear()
+
+    recorder.service.invalidate()
+    assert recorder.stats == 2  # kein Dateizugriff beim Invalidieren
+    with open(a, "ab") as f:
+        f.write(b"\0" * 10)
+    old = recorder.service.get(a)
+    assert old.size == 64  # alter Wert, bis die Neuprüfung da ist
+    recorder.settle()
+    assert recorder.stats == 3  # nur die abgefragte Datei
+    assert [(p, m.size) for p, m in recorder.updates] == [(a, 74)]
+
+    # Unverändert: neu geprüft, aber nicht gemeldet
+    recorder.service.get(b)
+    recorder.settle()
+    assert recorder.stats == 4
+    assert len(recorder.updates) == 1
+
+
+def test_invalidate_selected_paths(recorder: _Recorder, tmp_path: Path) -> None:
+    a, b = make_files(tmp_path, "a.exe", "b.exe")
+    recorder.service.prefetch([a, b])
+    recorder.settle()
+    recorder.service.invalidate([b])
+    recorder.service.get(a)
+    recorder.service.get(b)
+    recorder.settle()
+    assert recorder.stats == 3
+
+
+def test_missing_file_and_forget(recorder: _Recorder, tmp_path: Path) -> None:
+    (path,) = make_files(tmp_path, "a.exe")
+    recorder.service.get(path)
+    recorder.settle()
+    Path(path).unlink()
+    recorder.service.invalidate()
+    recorder.service.get(path)
+    recorder.settle()
+    meta = recorder.service.get(path)
+    assert meta.size is None and meta.error == "Datei nicht gefunden"
+
+    recorder.service.forget([path])
+    assert recorder.service.get(path) is None
@@ -0,0 +1,125 @@
+"""Ordnersuche: Muster, Reihenfolge, Blöcke und Abbruch."""
+
+import os
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from core.folderscan import (
+    FolderScan,
+    PatternMatcher,
+    ScanStats,
+    scan_folder,
+    split_patterns,
+)
+from tests.conftest import make_files
+
+
+def _names(root: Path, chunks) -> List[str]:
+    return [
+        os.path.relpath(p, root).replace(os.sep, "/")
+        for chunk in chunks
+        for p in chunk
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("*.dll; *.exe", ["*.dll", "*.exe"]),
+        ("*.dll,*.exe;;", ["*.dll", "*.exe"]),
+        ("  obj ; tests/* ", ["obj", "tests/*"]),
+        ("", []),
+        (" ; , ", []),
+    ],
+)
+def test_split_patterns(text: str, expected: List[str]) -> None:
+    assert split_patterns(text) == expected
+
+
+def test_pattern_matcher_name_and_path() -> None:
+    matcher = PatternMatcher(["*.DLL", "tests\\*"])
+    assert matcher.matches("a.dll", "sub/a.dll")
+    assert matcher.matches("x.exe", "tests/x.exe")
+    assert not matcher.matches("x.exe", "sub/tests/x.exe")
+    assert not PatternMatcher([" ", ""])
+
+
+def test_scan_is_alphabetical_and_depth_first(tmp_path: Path) -> None:
+    make_files(tmp_path, "b.exe", "A.exe", "sub/c.dll", "sub/deep/d.exe", "z.exe")
+    make_files(tmp_path, "readme.txt")
+    assert _names(tmp_path, scan_folder(str(tmp_path))) == [
+        "A.exe",
+        "b.exe",
+        "z.exe",
+        "sub/c.dll",
+        "sub/deep/d.exe",
+    ]
+
+
+def test_include_exclude_and_pruned_folders(tmp_path: Path) -> None:
+    make_files(
+        tmp_path,
+        "a.dll",
+        "a.exe",
+        "obj/b.dll",
+        "src/obj/c.dll",
+        "tests/d.dll",
+        "src/tests/e.dll",
+    )
+    stats = ScanStats()
+    found = _names(
+        tmp_path,
+        scan_folder(str(tmp_path), ["*.dll"], ["obj", "tests/*"], stats=stats),
+    )
+    assert found == ["a.dll", "src/tests/e.dll"]
+    # Ausgeschlossene Ordner werden nicht betreten
+    assert stats.directories == 4  # Start, src, src/tests, tests
+    assert stats.matched == 2
+
+
+def test_empty_include_matches_everything(tmp_path: Path) -> None:
+    make_files(tmp_path, "a.exe", "notes.txt")
+    assert _names(tmp_path, scan_folder(str(tmp_path), [])) == [
+        "a.exe",
+        "notes.txt",
+    ]
+
+
+def test_chunks(tmp_path: Path) -> None:
+    make_files(tmp_path, *(f"f{i:02}.exe" for i in range(7)))
+    chunks = list(scan_folder(str(tmp_path), chunk_size=3))
+    assert [len(c) for c in chunks] == [3, 3, 1]
+
+
+def test_cancel_stops_before_next_folder(tmp_path: Path) -> None:
+    make_files(tmp_path, "a.exe", "sub/b.exe")
+    cancel = threading.Event()
+    cancel.set()
+    stats = ScanStats()
+    assert list(scan_folder(str(tmp_path), cancel=cancel, stats=stats)) == []
+    assert stats.cancelled
+
+
+def test_folder_scan_thread(tmp_path: Path) -> None:
+    make_files(tmp_path, "a.exe", "b.dll", "c.txt")
+    chunks: List[List[str]] = []
+    done = threading.Event()
+    result: List[ScanStats] = []
+
+    def on_complete(stats: ScanStats) -> None:
+        result.append(stats)
+        done.set()
+
+    scan = FolderScan(
+        str(tmp_path),
+        include=split_patterns("*.exe"),
+        on_chunk=chunks.append,
+        on_complete=on_complete,
+    )
+    scan.start().join(5)
+    assert done.is_set()
+    assert _names(tmp_path, chunks) == ["a.exe"]
+    assert not result[0].cancelled
@@ -0,0 +1,152 @@
+"""Signier-Journal: Lesen, Fortsetzen nach Abbruch und Aufräumen."""
+
+import json
+import os
+from pathlib import Path
+from typing import List
+
+from core.journal import SigningJournal, batch_id, read_journal
+from core.signer import SignResult, Signer
+from tests.conftest import make_files
+
+THUMBPRINT = "AB CD" + "0" * 36
+
+
+def _result(file_path: str, success: bool = True) -> SignResult:
+    return SignResult(
+        file_path=file_path,
+        success=success,
+        return_code=0 if success else 1,
+        output="",
+        error="",
+        error_class=None if success else "unknown",
+    )
+
+
+def _interrupted(journal: SigningJournal, files: List[str], done: List[str]) -> Path:
+    session = journal.open(files, THUMBPRINT)
+    for fp in done:
+        session.record(_result(fp))
+    session.close(complete=False)
+    return session.path
+
+
+def test_batch_id_ignores_order_and_thumbprint_format(tmp_path: Path) -> None:
+    a, b = make_files(tmp_path, "a.exe", "b.exe")
+    assert batch_id([a, b], THUMBPRINT) == batch_id([b, a], THUMBPRINT.lower())
+    assert batch_id([a], THUMBPRINT) != batch_id([a, b], THUMBPRINT)
+    assert batch_id([a], THUMBPRINT) != batch_id([a], "1" * 40)
+
+
+def test_inspect_reports_done_and_failed(tmp_path: Path) -> None:
+    files = make_files(tmp_path / "in", "a.exe", "b.exe", "c.exe")
+    journal = SigningJournal(directory=str(tmp_path / "journals"))
+    session = journal.open(files, THUMBPRINT)
+    session.record(_result(files[0]))
+    session.record(_result(files[1], success=False))
+    session.close(complete=False)
+
+    state = journal.inspect(files, THUMBPRINT)
+    assert state is not None
+    assert state.total == 3
+    assert state.failed == 1
+    assert state.is_done(files[0])
+    assert not state.is_done(files[1])
+    assert not state.is_done(files[2])
+    # Anderes Zertifikat: kein passendes Journal
+    assert read_journal(session.path, "1" * 40) is None
+
+
+def test_latest_result_wins(tmp_path: Path) -> None:
+    files = make_files(tmp_path / "in", "a.exe")
+    journal = SigningJournal(directory=str(tmp_path / "journals"))
+    session = journal.open(files, THUMBPRINT)
+    session.record(_result(files[0], success=False))
+    session.record(_result(files[0]))
+    session.close(complete=False)
+
+    state = journal.inspect(files, THUMBPRINT)
+    assert state.is_done(files[0])
+    assert state.failed == 0
+
+
+def test_changed_file_is_not_done(tmp_path: Path) -> None:
+    files = make_files(tmp_path / "in", "a.exe")
+    journal = SigningJournal(directory=str(tmp_path / "journals"))
+    _interrupted(journal, files, files)
+    with open(files[0], "ab") as f:
+        f.write(b"\0")
+    assert not journal.inspect(files, THUMBPRINT).is_done(files[0])
+
+
+def test_torn_last_line_is_ignored_and_terminated(tmp_path: Path) -> None:
+    files = make_files(tmp_path / "in", "a.exe", "b.exe")
+    journal = SigningJournal(directory=str(tmp_path / "journals"))
+    path = _interrupted(journal, files, files[:1])
+    torn = json.dumps({"event": "result", "file": files[1], "success": True})
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(torn[: len(torn) // 2])
+
+    state = journal.inspect(files, THUMBPRINT)
+    assert state.is_done(files[0])
+    assert not state.is_done(files[1])
+
+    # Fortsetzen schließt die abgeschnittene Zeile ab
+    session = journal.open(files, THUMBPRINT)
+    session.record(_result(files[1]))
+    session.close(complete=False)
+    state = journal.inspect(files, THUMBPRINT)
+    assert state.is_done(files[0]) and state.is_done(files[1])
+
+
+def test_unreadable_journal(tmp_path: Path) -> None:
+    path = tmp_path / "broken.jsonl"
+    assert read_journal(path, THUMBPRINT) is None
+    path.write_text("", encoding="utf-8")
+    assert read_journal(path, THUMBPRINT) is None
+    path.write_text("{kein json\n", encoding="utf-8")
+    assert read_journal(path, THUMBPRINT) is None
+    path.write_text('{"event": "start", "version": 99}\n', encoding="utf-8")
+    assert read_journal(path, THUMBPRINT) is None
+
+
+def test_complete_removes_journal(tmp_path: Path) -> None:
+    files = make_files(tmp_path / "in", "a.exe")
+    journal = SigningJournal(directory=str(tmp_path / "journals"))
+    session = journal.open(files, THUMBPRINT)
+    session.record(_result(files[0]))
+    session.close(complete=True)
+    assert not session.path.exists()
+    # Nach dem Schließen wird nichts mehr geschrieben
+    session.record(_result(files[0]))
+    assert not session.path.exists()
+
+
+def test_discard(tmp_path: Path) -> None:
+    files = make_files(tmp_path / "in", "a.exe")
+    journal = SigningJournal(directory=str(tmp_path / "journals"))
+    path = _interrupted(journal, files, files)
+    journal.discard(files, THUMBPRINT)
+    assert not path.exists()
+    journal.discard(files, THUMBPRINT)  # fehlt bereits: kein Fehler
+
+
+def test_signer_resumes_from_journal(tmp_path: Path, fake_signtool: str) -> None:
+    files = make_files(tmp_path / "in", "a.exe", "b.exe", "c.exe", "d.exe")
+    journal = SigningJournal(directory=str(tmp_path / "journals"))
+    path = _interrupted(journal, files, files[:2])
+
+    signer = Signer(fake_signtool, batch_size=2, journal=journal)
+    completed: List[List[SignResult]] = []
+    thread = signer.sign_files(
+        files, THUMBPRINT, timestamp_url="", on_complete=completed.append
+    )
+    thread.join(30)
+
+    results = completed[0]
+    assert [r.file_path for r in results] == files
+    assert all(r.success for r in results)
+    assert [r.skipped for r in results] == [True, True, False, False]
+    # Vollständig durchgelaufen: Journal gelöscht
+    assert not path.exists()
+    assert not os.listdir(journal.directory)
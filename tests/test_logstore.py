@@ -0,0 +1,101 @@
+"""Ringpuffer, rotierende Logdatei und LogStore."""
+
+from pathlib import Path
+
+import pytest
+
+from core.logstore import LogLine, LogRing, LogStore, RotatingLogFile
+
+
+def _line(seq: int) -> LogLine:
+    return LogLine(seq, "12:00:00", f"Zeile {seq}")
+
+
+def _seqs(lines) -> list:
+    return [line.seq for line in lines]
+
+
+def test_ring_before_wraparound() -> None:
+    ring = LogRing(4)
+    for seq in range(1, 4):
+        ring.append(_line(seq))
+    assert len(ring) == 3
+    assert _seqs(ring) == [1, 2, 3]
+    assert _seqs(ring.tail(2)) == [2, 3]
+
+
+@pytest.mark.parametrize("appended", [4, 5, 7, 8, 9, 23])
+def test_ring_wraparound_keeps_newest(appended: int) -> None:
+    ring = LogRing(4)
+    for seq in range(1, appended + 1):
+        ring.append(_line(seq))
+    newest = list(range(max(1, appended - 3), appended + 1))
+    assert len(ring) == 4
+    assert _seqs(ring) == newest
+    assert _seqs(ring.tail(2)) == newest[-2:]
+    assert _seqs(ring.tail(100)) == newest
+
+
+def test_ring_tail_edge_cases() -> None:
+    ring = LogRing(3)
+    assert ring.tail(5) == []
+    ring.append(_line(1))
+    assert ring.tail(0) == []
+
+
+def test_ring_capacity_one_and_clear() -> None:
+    ring = LogRing(1)
+    for seq in range(1, 4):
+        ring.append(_line(seq))
+    assert _seqs(ring) == [3]
+    ring.clear()
+    assert len(ring) == 0
+    ring.append(_line(4))
+    assert _seqs(ring) == [4]
+
+
+def test_ring_rejects_zero_capacity() -> None:
+    with pytest.raises(ValueError):
+        LogRing(0)
+
+
+def test_store_counts_dropped_lines(tmp_path: Path) -> None:
+    store = LogStore(capacity=3)
+    store.extend([(f"m{i}", "info") for i in range(5)])
+    assert len(store) == 3
+    assert store.total == 5
+    assert store.text().splitlines()[0].endswith("m2")
+
+
+def test_rotating_file_exports_whole_session(tmp_path: Path) -> None:
+    path = tmp_path / "logs" / "signit.log"
+    path.parent.mkdir()
+    path.write_text("alte Sitzung\n")
+
+    log_file = RotatingLogFile(str(path), max_bytes=40, backup_count=5)
+    store = LogStore(capacity=2, log_file=log_file)
+    messages = [f"Nachricht {i:02d}" for i in range(10)]
+    for message in messages:
+        store.append(message)
+
+    destination = tmp_path / "export.txt"
+    store.export(str(destination))
+    exported = destination.read_text(encoding="utf-8").splitlines()
+    # Alles aus dieser Sitzung, nichts aus der vorherigen
+    assert [line.split("] ", 1)[1] for line in exported] == messages
+    assert len(store) == 2
+
+    store.clear()
+    store.append("neu")
+    store.export(str(destination))
+    assert destination.read_text(encoding="utf-8").endswith("neu\n")
+    assert len(destination.read_text(encoding="utf-8").splitlines()) == 1
+    store.close()
+
+
+def test_export_without_log_file(tmp_path: Path) -> None:
+    store = LogStore(capacity=2)
+    store.extend([("a", ""), ("b", ""), ("c", "")])
+    destination = tmp_path / "export.txt"
+    store.export(str(destination))
+    assert [line[11:] for line in destination.read_text().splitlines()] == ["b", "c"]
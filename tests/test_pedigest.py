@@ -0,0 +1,106 @@
+"""Authenticode-Digest und seine Verwendung im SignIndex."""
+
+from pathlib import Path
+
+import pytest
+
+from core.authenticode import read_pe_layout, read_signature_info
+from core.pedigest import (
+    authenticode_digest,
+    digest_files,
+    digest_ranges,
+    signature_intact,
+)
+from core import pedigest
+from core.preflight import ISSUE_ALREADY_SIGNED, run_preflight
+from core.signindex import SignIndex
+from tests.conftest import SIGNED_DLL, SIGNED_DLL_THUMBPRINT
+
+
+def _flip_byte(path: Path, offset: int) -> None:
+    data = bytearray(path.read_bytes())
+    data[offset] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+
+def test_digest_matches_signed_digest() -> None:
+    info = read_signature_info(str(SIGNED_DLL))
+    assert info.digest_algorithm == "sha256"
+    assert authenticode_digest(str(SIGNED_DLL)) == info.signed_digest
+    assert signature_intact(info) is True
+
+
+def test_ranges_skip_checksum_security_entry_and_table() -> None:
+    with open(SIGNED_DLL, "rb") as f:
+        layout = read_pe_layout(f)
+    assert digest_ranges(layout) == [
+        (0, layout.checksum_offset),
+        (layout.checksum_offset + 4, layout.security_dir_offset),
+        (layout.security_dir_offset + 8, layout.cert_table_offset),
+    ]
+
+
+def test_unsigned_copy_has_same_digest(unsigned_dll: Path) -> None:
+    # Entspricht dem Digest, den signtool beim Signieren einträgt (inkl. Padding)
+    signed = read_signature_info(str(SIGNED_DLL)).signed_digest
+    assert authenticode_digest(str(unsigned_dll)) == signed
+
+
+def test_checksum_is_not_covered(signed_dll: Path) -> None:
+    with open(signed_dll, "rb") as f:
+        layout = read_pe_layout(f)
+    _flip_byte(signed_dll, layout.checksum_offset)
+    assert signature_intact(read_signature_info(str(signed_dll))) is True
+
+
+def test_modified_content_breaks_signature(signed_dll: Path) -> None:
+    with open(signed_dll, "rb") as f:
+        layout = read_pe_layout(f)
+    _flip_byte(signed_dll, layout.size_of_headers + 16)
+    assert signature_intact(read_signature_info(str(signed_dll))) is False
+
+
+def test_signature_intact_unknown_for_unsigned(unsigned_dll: Path) -> None:
+    assert signature_intact(read_signature_info(str(unsigned_dll))) is None
+
+
+def test_digest_files_reports_errors(tmp_path: Path) -> None:
+    text = tmp_path / "a.txt"
+    text.write_text("kein PE")
+    results = digest_files([str(SIGNED_DLL), str(text)], algorithm="sha1")
+    assert results[0].digest == authenticode_digest(str(SIGNED_DLL), "sha1")
+    assert len(results[0].digest) == 40
+    assert results[1].digest is None and results[1].error
+
+
+def test_preflight_reports_signed_file_without_hashing(
+    signed_dll: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _no_hashing(*args, **kwargs):
+        raise AssertionError("Vorabprüfung darf die Datei nicht hashen")
+
+    monkeypatch.setattr(pedigest, "authenticode_digest", _no_hashing)
+    report = run_preflight([str(signed_dll)], thumbprint=SIGNED_DLL_THUMBPRINT)
+    assert [i.code for i in report.issues] == [ISSUE_ALREADY_SIGNED]
+    assert report.issues[0].message == "Bereits mit diesem Zertifikat signiert"
+    assert run_preflight([str(signed_dll)]).issues == []
+
+
+def test_sign_index_accepts_valid_embedded_signature(
+    signed_dll: Path, tmp_path: Path
+) -> None:
+    index = SignIndex(str(tmp_path / "index.json"))
+    assert index.is_signed(str(signed_dll), SIGNED_DLL_THUMBPRINT.lower())
+    assert len(index) == 1
+    assert not index.is_signed(str(signed_dll), "0" * 40)
+
+
+def test_sign_index_rejects_modified_signed_file(
+    signed_dll: Path, tmp_path: Path
+) -> None:
+    with open(signed_dll, "rb") as f:
+        layout = read_pe_layout(f)
+    _flip_byte(signed_dll, layout.size_of_headers + 16)
+    index = SignIndex(str(tmp_path / "index.json"))
+    assert not index.is_signed(str(signed_dll), SIGNED_DLL_THUMBPRINT)
+    assert len(index) == 0
@@ -0,0 +1,87 @@
+"""PowerShell-Fallback mit einem Stub-Programm statt powershell.exe."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from core.powershell import (
+    PowerShellHost,
+    PowerShellRunner,
+    _parse_per_store,
+    query_certificates,
+    query_thumbprints,
+)
+
+STUB = Path(__file__).parent / "fake_powershell.py"
+LOCATIONS = ("CurrentUser", "LocalMachine")
+
+
+@pytest.fixture
+def powershell(tmp_path: Path) -> str:
+    """Ausführbarer Starter für tests/fake_powershell.py."""
+    if os.name == "nt":
+        launcher = tmp_path / "powershell.cmd"
+        launcher.write_text(f'@"{sys.executable}" "{STUB}" %*\r\n')
+    else:
+        launcher = tmp_path / "powershell"
+        launcher.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{STUB}" "$@"\n')
+        launcher.chmod(0o755)
+    return str(launcher)
+
+
+@pytest.mark.parametrize("runner_class", [PowerShellRunner, PowerShellHost])
+def test_query_certificates_with_umlauts(powershell: str, runner_class) -> None:
+    runner = runner_class(powershell, timeout=10)
+    try:
+        certs, errors = query_certificates(runner, LOCATIONS)
+    finally:
+        runner.close()
+    assert [c["Subject"] for c in certs["CurrentUser"]] == ["Müller Code Signing"]
+    assert errors == {"LocalMachine": "Zugriff verweigert"}
+
+
+def test_host_is_reused(powershell: str) -> None:
+    host = PowerShellHost(powershell, timeout=10)
+    try:
+        query_certificates(host, LOCATIONS)
+        process = host._process
+        thumbprints, _ = query_thumbprints(host, ["CurrentUser"])
+        assert host._process is process
+    finally:
+        host.close()
+    assert thumbprints == {"CurrentUser": ["8D607AAFD7DA3054248F3ABE891ADEAED6FBEBE3"]}
+
+
+def test_invalid_utf8_does_not_stall_host(
+    powershell: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FAKE_PS_MODE", "garbage")
+    host = PowerShellHost(powershell, timeout=10)
+    try:
+        with pytest.raises(OSError, match="ungültige Antwort"):
+            query_certificates(host, LOCATIONS)
+    finally:
+        host.close()
+
+
+def test_host_exit_is_reported(
+    powershell: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FAKE_PS_MODE", "exit")
+    host = PowerShellHost(powershell, timeout=10)
+    with pytest.raises(OSError, match="beendet"):
+        host.run("Get-Date")
+    assert host._process is None
+
+
+def test_missing_executable(tmp_path: Path) -> None:
+    with pytest.raises(OSError, match="nicht gefunden"):
+        PowerShellHost(str(tmp_path / "missing")).run("Get-Date")
+
+
+@pytest.mark.parametrize("output", ["[]", '"text"', "null", "{"])
+def test_parse_rejects_non_objects(output: str) -> None:
+    with pytest.raises(OSError):
+        _parse_per_store(output, LOCATIONS, "certificates")
@@ -0,0 +1,108 @@
+"""Fehlerklassifizierung und Wiederholungsstrategie."""
+
+import random
+from typing import List
+
+import pytest
+
+from benchmarks.fake_signtool import FILE_IN_USE_ERROR, TIMESTAMP_ERROR
+from core.retry import (
+    ERROR_ACCESS_DENIED,
+    ERROR_CERTIFICATE,
+    ERROR_FILE_FORMAT,
+    ERROR_FILE_IN_USE,
+    ERROR_NOT_FOUND,
+    ERROR_TIMESTAMP,
+    ERROR_UNKNOWN,
+    RetryPolicy,
+    classify_error,
+)
+from core.signer import SignResult, Signer
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (FILE_IN_USE_ERROR, ERROR_FILE_IN_USE),
+        (TIMESTAMP_ERROR, ERROR_TIMESTAMP),
+        ("SignTool Error: ... HTTP status: 503", ERROR_TIMESTAMP),
+        ("SignTool Error: WinHttpSendRequest failed 0x80072ee2", ERROR_TIMESTAMP),
+        ("SignTool Error: No certificates were found that met all the given "
+         "criteria.", ERROR_CERTIFICATE),
+        ("SignTool Error: This file format cannot be signed because it is not "
+         "recognized.", ERROR_FILE_FORMAT),
+        ("SignTool Error: File not found: C:\\x.exe", ERROR_NOT_FOUND),
+        ("SignTool Error: Access is denied.", ERROR_ACCESS_DENIED),
+        ("SignTool Error: something new", ERROR_UNKNOWN),
+    ],
+)
+def test_classify_error(error: str, expected: str) -> None:
+    assert classify_error(1, "", error) == expected
+
+
+def test_file_in_use_wins_over_timestamp() -> None:
+    # Gesperrte Datei beim Stempeln: die Datei ist das Problem, nicht der Server
+    error = f"{TIMESTAMP_ERROR}\n{FILE_IN_USE_ERROR}"
+    assert classify_error(1, "", error) == ERROR_FILE_IN_USE
+
+
+def test_should_retry_only_transient_classes() -> None:
+    policy = RetryPolicy()
+    assert policy.should_retry(ERROR_TIMESTAMP, 1)
+    assert policy.should_retry(ERROR_TIMESTAMP, 3)
+    assert not policy.should_retry(ERROR_TIMESTAMP, 4)
+    assert policy.should_retry(ERROR_FILE_IN_USE, 4)
+    assert not policy.should_retry(ERROR_CERTIFICATE, 1)
+    assert not policy.should_retry(ERROR_UNKNOWN, 1)
+
+
+def test_delay_is_exponential_and_capped() -> None:
+    policy = RetryPolicy(jitter=0.0, max_delay=5.0)
+    assert policy.delay(ERROR_TIMESTAMP, 1) == 2.0
+    assert policy.delay(ERROR_TIMESTAMP, 2) == 4.0
+    assert policy.delay(ERROR_TIMESTAMP, 3) == 5.0
+    assert policy.delay(ERROR_FILE_IN_USE, 1) == 0.5
+
+
+def test_delay_jitter_stays_in_range() -> None:
+    policy = RetryPolicy(jitter=0.5, rng=random.Random(7))
+    delays = [policy.delay(ERROR_TIMESTAMP, 1) for _ in range(200)]
+    assert all(1.0 <= d <= 3.0 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def _result(path: str, error_class: str = "") -> SignResult:
+    return SignResult(
+        file_path=path,
+        success=not error_class,
+        return_code=1 if error_class else 0,
+        output="",
+        error=error_class,
+        error_class=error_class,
+    )
+
+
+def test_with_retries_repeats_only_transient_files() -> None:
+    calls: List[List[str]] = []
+
+    def run(paths: List[str]) -> List[SignResult]:
+        calls.append(list(paths))
+        if len(calls) == 1:
+            return [
+                _result("a.exe"),
+                _result("b.exe", ERROR_FILE_IN_USE),
+                _result("c.exe", ERROR_CERTIFICATE),
+            ]
+        return [_result(p) for p in paths]
+
+    policy = RetryPolicy(base_delays={ERROR_FILE_IN_USE: 0.0}, jitter=0.0)
+    results = Signer("signtool")._with_retries(
+        ["a.exe", "b.exe", "c.exe"], run, policy
+    )
+
+    assert calls == [["a.exe", "b.exe", "c.exe"], ["b.exe"]]
+    assert [(r.file_path, r.success, r.attempts) for r in results] == [
+        ("a.exe", True, 1),
+        ("b.exe", True, 2),
+        ("c.exe", False, 1),
+    ]
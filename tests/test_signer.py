@@ -0,0 +1,46 @@
+"""Signer: Aufteilung in Batches."""
+
+import subprocess
+from typing import List
+
+from core.signer import Signer
+from core.timestamp import TimestampSelector
+
+THUMBPRINT = "0" * 40
+SHORT_URL = "http://ts.example"
+LONG_URL = "http://timestamp.example.com/" + "x" * 200
+
+
+def _longest_command(signer: Signer, batches: List[List[str]], url: str) -> int:
+    return max(
+        len(subprocess.list2cmdline(signer._sign_command(b, THUMBPRINT, url)))
+        for b in batches
+    )
+
+
+def test_batches_respect_batch_size() -> None:
+    signer = Signer("signtool", batch_size=3)
+    files = [f"C:\\build\\f{i}.exe" for i in range(7)]
+    batches = signer._make_batches(files, THUMBPRINT, SHORT_URL)
+    assert [len(b) for b in batches] == [3, 3, 1]
+    assert [fp for b in batches for fp in b] == files
+    assert Signer("signtool")._make_batches(files[:2], THUMBPRINT, "") == [
+        [files[0]],
+        [files[1]],
+    ]
+
+
+def test_batches_fit_command_line_with_longest_selector_url() -> None:
+    selector = TimestampSelector([SHORT_URL, LONG_URL])
+    signer = Signer(
+        "signtool",
+        batch_size=100,
+        max_command_line=1000,
+        timestamp_selector=selector,
+    )
+    files = [f"C:\\build\\output\\file{i:03}.exe" for i in range(60)]
+    batches = signer._make_batches(files, THUMBPRINT, SHORT_URL)
+    assert len(batches) > 1
+    assert [fp for b in batches for fp in b] == files
+    # Auch wenn der Selector den langen Server wählt
+    assert _longest_command(signer, batches, LONG_URL) <= 1000
@@ -0,0 +1,132 @@
+"""Signatur-Index: Wiedererkennung, Zeitstempel und Persistenz."""
+
+import json
+import os
+from pathlib import Path
+from typing import List
+
+from benchmarks.fake_tsa import FakeTSA
+from core.signer import SignResult, Signer
+from core.signindex import INDEX_VERSION, SignIndex
+from tests.conftest import make_files
+
+THUMBPRINT = "AB" * 20
+SPACED = " ".join(THUMBPRINT[i : i + 2] for i in range(0, 40, 2)).lower()
+
+
+def _index(tmp_path: Path) -> SignIndex:
+    return SignIndex(str(tmp_path / "index.json"))
+
+
+def test_unchanged_file_is_signed(tmp_path: Path) -> None:
+    (path,) = make_files(tmp_path, "a.exe")
+    index = _index(tmp_path)
+    assert not index.is_signed(path, THUMBPRINT)
+    index.record(path, THUMBPRINT)
+    assert index.is_signed(path, THUMBPRINT)
+    assert not index.is_signed(path, "CD" * 20)
+
+
+def test_thumbprint_with_spaces_matches(tmp_path: Path) -> None:
+    (path,) = make_files(tmp_path, "a.exe")
+    index = _index(tmp_path)
+    index.record(path, SPACED)
+    assert index.is_signed(path, THUMBPRINT)
+    index.record(path, THUMBPRINT)
+    assert index.is_signed(path, SPACED)
+
+
+def test_changes_are_detected(tmp_path: Path) -> None:
+    a, b = make_files(tmp_path, "a.exe", "b.exe")
+    index = _index(tmp_path)
+    index.record(a, THUMBPRINT)
+    index.record(b, THUMBPRINT)
+
+    with open(a, "ab") as f:  # andere Größe
+        f.write(b"\0")
+    assert not index.is_signed(a, THUMBPRINT)
+
+    with open(b, "r+b") as f:  # gleiche Größe, anderer Inhalt
+        f.write(b"XX")
+    st = os.stat(b)
+    os.utime(b, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert not index.is_signed(b, THUMBPRINT)
+
+
+def test_touched_file_is_hashed_and_accepted(tmp_path: Path) -> None:
+    (path,) = make_files(tmp_path, "a.exe")
+    index = _index(tmp_path)
+    index.record(path, THUMBPRINT)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert index.is_signed(path, THUMBPRINT)
+
+
+def test_unstamped_entry_requires_new_timestamp(tmp_path: Path) -> None:
+    (path,) = make_files(tmp_path, "a.exe")
+    index = _index(tmp_path)
+    index.record(path, THUMBPRINT, timestamped=False)
+    assert index.is_signed(path, THUMBPRINT)
+    assert not index.is_signed(path, THUMBPRINT, require_timestamp=True)
+    index.record(path, THUMBPRINT, timestamped=True)
+    assert index.is_signed(path, THUMBPRINT, require_timestamp=True)
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    a, b = make_files(tmp_path, "a.exe", "b.exe")
+    index = _index(tmp_path)
+    index.record(a, THUMBPRINT, timestamped=True)
+    index.record(b, THUMBPRINT)
+    index.forget(b)
+    index.save()
+
+    loaded = _index(tmp_path)
+    assert len(loaded) == 1
+    assert loaded.is_signed(a, THUMBPRINT, require_timestamp=True)
+    assert not loaded.is_signed(b, THUMBPRINT)
+
+
+def test_entries_without_timestamp_flag_load_as_unstamped(tmp_path: Path) -> None:
+    (path,) = make_files(tmp_path, "a.exe")
+    index = _index(tmp_path)
+    index.record(path, THUMBPRINT, timestamped=True)
+    index.save()
+    data = json.loads(index.path.read_text(encoding="utf-8"))
+    for entry in data["entries"].values():
+        del entry["timestamped"]
+    index.path.write_text(json.dumps(data), encoding="utf-8")
+
+    loaded = _index(tmp_path)
+    assert loaded.is_signed(path, THUMBPRINT)
+    assert not loaded.is_signed(path, THUMBPRINT, require_timestamp=True)
+
+
+def test_broken_index_is_discarded(tmp_path: Path) -> None:
+    path = tmp_path / "index.json"
+    for content in ("{kein json", json.dumps({"version": INDEX_VERSION + 1})):
+        path.write_text(content, encoding="utf-8")
+        assert len(SignIndex(str(path))) == 0
+
+
+def _sign(signer: Signer, files: List[str], url: str) -> List[SignResult]:
+    results: List[SignResult] = []
+    signer.sign_files(files, THUMBPRINT, url, on_complete=results.extend).join(30)
+    return results
+
+
+def test_unstamped_run_does_not_skip_later_timestamping(
+    tmp_path: Path, fake_signtool: str, fake_tsa: FakeTSA
+) -> None:
+    files = make_files(tmp_path / "in", "a.exe", "b.exe")
+    index = _index(tmp_path)
+    signer = Signer(fake_signtool, sign_index=index)
+
+    assert [r.skipped for r in _sign(signer, files, "")] == [False, False]
+    assert [r.skipped for r in _sign(signer, files, "")] == [True, True]
+
+    results = _sign(signer, files, fake_tsa.url)
+    assert [(r.success, r.skipped) for r in results] == [(True, False)] * 2
+    assert fake_tsa.requests == 2
+
+    assert [r.skipped for r in _sign(signer, files, fake_tsa.url)] == [True, True]
+    assert fake_tsa.requests == 2
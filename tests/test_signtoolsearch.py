@@ -0,0 +1,136 @@
+"""signtool-Suche auf einem nachgebauten Windows-SDK-Verzeichnisbaum."""
+
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from core import signtoolsearch
+from core.signtoolsearch import (
+    SignToolLocator,
+    parse_version,
+    preferred_architectures,
+    scan_signtools,
+)
+
+X64_FIRST = preferred_architectures("AMD64")
+
+
+def _touch(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"MZ")
+
+
+@pytest.fixture
+def kits(tmp_path: Path) -> List[str]:
+    """Zwei SDK-Generationen, ein altes 8.1-Kit und ClickOnce."""
+    bin10 = tmp_path / "Windows Kits" / "10" / "bin"
+    for arch in ("x86", "x64", "arm64"):
+        _touch(bin10 / "10.0.19041.0" / arch / "signtool.exe")
+    _touch(bin10 / "10.0.22621.0" / "x86" / "SignTool.EXE")
+    _touch(bin10 / "10.0.22621.0" / "x64" / "signtool.exe")
+    _touch(bin10 / "10.0.22621.0" / "x64" / "unrelated" / "signtool.exe")
+    (bin10 / "10.0.26100.0" / "x64").mkdir(parents=True)  # ohne signtool
+    _touch(bin10 / "x64" / "signtool.exe")  # Layout vor Versionsordnern
+
+    bin81 = tmp_path / "Windows Kits" / "8.1" / "bin"
+    _touch(bin81 / "x64" / "signtool.exe")
+
+    clickonce = tmp_path / "Microsoft SDKs" / "ClickOnce" / "SignTool"
+    _touch(clickonce / "signtool.exe")
+    return [str(bin10), str(bin81), str(clickonce), str(tmp_path / "missing")]
+
+
+def _relative(paths: List[str], base: Path) -> List[str]:
+    return [Path(p).relative_to(base).as_posix() for p in paths]
+
+
+def test_parse_version() -> None:
+    assert parse_version("10.0.22621.0") == (10, 0, 22621, 0)
+    assert parse_version("v10.0A") == (10, 0)
+    assert parse_version("x64") is None
+
+
+def test_preferred_architectures() -> None:
+    assert preferred_architectures("ARM64")[0] == "arm64"
+    assert preferred_architectures("i686")[0] == "x86"
+    assert X64_FIRST[0] == "x64"
+
+
+def test_ranks_newest_version_then_architecture(
+    kits: List[str], tmp_path: Path
+) -> None:
+    found = scan_signtools(kits, X64_FIRST)
+    assert _relative([c.path for c in found], tmp_path) == [
+        "Windows Kits/10/bin/10.0.22621.0/x64/signtool.exe",
+        "Windows Kits/10/bin/10.0.22621.0/x86/SignTool.EXE",
+        "Windows Kits/10/bin/10.0.19041.0/x64/signtool.exe",
+        "Windows Kits/10/bin/10.0.19041.0/x86/signtool.exe",
+        "Windows Kits/10/bin/10.0.19041.0/arm64/signtool.exe",
+        "Windows Kits/10/bin/x64/signtool.exe",
+        "Windows Kits/8.1/bin/x64/signtool.exe",
+        # Version unbekannt, keine Architektur: zuletzt
+        "Microsoft SDKs/ClickOnce/SignTool/signtool.exe",
+    ]
+
+
+def test_arm64_machine_prefers_arm64(kits: List[str]) -> None:
+    found = scan_signtools(kits[:1], preferred_architectures("arm64"))
+    assert found[0].version == (10, 0, 22621, 0)
+    assert found[0].arch == "x64"  # 22621 hat kein arm64: Version geht vor
+    assert found[2].arch == "arm64"
+
+
+@pytest.fixture
+def locator(kits: List[str], tmp_path: Path, monkeypatch) -> SignToolLocator:
+    monkeypatch.setattr(signtoolsearch, "find_signtool_in_path", lambda: None)
+    return SignToolLocator(
+        kits, cache_path=str(tmp_path / "cache.json"), architectures=X64_FIRST
+    )
+
+
+def test_cache_is_reused(locator: SignToolLocator, kits: List[str]) -> None:
+    first = locator.locate()
+    assert not locator.from_cache
+    again = SignToolLocator(
+        kits, cache_path=str(locator.cache_path), architectures=X64_FIRST
+    )
+    assert again.locate() == first
+    assert again.from_cache
+
+
+def test_new_sdk_invalidates_cache(
+    locator: SignToolLocator, kits: List[str]
+) -> None:
+    locator.scan()
+    newest = Path(kits[0]) / "10.0.26200.0" / "x64" / "signtool.exe"
+    _touch(newest)
+    assert locator.locate() == str(newest)
+    assert not locator.from_cache
+
+
+def test_filled_architecture_folder_invalidates_cache(
+    locator: SignToolLocator, kits: List[str]
+) -> None:
+    locator.scan()
+    # Der Ordner existierte schon leer; nur sein Inhalt ändert sich
+    newest = Path(kits[0]) / "10.0.26100.0" / "x64" / "signtool.exe"
+    _touch(newest)
+    assert locator.locate() == str(newest)
+    assert not locator.from_cache
+
+
+def test_removed_best_candidate_forces_rescan(locator: SignToolLocator) -> None:
+    best = locator.locate()
+    os.remove(best)
+    assert locator.locate() != best
+    assert not locator.from_cache
+
+
+def test_path_wins(locator: SignToolLocator, monkeypatch) -> None:
+    monkeypatch.setattr(
+        signtoolsearch, "find_signtool_in_path", lambda: "C:\\tools\\signtool.exe"
+    )
+    assert locator.locate() == "C:\\tools\\signtool.exe"
+    assert locator.candidates == []
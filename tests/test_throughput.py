@@ -0,0 +1,92 @@
+"""Durchsatz und Restzeit: gleitendes Fenster, Neustart der Uhr, Signer."""
+
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from core.signer import SignResult, Signer
+from core.throughput import ThroughputTracker, format_duration
+from tests.conftest import make_files
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rate_and_eta() -> None:
+    clock = FakeClock()
+    tracker = ThroughputTracker(total=100, window=30.0, clock=clock)
+    assert tracker.snapshot().files_per_minute is None
+    clock.now += 10
+    tracker.record(20)
+    snap = tracker.snapshot()
+    assert snap.files_per_minute == pytest.approx(120.0)
+    assert snap.eta == pytest.approx(40.0)
+    assert snap.remaining == 80
+
+
+def test_window_forgets_old_batches() -> None:
+    clock = FakeClock()
+    tracker = ThroughputTracker(total=100, window=30.0, clock=clock)
+    clock.now += 5
+    tracker.record(50)
+    clock.now += 55  # erster Batch liegt außerhalb des Fensters
+    tracker.record(3)
+    assert tracker.snapshot().files_per_minute == pytest.approx(6.0)
+
+
+def test_start_excludes_preparation() -> None:
+    clock = FakeClock()
+    tracker = ThroughputTracker(total=10, clock=clock)
+    clock.now += 20  # z. B. Hashen beim Überspringen
+    tracker.start()
+    clock.now += 2
+    tracker.record(4)
+    snap = tracker.snapshot()
+    assert snap.elapsed == pytest.approx(2.0)
+    assert snap.files_per_minute == pytest.approx(120.0)
+
+
+@pytest.mark.parametrize(
+    "seconds, text",
+    [(None, "–"), (0, "0:00"), (59.6, "1:00"), (754, "12:34"), (3725, "1:02:05")],
+)
+def test_format_duration(seconds, text: str) -> None:
+    assert format_duration(seconds) == text
+
+
+class _SlowIndex:
+    """SignIndex-Ersatz mit langsamer Vorprüfung, kennt keine Datei."""
+
+    def is_signed(self, *args, **kwargs) -> bool:
+        time.sleep(0.3)
+        return False
+
+    def record(self, *args, **kwargs) -> None:
+        pass
+
+    def save(self) -> None:
+        pass
+
+
+def test_signer_clock_starts_after_skip_check(
+    tmp_path: Path, fake_signtool: str
+) -> None:
+    files = make_files(tmp_path, "a.exe", "b.exe")
+    signer = Signer(fake_signtool, sign_index=_SlowIndex())
+    results: List[SignResult] = []
+    start = time.monotonic()
+    signer.sign_files(files, "0" * 40, "", on_complete=results.extend).join(30)
+    wall = time.monotonic() - start
+
+    assert all(r.success for r in results)
+    snap = signer.throughput.snapshot()
+    assert snap.done == 2
+    # Die Vorprüfung (2 × 0,3 s, nacheinander bei max_workers=1) zählt nicht
+    assert snap.elapsed <= wall - 0.5
@@ -0,0 +1,190 @@
+"""Circuit Breaker und Rückmeldung der Timestamp-Server-Auswahl."""
+
+from typing import List
+
+import pytest
+
+from core.cancel import CancelToken
+from core.retry import ERROR_CERTIFICATE, ERROR_TIMESTAMP
+from core.signer import SignResult, Signer
+from core.timestamp import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    TimestampSelector,
+)
+
+FAST = "http://fast.example/"
+SLOW = "http://slow.example/"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _state(selector: TimestampSelector, url: str) -> str:
+    return next(e["state"] for e in selector.snapshot() if e["url"] == url)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def selector(clock: FakeClock) -> TimestampSelector:
+    return TimestampSelector(
+        [FAST, SLOW], failure_threshold=2, cooldown=60.0, clock=clock
+    )
+
+
+def _open(selector: TimestampSelector, url: str) -> None:
+    for _ in range(2):
+        selector.record(url, 0.1, success=False)
+
+
+def test_prefers_lowest_latency(selector: TimestampSelector) -> None:
+    selector.record(FAST, 0.1, success=True)
+    selector.record(SLOW, 0.9, success=True)
+    assert selector.choose() == FAST
+
+
+def test_opens_after_threshold_and_skips_server(selector: TimestampSelector) -> None:
+    selector.record(FAST, 0.1, success=False)
+    assert _state(selector, FAST) == STATE_CLOSED
+    selector.record(FAST, 0.1, success=False)
+    assert _state(selector, FAST) == STATE_OPEN
+    assert selector.choose() == SLOW
+
+
+def test_half_open_probe_after_cooldown(
+    selector: TimestampSelector, clock: FakeClock
+) -> None:
+    _open(selector, FAST)
+    clock.now += 59.0
+    assert selector.choose() == SLOW
+
+    clock.now += 1.0
+    assert selector.choose() == FAST
+    assert _state(selector, FAST) == STATE_HALF_OPEN
+    # Nur eine Test-Anfrage gleichzeitig
+    assert selector.choose() == SLOW
+
+    selector.record(FAST, 0.1, success=True)
+    assert _state(selector, FAST) == STATE_CLOSED
+
+
+def test_failed_probe_doubles_cooldown(
+    selector: TimestampSelector, clock: FakeClock
+) -> None:
+    _open(selector, FAST)
+    clock.now += 60.0
+    assert selector.choose() == FAST
+    selector.record(FAST, 0.1, success=False)
+    assert _state(selector, FAST) == STATE_OPEN
+
+    clock.now += 119.0
+    assert selector.choose() == SLOW
+    clock.now += 1.0
+    assert selector.choose() == FAST
+
+
+def test_released_probe_is_retried(
+    selector: TimestampSelector, clock: FakeClock
+) -> None:
+    _open(selector, FAST)
+    clock.now += 60.0
+    assert selector.choose() == FAST
+    selector.release(FAST)
+
+    assert _state(selector, FAST) == STATE_OPEN
+    # opened_at bleibt erhalten: sofort wieder Testkandidat
+    assert selector.choose() == FAST
+
+
+def test_release_keeps_closed_server(selector: TimestampSelector) -> None:
+    selector.release(FAST)
+    assert _state(selector, FAST) == STATE_CLOSED
+
+
+def test_all_open_picks_earliest_reopening(
+    selector: TimestampSelector, clock: FakeClock
+) -> None:
+    _open(selector, FAST)
+    clock.now += 10.0
+    _open(selector, SLOW)
+    assert selector.choose() == FAST
+
+
+def _signer_returning(
+    selector: TimestampSelector, results: List[SignResult]
+) -> Signer:
+    signer = Signer("signtool", timestamp_selector=selector)
+    signer._execute = lambda paths, cmd, *args, **kwargs: results
+    return signer
+
+
+def _result(success: bool, error_class: str = "") -> SignResult:
+    return SignResult(
+        file_path="a.exe",
+        success=success,
+        return_code=0 if success else 1,
+        output="",
+        error="",
+        error_class=error_class,
+    )
+
+
+def _probe(selector: TimestampSelector, clock: FakeClock) -> None:
+    """Bringt FAST in den Zustand, in dem choose() die Test-Anfrage vergibt."""
+    _open(selector, FAST)
+    clock.now += 60.0
+
+
+@pytest.mark.parametrize(
+    "result, expected, retried",
+    [
+        (_result(True), STATE_CLOSED, False),
+        # Test-Anfrage fehlgeschlagen: neue, verdoppelte Sperre
+        (_result(False, ERROR_TIMESTAMP), STATE_OPEN, False),
+        # Ohne Zeitstempel keine Aussage: sofort erneut testen
+        (_result(False, ERROR_CERTIFICATE), STATE_OPEN, True),
+    ],
+)
+def test_signer_reports_only_timestamp_outcomes(
+    selector: TimestampSelector,
+    clock: FakeClock,
+    result: SignResult,
+    expected: str,
+    retried: bool,
+) -> None:
+    _probe(selector, clock)
+    signer = _signer_returning(selector, [result])
+    signer._execute_timestamped(["a.exe"], lambda url: ["sign"], FAST)
+    assert _state(selector, FAST) == expected
+    if expected == STATE_OPEN:
+        assert (selector.choose() == FAST) is retried
+
+
+def test_signer_certificate_error_is_not_a_sample(
+    selector: TimestampSelector,
+) -> None:
+    signer = _signer_returning(selector, [_result(False, ERROR_CERTIFICATE)])
+    signer._execute_timestamped(["a.exe"], lambda url: ["sign"], FAST)
+    assert all(entry["samples"] == 0 for entry in selector.snapshot())
+
+
+def test_signer_releases_probe_on_cancel(
+    selector: TimestampSelector, clock: FakeClock
+) -> None:
+    _probe(selector, clock)
+    cancel = CancelToken()
+    cancel.cancel()
+    signer = _signer_returning(selector, [_result(False)])
+    signer._execute_timestamped(["a.exe"], lambda url: ["sign"], FAST, cancel=cancel)
+    assert _state(selector, FAST) == STATE_OPEN
+    assert selector.choose() == FAST